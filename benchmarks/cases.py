@@ -0,0 +1,179 @@
+import os
+from shims import HeadlessConsole, HeadlessSettings
+from synthetic_data import SyntheticTableGenerator, SEARCH_NEEDLE
+from table_builder.builder import TableBuilder
+from database.database import Database
+
+
+BENCHMARK_TABLE = "bench"
+
+
+class BenchmarkContext:
+
+    def __init__(self, workspace: str, generator: SyntheticTableGenerator):
+        """
+        Shared state for every case run at one table size.
+
+        :param workspace: Directory used as the working directory while the cases run.
+        :param generator: Generator for the synthetic table and its source files.
+        """
+        self.workspace = workspace
+        self.generator = generator
+        self.console = HeadlessConsole()
+        self.settings = HeadlessSettings(self.console)
+        self.database = Database(self.console, self.settings)
+        self._table_data = None
+        self._source_files = {}
+        self._table_saved = False
+
+    def table_data(self) -> dict:
+        if self._table_data is None:
+            self._table_data = self.generator.table_data()
+        return self._table_data
+
+    def source_file(self, extension: str) -> str:
+        """
+        Returns:
+            str: Path to a generated input file of the given type, written on first use.
+        """
+        if extension not in self._source_files:
+            path = os.path.join(self.workspace, f"source.{extension}")
+            getattr(self.generator, f"write_{extension}")(path)
+            self._source_files[extension] = path
+        return self._source_files[extension]
+
+    def new_builder(self) -> TableBuilder:
+        builder = TableBuilder(self.console, self.settings, self.database, name_on_start=True)
+        builder.name = BENCHMARK_TABLE
+        return builder
+
+    def builder_with_table(self) -> TableBuilder:
+        builder = self.new_builder()
+        builder.table_data = self.table_data()
+        return builder
+
+    def connect_database(self) -> None:
+        if not self.database.is_connected():
+            self.database.create_database(f"{BENCHMARK_TABLE}.db")
+
+    def drop_table(self) -> None:
+        self.connect_database()
+        self.database.cursor.execute(f'DROP TABLE IF EXISTS "{BENCHMARK_TABLE}"')
+        self.database.connection.commit()
+        self._table_saved = False
+
+    def ensure_saved_table(self) -> None:
+        """
+        Save the synthetic table to the benchmark database once so read paths have data.
+        """
+        if self._table_saved:
+            return
+        self.drop_table()
+        self.builder_with_table().database_handler.save_to_database()
+        self._table_saved = True
+
+    def close(self) -> None:
+        self.database.close()
+
+
+# Each case prepares its inputs (untimed) and returns the callable that is timed.
+
+def load_csv(context: BenchmarkContext):
+    path, builder = context.source_file("csv"), context.new_builder()
+    return lambda: builder.csv_handler.load_csv(path=path)
+
+
+def load_xlsx(context: BenchmarkContext):
+    path, builder = context.source_file("xlsx"), context.new_builder()
+    return lambda: builder.excel_handler.load_excel(path=path)
+
+
+def load_ods(context: BenchmarkContext):
+    path, builder = context.source_file("ods"), context.new_builder()
+    return lambda: builder.ods_handler.load_ods(path=path)
+
+
+def load_pdf(context: BenchmarkContext):
+    path, builder = context.source_file("pdf"), context.new_builder()
+    return lambda: builder.pdf_handler.load_pdf(path=path)
+
+
+def _scripted_save(context: BenchmarkContext, save):
+    def run():
+        context.console.script("y")
+        save()
+    return run
+
+
+def save_csv(context: BenchmarkContext):
+    return _scripted_save(context, context.builder_with_table().csv_handler.save_csv)
+
+
+def save_xlsx(context: BenchmarkContext):
+    return _scripted_save(context, context.builder_with_table().excel_handler.save_excel)
+
+
+def save_ods(context: BenchmarkContext):
+    return _scripted_save(context, context.builder_with_table().ods_handler.save_ods)
+
+
+def save_pdf(context: BenchmarkContext):
+    return _scripted_save(context, context.builder_with_table().pdf_handler.save_pdf)
+
+
+def save_json(context: BenchmarkContext):
+    return _scripted_save(context, context.builder_with_table().json_handler.save_json)
+
+
+def render(context: BenchmarkContext):
+    return context.builder_with_table().table_display.print_table
+
+
+def search(context: BenchmarkContext):
+    context.ensure_saved_table()
+
+    def run():
+        context.console.script(SEARCH_NEEDLE, "0")
+        context.database.search()
+    return run
+
+
+def db_save(context: BenchmarkContext):
+    context.drop_table()
+    return context.builder_with_table().database_handler.save_to_database
+
+
+def db_load(context: BenchmarkContext):
+    context.ensure_saved_table()
+    builder = context.new_builder()
+
+    def run():
+        context.console.script("1")
+        builder.database_handler.load_from_database()
+    return run
+
+
+CASES = {
+    "load_csv": load_csv,
+    "load_xlsx": load_xlsx,
+    "load_ods": load_ods,
+    "load_pdf": load_pdf,
+    "save_csv": save_csv,
+    "save_xlsx": save_xlsx,
+    "save_ods": save_ods,
+    "save_pdf": save_pdf,
+    "save_json": save_json,
+    "render": render,
+    "search": search,
+    "db_save": db_save,
+    "db_load": db_load,
+}
+
+# Largest row count each case runs at unless caps are disabled; these paths take minutes beyond it.
+DEFAULT_ROW_CAPS = {
+    "load_pdf": 10_000,
+    "save_pdf": 10_000,
+    "load_ods": 100_000,
+    "save_ods": 100_000,
+    "render": 100_000,
+}
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+import click
+from rich.console import Console
+from rich.table import Table
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from cases import BenchmarkContext, CASES, DEFAULT_ROW_CAPS  # noqa: E402
+from synthetic_data import SyntheticTableGenerator  # noqa: E402
+
+console = Console()
+
+
+def measure(case, context: BenchmarkContext, repeat: int, track_memory: bool) -> dict:
+    """
+    Time a case and, optionally, record its peak traced memory.
+
+    Args:
+        case: Case function returning the callable to time.
+        context (BenchmarkContext): State shared by the cases at this size.
+        repeat (int): Number of timed runs. The fastest run is reported.
+        track_memory (bool): Run once more under tracemalloc to record peak allocation.
+
+    Returns:
+        dict: Timing, memory and status for the case.
+    """
+    timings = []
+    for _ in range(repeat):
+        run = case(context)
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+        if context.console.errors:
+            return {"status": "error", "error": context.console.errors[-1], "seconds": min(timings), "runs": timings}
+
+    result = {"status": "ok", "seconds": min(timings), "runs": timings, "peak_memory_bytes": None}
+
+    if track_memory:
+        run = case(context)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            run()
+            result["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return result
+
+
+def run_size(rows: int, case_names: list, generator_options: dict, repeat: int, track_memory: bool, caps: dict) -> list:
+    results = []
+    original_directory = os.getcwd()
+
+    with tempfile.TemporaryDirectory(prefix="ttb-bench-") as workspace:
+        os.chdir(workspace)
+        context = BenchmarkContext(workspace, SyntheticTableGenerator(rows, **generator_options))
+        try:
+            for name in case_names:
+                entry = {"case": name, "rows": rows}
+                if rows > caps.get(name, rows):
+                    entry.update({"status": "skipped", "error": f"over the {caps[name]:,} row cap"})
+                else:
+                    console.print(f"[bold yellow]Running[/] [bold cyan]{name}[/] at [bold red]{rows:,}[/] rows...")
+                    try:
+                        entry.update(measure(CASES[name], context, repeat, track_memory))
+                    except Exception as e:
+                        entry.update({"status": "error", "error": str(e)})
+                results.append(entry)
+        finally:
+            context.close()
+            os.chdir(original_directory)
+
+    return results
+
+
+def print_results(results: list) -> None:
+    table = Table(title="[bold red]Benchmark Results[/]", border_style="yellow", show_lines=True)
+    table.add_column("Case", style="cyan")
+    table.add_column("Rows", justify="right")
+    table.add_column("Seconds", justify="right")
+    table.add_column("Peak MiB", justify="right")
+    table.add_column("Status", style="magenta")
+
+    for entry in results:
+        seconds = f"{entry['seconds']:.3f}" if entry.get("seconds") is not None else "-"
+        peak = f"{entry['peak_memory_bytes'] / 2**20:.1f}" if entry.get("peak_memory_bytes") is not None else "-"
+        status = entry["status"] if entry["status"] == "ok" else f"{entry['status']}: {entry.get('error', '')}"
+        table.add_row(entry["case"], f"{entry['rows']:,}", seconds, peak, status)
+
+    console.print(table)
+
+
+@click.group()
+def cli():
+    """Terminal Table Builder benchmark suite."""
+
+
+@cli.command()
+@click.option("--sizes", default="10000,100000,1000000", show_default=True, help="Comma separated row counts.")
+@click.option("--cases", "case_list", default=",".join(CASES), show_default=True, help="Comma separated case names.")
+@click.option("--type-mix", default="int:2,float:2,str:3,bool:1", show_default=True, help="Column types and counts.")
+@click.option("--string-length", default="4-16", show_default=True, help="Inclusive min-max length of generated strings.")
+@click.option("--distinct-strings", type=int, default=None, help="Draw strings from a pool of this many values.")
+@click.option("--seed", type=int, default=1234, show_default=True)
+@click.option("--repeat", type=int, default=1, show_default=True, help="Timed runs per case; the fastest is kept.")
+@click.option("--memory/--no-memory", default=True, show_default=True, help="Record peak memory with tracemalloc.")
+@click.option("--no-caps", is_flag=True, help="Run every case at every size, ignoring the default row caps.")
+@click.option("--output", "-o", type=click.Path(dir_okay=False), default="bench_output.json", show_default=True)
+def run(sizes, case_list, type_mix, string_length, distinct_strings, seed, repeat, memory, no_caps, output):
+    """Run the benchmark cases and write the results to JSON."""
+    case_names = [name.strip() for name in case_list.split(",") if name.strip()]
+    unknown = [name for name in case_names if name not in CASES]
+    if unknown:
+        raise click.BadParameter(f"Unknown cases: {', '.join(unknown)}", param_hint="--cases")
+
+    min_length, _, max_length = string_length.partition("-")
+    generator_options = {
+        "type_mix": SyntheticTableGenerator.parse_type_mix(type_mix),
+        "string_length": (int(min_length), int(max_length or min_length)),
+        "distinct_strings": distinct_strings,
+        "seed": seed,
+    }
+    caps = {} if no_caps else DEFAULT_ROW_CAPS
+    output = os.path.abspath(output)
+
+    results = []
+    for rows in (int(size) for size in sizes.split(",")):
+        results.extend(run_size(rows, case_names, generator_options, repeat, memory, caps))
+
+    report = {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "type_mix": type_mix,
+            "string_length": string_length,
+            "distinct_strings": distinct_strings,
+            "seed": seed,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+    with open(output, "w") as f:
+        json.dump(report, f, indent=4)
+
+    print_results(results)
+    console.print(f"[bold green]Results written to[/] [bold cyan]{output}[/]")
+
+
+@cli.command()
+@click.argument("baseline", type=click.Path(exists=True, dir_okay=False))
+@click.argument("current", type=click.Path(exists=True, dir_okay=False))
+@click.option("--threshold", type=float, default=0.10, show_default=True, help="Allowed slowdown as a fraction.")
+@click.option("--memory-threshold", type=float, default=0.10, show_default=True, help="Allowed peak memory growth as a fraction.")
+@click.option("--min-seconds", type=float, default=0.01, show_default=True, help="Ignore slowdowns smaller than this many seconds.")
+def compare(baseline, current, threshold, memory_threshold, min_seconds):
+    """Compare CURRENT results against a stored BASELINE and flag regressions."""
+    with open(baseline) as f:
+        baseline_results = {(entry["case"], entry["rows"]): entry for entry in json.load(f)["results"]}
+    with open(current) as f:
+        current_results = json.load(f)["results"]
+
+    table = Table(title="[bold red]Benchmark Comparison[/]", border_style="yellow", show_lines=True)
+    table.add_column("Case", style="cyan")
+    table.add_column("Rows", justify="right")
+    table.add_column("Time", justify="right")
+    table.add_column("Peak Memory", justify="right")
+    table.add_column("Verdict")
+
+    regressions = 0
+    for entry in current_results:
+        previous = baseline_results.get((entry["case"], entry["rows"]))
+        if not previous or previous["status"] != "ok" or entry["status"] != "ok":
+            verdict = "[yellow]not comparable[/]" if previous else "[yellow]new[/]"
+            table.add_row(entry["case"], f"{entry['rows']:,}", "-", "-", verdict)
+            continue
+
+        time_change = entry["seconds"] / previous["seconds"] - 1 if previous["seconds"] else 0.0
+        memory_change = None
+        if entry.get("peak_memory_bytes") and previous.get("peak_memory_bytes"):
+            memory_change = entry["peak_memory_bytes"] / previous["peak_memory_bytes"] - 1
+
+        slower = time_change > threshold and entry["seconds"] - previous["seconds"] > min_seconds
+        regressed = slower or (memory_change is not None and memory_change > memory_threshold)
+        regressions += regressed
+        table.add_row(
+            entry["case"],
+            f"{entry['rows']:,}",
+            f"{previous['seconds']:.3f}s -> {entry['seconds']:.3f}s ({time_change:+.1%})",
+            f"{memory_change:+.1%}" if memory_change is not None else "-",
+            "[bold red]REGRESSION[/]" if regressed else "[bold green]ok[/]",
+        )
+
+    console.print(table)
+    if regressions:
+        console.print(f"[bold red]{regressions} regression(s) over the threshold.[/]")
+        sys.exit(1)
+    console.print("[bold green]No regressions.[/]")
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,66 @@
+import os
+from collections import deque
+from rich.console import Console
+from rich.panel import Panel
+
+
+class HeadlessConsole(Console):
+
+    def __init__(self, answers: list = None):
+        """
+        A Rich console that renders to the null device and answers prompts from a script.
+
+        :param answers: Replies returned, in order, by `input`.
+        """
+        self._null_file = open(os.devnull, "w", encoding="utf-8")
+        super().__init__(file=self._null_file, width=160, force_terminal=False, color_system=None)
+        self.answers = deque(answers or [])
+        self.errors = []
+
+    def script(self, *answers: str) -> None:
+        """
+        Replace the pending prompt replies.
+        """
+        self.answers = deque(answers)
+        self.errors = []
+
+    def input(self, prompt="", **kwargs) -> str:
+        if not self.answers:
+            raise RuntimeError(f"Unscripted prompt: {prompt}")
+        return self.answers.popleft()
+
+    def print(self, *objects, **kwargs) -> None:
+        for renderable in objects:
+            if isinstance(renderable, Panel) and "Error" in str(renderable.title):
+                self.errors.append(str(renderable.renderable))
+        super().print(*objects, **kwargs)
+
+
+class HeadlessSettings:
+
+    def __init__(self, console: Console, **overrides):
+        """
+        In-memory stand-in for `Settings` so benchmarks never touch `settings.json`.
+
+        :param console: Console used for messages raised through the settings object.
+        :param overrides: Setting values to force, e.g. `infer_data_types=False`.
+        """
+        from message_panel.system_message import SystemMessage
+
+        self.console = console
+        self.system_message = SystemMessage(console)
+        self.settings = {
+            "autoprint_table": False,
+            "hide_instructions": True,
+            "auto_update": False,
+            "infer_data_types": True,
+            "import_cache": False,
+            "auto_maintenance": False,
+        }
+        self.settings.update(overrides)
+
+    def get_setting(self, setting: str) -> str:
+        return "on" if self.settings.get(setting, False) else "off"
+
+    def get_auto_update(self) -> str:
+        return self.get_setting("auto_update")
@@ -0,0 +1,136 @@
+import csv
+import random
+import string
+from openpyxl import Workbook
+from pyexcel_ods3 import save_data
+from reportlab.lib.pagesizes import letter
+from reportlab.lib import colors
+from reportlab.platypus import SimpleDocTemplate, Table as PDFTable, TableStyle
+
+
+# Value planted in the first string column of the middle row so searches have a known single hit.
+SEARCH_NEEDLE = "needle-7f3a9c"
+
+
+class SyntheticTableGenerator:
+
+    def __init__(self, rows: int, type_mix: dict = None, string_length: tuple = (4, 16),
+                 distinct_strings: int = None, seed: int = 1234):
+        """
+        Build deterministic tables in the Table Builder's `table_data` format.
+
+        :param rows: Number of data rows to generate.
+        :param type_mix: Mapping of column type ("int", "float", "str", "bool") to the number of columns of that type.
+        :param string_length: Inclusive (min, max) length for generated strings.
+        :param distinct_strings: Draw string cells from a pool of this many values. None for unique random strings.
+        :param seed: Seed for the random generator so runs are reproducible.
+        """
+        self.rows = rows
+        self.type_mix = type_mix or {"int": 2, "float": 2, "str": 3, "bool": 1}
+        self.string_length = string_length
+        self.distinct_strings = distinct_strings
+        self.seed = seed
+
+    @staticmethod
+    def parse_type_mix(spec: str) -> dict:
+        """
+        Parse a type mix such as "int:2,float:2,str:3,bool:1".
+
+        Args:
+            spec (str): Comma separated `type:count` pairs.
+
+        Returns:
+            dict: Column type mapped to the number of columns.
+        """
+        type_mix = {}
+        for part in spec.split(","):
+            column_type, _, count = part.strip().partition(":")
+            if column_type not in ("int", "float", "str", "bool"):
+                raise ValueError(f"Unsupported column type: {column_type}")
+            type_mix[column_type] = int(count or 1)
+        return type_mix
+
+    def columns(self) -> list:
+        """
+        Returns:
+            list: Column definitions, named after their type and position.
+        """
+        columns = []
+        for column_type, count in self.type_mix.items():
+            for idx in range(1, count + 1):
+                columns.append({"name": f"{column_type}_{idx}", "type": column_type})
+        return columns
+
+    def _random_string(self, rng: random.Random) -> str:
+        length = rng.randint(*self.string_length)
+        return "".join(rng.choices(string.ascii_letters, k=length))
+
+    def iter_rows(self):
+        """
+        Yield generated rows as lists of typed values in column order.
+        """
+        rng = random.Random(self.seed)
+        columns = self.columns()
+        pool = None
+        if self.distinct_strings:
+            pool = [self._random_string(rng) for _ in range(self.distinct_strings)]
+
+        generators = []
+        for column in columns:
+            if column["type"] == "int":
+                generators.append(lambda: rng.randint(-1_000_000, 1_000_000))
+            elif column["type"] == "float":
+                generators.append(lambda: round(rng.uniform(-1_000_000, 1_000_000), 4))
+            elif column["type"] == "bool":
+                generators.append(lambda: rng.random() < 0.5)
+            elif pool:
+                generators.append(lambda: rng.choice(pool))
+            else:
+                generators.append(lambda: self._random_string(rng))
+
+        needle_row = self.rows // 2
+        needle_column = next((idx for idx, column in enumerate(columns) if column["type"] == "str"), None)
+
+        for row_idx in range(self.rows):
+            row = [generate() for generate in generators]
+            if row_idx == needle_row and needle_column is not None:
+                row[needle_column] = SEARCH_NEEDLE
+            yield row
+
+    def table_data(self) -> dict:
+        """
+        Returns:
+            dict: The generated table in the `{"columns": [...], "rows": [...]}` format used by the Table Builder.
+        """
+        columns = self.columns()
+        names = [column["name"] for column in columns]
+        return {"columns": columns, "rows": [dict(zip(names, row)) for row in self.iter_rows()]}
+
+    def header(self) -> list:
+        return [column["name"] for column in self.columns()]
+
+    def write_csv(self, path: str) -> None:
+        with open(path, "w", newline="", encoding="utf-8") as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(self.header())
+            writer.writerows(self.iter_rows())
+
+    def write_xlsx(self, path: str) -> None:
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Sheet1")
+        ws.append(self.header())
+        for row in self.iter_rows():
+            ws.append(row)
+        wb.save(path)
+
+    def write_ods(self, path: str) -> None:
+        data = [self.header()]
+        data.extend(self.iter_rows())
+        save_data(path, {"Sheet1": data})
+
+    def write_pdf(self, path: str) -> None:
+        data = [self.header()]
+        data.extend([str(value) for value in row] for row in self.iter_rows())
+        table = PDFTable(data)
+        table.setStyle(TableStyle([("GRID", (0, 0), (-1, -1), 1, colors.black)]))
+        SimpleDocTemplate(path, pagesize=letter).build([table])
@@ -0,0 +1,138 @@
+import csv
+import itertools
+import sqlite3
+from table_builder.table_utils import InputHandler
+from table_builder.io import compression
+
+# Rows handed to each executemany call.
+IMPORT_BATCH_SIZE = 10_000
+
+# Leading rows read to infer column types before the table is created.
+TYPE_SAMPLE_ROWS = 1_000
+
+SQL_TYPES = {"str": "TEXT", "int": "INTEGER", "float": "REAL", "bool": "BOOLEAN"}
+
+
+class CSVImporter:
+
+    def __init__(self, connection: sqlite3.Connection, infer_types: bool = True, batch_size: int = IMPORT_BATCH_SIZE, sample_rows: int = TYPE_SAMPLE_ROWS):
+        """
+        Streams CSV files straight into SQLite tables without building the table in memory.
+
+        Rows go from `csv.reader` to `executemany` in fixed-size batches inside one transaction,
+        so memory use does not grow with the file. Column types are inferred from a leading
+        sample of rows; SQLite's column affinity then converts the text of every later row.
+
+        :param connection: Connection to the database the tables are created in.
+        :param infer_types: Infer column types from the sample. When off, every column is TEXT.
+        :param batch_size: Rows inserted per executemany call.
+        :param sample_rows: Rows read to infer the column types.
+        """
+        self.connection = connection
+        self.infer_types = infer_types
+        self.batch_size = batch_size
+        self.sample_rows = sample_rows
+
+    def import_csv(self, csv_path: str, table_name: str, replace: bool = False, progress=None) -> int:
+        """
+        Import a CSV file into a new table. The first row holds the column names. Compressed
+        files are decompressed as they are read.
+
+        Args:
+            csv_path (str): Path to the CSV file.
+            table_name (str): Name of the table to create.
+            replace (bool): Drop an existing table with the same name first.
+            progress (callable): Called with the number of rows imported so far after each batch.
+
+        Returns:
+            int: The number of rows imported.
+
+        Raises:
+            ValueError: If the file is empty or the table already exists and replace is off.
+        """
+        with compression.open_text(csv_path, "r", newline="") as csv_file:
+            return self.import_rows(csv.reader(csv_file), table_name, replace, progress)
+
+    def import_rows(self, reader, table_name: str, replace: bool = False, progress=None) -> int:
+        """
+        Import rows from an iterator of cell lists whose first item is the header.
+
+        Returns:
+            int: The number of rows imported.
+        """
+        header = next(reader, None)
+        if not header:
+            raise ValueError("CSV file is empty.")
+
+        sample = list(itertools.islice(reader, self.sample_rows))
+        types = self.sample_types(header, sample)
+        rows = self._prepare_rows(itertools.chain(sample, reader), len(header), types)
+
+        quoted_table_name = f'"{table_name}"'
+        columns_definition = ", ".join(f'"{name}" {SQL_TYPES[data_type]}' for name, data_type in zip(header, types))
+        # Empty cells become NULL in SQLite rather than in a per-cell Python loop
+        placeholders = ", ".join("NULLIF(?, '')" for _ in header)
+        insert = f"INSERT INTO {quoted_table_name} VALUES ({placeholders})"
+
+        cursor = self.connection.cursor()
+        imported = 0
+        try:
+            cursor.execute("BEGIN")
+            if replace:
+                cursor.execute(f"DROP TABLE IF EXISTS {quoted_table_name}")
+            elif cursor.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (table_name,)).fetchone():
+                raise ValueError(f"Table '{table_name}' already exists.")
+            cursor.execute(f"CREATE TABLE {quoted_table_name} ({columns_definition})")
+
+            while True:
+                batch = list(itertools.islice(rows, self.batch_size))
+                if not batch:
+                    break
+                cursor.executemany(insert, batch)
+                imported += len(batch)
+                if progress:
+                    progress(imported)
+
+            self.connection.commit()
+        except BaseException:
+            self.connection.rollback()
+            raise
+        finally:
+            cursor.close()
+        return imported
+
+    def sample_types(self, header: list, sample: list) -> list:
+        """
+        Infer a type per column from the non-empty cells of the sample. Columns mixing integers
+        and decimals are "float"; any other mix is "str".
+
+        Returns:
+            list: The type of each column.
+        """
+        if not self.infer_types:
+            return ["str"] * len(header)
+
+        types = []
+        for idx in range(len(header)):
+            found = {InputHandler.infer_data_type(row[idx]) for row in sample if idx < len(row) and row[idx].strip()}
+            if found == {"int", "float"}:
+                found = {"float"}
+            types.append(found.pop() if len(found) == 1 else "str")
+        return types
+
+    @staticmethod
+    def _prepare_rows(rows, width: int, types: list):
+        """
+        Fit each row to the header width and turn boolean text into 1/0. Numeric text is passed
+        through as it is; the INTEGER and REAL column affinities convert it.
+        """
+        padding = [""] * width
+        bool_columns = [idx for idx, data_type in enumerate(types) if data_type == "bool"]
+        booleans = {"true": 1, "false": 0}
+
+        for row in rows:
+            if len(row) != width:
+                row = (row + padding)[:width]
+            for idx in bool_columns:
+                row[idx] = booleans.get(row[idx].strip().lower(), row[idx])
+            yield row
@@ -0,0 +1,138 @@
+import json
+import os
+import sqlite3
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from .metadata import is_metadata_table
+
+# Sidecar file in the databases directory holding the scanned details of every database.
+CATALOG_FILE_NAME = ".catalog.json"
+
+# Bumped when the entry layout changes, so old sidecars are rescanned.
+CATALOG_FORMAT_VERSION = 1
+
+# Most databases scanned at the same time.
+MAX_CATALOG_THREADS = 8
+
+
+def file_signature(path: str) -> list:
+    """
+    Returns:
+        list: Size and modification time (ns) of a database and of its write-ahead log, if it
+            has one. Committed changes still in the log change the signature too.
+    """
+    signature = []
+    for file_path in (path, path + "-wal"):
+        if os.path.exists(file_path):
+            stat = os.stat(file_path)
+            signature.extend([stat.st_size, stat.st_mtime_ns])
+    return signature
+
+
+def scan_database(path: str) -> dict:
+    """
+    Read the details of one database through a read-only connection.
+
+    Returns:
+        dict: Size, modification time, page size, page count, free pages and the row count of
+            every table.
+    """
+    connection = sqlite3.connect(f"file:{urllib.parse.quote(os.path.abspath(path))}?mode=ro", uri=True)
+    try:
+        tables = [row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name") if not is_metadata_table(row[0])]
+        stat = os.stat(path)
+        return {
+            "size": stat.st_size,
+            "modified": stat.st_mtime,
+            "page_size": connection.execute("PRAGMA page_size").fetchone()[0],
+            "page_count": connection.execute("PRAGMA page_count").fetchone()[0],
+            "freelist_count": connection.execute("PRAGMA freelist_count").fetchone()[0],
+            "tables": {table: connection.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0] for table in tables},
+        }
+    finally:
+        connection.close()
+
+
+class DatabaseCatalog:
+
+    def __init__(self, database_directory: str, max_workers: int = MAX_CATALOG_THREADS):
+        """
+        Details of every database in a directory, cached in a sidecar file.
+
+        Each database's details are stored with the size and modification time of the file.
+        A refresh only rescans the databases whose signature changed, or that are new, so
+        listing hundreds of unchanged databases costs one `stat` per file. The rescans run on a
+        thread pool, each with its own read-only connection.
+
+        :param database_directory: The directory holding the .db files.
+        :param max_workers: Most databases scanned at once.
+        """
+        self.database_directory = database_directory
+        self.catalog_path = os.path.join(database_directory, CATALOG_FILE_NAME)
+        self.max_workers = max_workers
+
+    def load(self) -> dict:
+        """
+        Returns:
+            dict: File name mapped to its cached entry, or an empty dictionary if the sidecar is
+                missing, unreadable or from another format version.
+        """
+        try:
+            with open(self.catalog_path, "r", encoding="utf-8") as f:
+                catalog = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(catalog, dict) or catalog.get("version") != CATALOG_FORMAT_VERSION:
+            return {}
+        return catalog.get("databases", {})
+
+    def save(self, entries: dict) -> None:
+        """
+        Write the sidecar atomically. Failures are ignored; the catalog is only an optimization.
+        """
+        temporary_path = f"{self.catalog_path}.{os.getpid()}.tmp"
+        try:
+            with open(temporary_path, "w", encoding="utf-8") as f:
+                json.dump({"version": CATALOG_FORMAT_VERSION, "databases": entries}, f)
+            os.replace(temporary_path, self.catalog_path)
+        except OSError:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+    def refresh(self) -> tuple:
+        """
+        Bring the catalog up to date with the directory.
+
+        Returns:
+            tuple: File name mapped to its details for every database, in name order, the names
+                of the databases that were rescanned, and a dictionary of the databases that
+                could not be read mapped to the error.
+        """
+        cached = self.load()
+        names = sorted(name for name in os.listdir(self.database_directory) if name.endswith(".db"))
+
+        entries = {}
+        stale = {}
+        for name in names:
+            signature = file_signature(os.path.join(self.database_directory, name))
+            entry = cached.get(name)
+            if entry is not None and entry.get("signature") == signature:
+                entries[name] = entry
+            else:
+                stale[name] = signature
+
+        errors = {}
+        if stale:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(stale))) as executor:
+                futures = {executor.submit(scan_database, os.path.join(self.database_directory, name)): name for name in stale}
+                for future in as_completed(futures):
+                    name = futures[future]
+                    try:
+                        entries[name] = dict(future.result(), signature=stale[name])
+                    except (sqlite3.Error, OSError) as e:
+                        errors[name] = str(e)
+
+        # Deleted databases drop out because only the listed names are kept
+        if stale or len(entries) != len(cached):
+            self.save(entries)
+        return {name: entries[name] for name in names if name in entries}, sorted(set(stale) - set(errors)), errors
@@ -0,0 +1,181 @@
+import csv
+import itertools
+import sqlite3
+from table_builder.deduplication import RowDeduplicator, parse_dedupe_options
+from table_builder.external_sort import SORT_MEMORY_BUDGET, ExternalSorter, parse_sort_keys, sort_key
+from table_builder.io import compression
+from table_builder.io.stream_writers import open_stream_writer
+from table_builder.table_utils import InputHandler
+from .bulk_import import TYPE_SAMPLE_ROWS, CSVImporter
+
+# Rows handed to the writer per write.
+CONVERT_BATCH_SIZE = 5_000
+
+
+class SortStage:
+
+    def __init__(self, keys: str, memory_budget: int = SORT_MEMORY_BUDGET, temp_dir: str = None):
+        """
+        Conversion stage that sorts the rows on one or more columns, with an external merge sort
+        when they do not fit the memory budget.
+
+        :param keys: The sort keys, see `parse_sort_keys`, e.g. `region, price desc`.
+        :param memory_budget: Bytes the sort may hold in memory.
+        :param temp_dir: Directory for the sorted runs. The system's temporary directory if not given.
+        """
+        self.keys = keys
+        self.memory_budget = memory_budget
+        self.temp_dir = temp_dir
+        self.sorter = None
+
+    def apply(self, header: list, types: list, rows):
+        """
+        Returns:
+            iterable: The rows in sorted order, compared as the column types.
+
+        Raises:
+            ValueError: If a key names an unknown column.
+        """
+        keys = parse_sort_keys(self.keys, header)
+        self.sorter = ExternalSorter(sort_key(keys, [types[position] for position, _ in keys]), self.memory_budget, self.temp_dir)
+        return self.sorter.sort(rows)
+
+    def describe(self) -> str:
+        if self.sorter is None or not self.sorter.spilled:
+            return f"sorted by {self.keys} in memory"
+        return (
+            f"sorted by {self.keys} with an external merge sort: {self.sorter.run_count:,} runs, "
+            f"{self.sorter.bytes_spilled / 2**20:,.1f} MiB spilled, {self.sorter.merge_passes} merge passes"
+        )
+
+
+class DedupeStage:
+
+    def __init__(self, options: str = "", temp_dir: str = None):
+        """
+        Conversion stage that removes duplicate rows in one pass, holding a 64-bit digest of
+        every distinct row instead of the row itself.
+
+        :param options: The columns that must match and which row to keep, see
+            `parse_dedupe_options`, e.g. `region, name keep last`. Whole rows if empty.
+        :param temp_dir: Directory for the spool files of `keep last`. The system's temporary
+            directory if not given.
+        """
+        self.options = options
+        self.temp_dir = temp_dir
+        self.deduplicator = None
+
+    def apply(self, header: list, types: list, rows):
+        """
+        Returns:
+            iterable: The rows that are not duplicates of a kept row, in their input order.
+
+        Raises:
+            ValueError: If the options name an unknown column.
+        """
+        positions, keep = parse_dedupe_options(self.options, header)
+        self.deduplicator = RowDeduplicator(positions, keep, temp_dir=self.temp_dir)
+        return self.deduplicator.filter(rows)
+
+    def describe(self) -> str:
+        if self.deduplicator is None:
+            return "deduplicated"
+        return f"deduplicated: {self.deduplicator.describe()}"
+
+
+class FileConverter:
+
+    def __init__(self, connection: sqlite3.Connection = None, infer_types: bool = True, sample_rows: int = TYPE_SAMPLE_ROWS):
+        """
+        Streams a CSV file through conversion stages, such as a dedupe or a sort, into another file format
+        or a database table, without loading it into the Table Builder.
+
+        Column types are inferred from a leading sample of rows, as for CSV imports, and the
+        stages compare values by those types. Rows are written as the last stage yields them,
+        so only what a stage itself holds is ever in memory.
+
+        :param connection: Connection to the database that tables are written to.
+        :param infer_types: Infer column types from the sample. When off, every column is text.
+        :param sample_rows: Rows read to infer the column types.
+        """
+        self.connection = connection
+        self.importer = CSVImporter(connection, infer_types=infer_types, sample_rows=sample_rows)
+
+    def convert(self, csv_path: str, target: str, file_format: str, stages: list = (), replace: bool = False, progress=None) -> int:
+        """
+        Convert a CSV file. Compressed files are decompressed as they are read.
+
+        Args:
+            csv_path (str): Path to the CSV file.
+            target (str): Path of the file to write, or the name of the table to create.
+            file_format (str): One of the STREAM_WRITERS formats, or "table" for a table of the
+                connected database.
+            stages (list): Stages the rows pass through in order, each with an
+                `apply(header, types, rows)` method that returns the rows it passes on.
+            replace (bool): Drop an existing table with the same name first.
+            progress (callable): Called with the number of rows written so far after each batch.
+
+        Returns:
+            int: The number of rows written.
+
+        Raises:
+            ValueError: If the file is empty, a stage's options do not fit the file, or the
+                table already exists and replace is off.
+        """
+        with compression.open_text(csv_path, "r", newline="") as csv_file:
+            reader = csv.reader(csv_file)
+            header = next(reader, None)
+            if not header:
+                raise ValueError("CSV file is empty.")
+
+            sample = list(itertools.islice(reader, self.importer.sample_rows))
+            types = self.importer.sample_types(header, sample)
+            rows = self._fit_rows(itertools.chain(sample, reader), len(header))
+            for stage in stages:
+                rows = stage.apply(header, types, rows)
+
+            if file_format == "table":
+                return self.importer.import_rows(itertools.chain([header], rows), target, replace, progress)
+
+            if file_format != "csv":
+                rows = self._typed_rows(rows, types)
+            written = 0
+            with open_stream_writer(target, file_format) as writer:
+                writer.write_header(header)
+                while batch := list(itertools.islice(rows, CONVERT_BATCH_SIZE)):
+                    writer.write_rows(batch)
+                    written += len(batch)
+                    if progress:
+                        progress(written)
+            return written
+
+    @staticmethod
+    def _fit_rows(rows, width: int):
+        """
+        Yields:
+            list: Each row padded with empty cells or cut to the header width, so every stage
+                can index every column.
+        """
+        padding = [""] * width
+        for row in rows:
+            yield row if len(row) == width else (row + padding)[:width]
+
+    @staticmethod
+    def _typed_rows(rows, types: list):
+        """
+        Yields:
+            list: Each row with its cells converted to the column types, so spreadsheets and
+                NDJSON get numbers and booleans. Empty cells become None, and cells that do not
+                convert are kept as text.
+        """
+        convert_value = InputHandler.convert_value
+        typed = [(idx, data_type) for idx, data_type in enumerate(types) if data_type != "str"]
+        for row in rows:
+            row = [cell if cell != "" else None for cell in row]
+            for idx, data_type in typed:
+                if row[idx] is not None:
+                    try:
+                        row[idx] = convert_value(row[idx], data_type)
+                    except ValueError:
+                        pass
+            yield row
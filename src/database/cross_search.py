@@ -0,0 +1,114 @@
+import heapq
+import os
+import sqlite3
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from .metadata import is_metadata_table
+
+# Most matches kept from every table and shown in total.
+SEARCH_RESULT_LIMIT = 100
+
+# Most databases searched at the same time.
+MAX_SEARCH_THREADS = 8
+
+# Rank of a match: the whole value, the start of the value, or somewhere inside it.
+EXACT_MATCH, PREFIX_MATCH, SUBSTRING_MATCH = 0, 1, 2
+
+
+def escape_like(text: str) -> str:
+    """
+    Escape LIKE wildcards so the text matches literally, with '\\' as the escape character.
+    """
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def search_database(path: str, text: str, limit: int = SEARCH_RESULT_LIMIT) -> list:
+    """
+    Find the cells of every table in one database that contain some text, ignoring ASCII case.
+
+    The database is opened read-only. The match is pushed down into SQLite as one query per
+    table, which ranks the matching cells and returns only the best `limit` of them, so no
+    table is read into Python.
+
+    Returns:
+        list: (rank, value length, database name, table, rowid, column, value) of the best
+            matches of each table.
+    """
+    connection = sqlite3.connect(f"file:{urllib.parse.quote(os.path.abspath(path))}?mode=ro", uri=True)
+    try:
+        tables = [row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type='table'") if not is_metadata_table(row[0])]
+        pattern = escape_like(text)
+        parameters = {"text": text.lower(), "prefix": f"{pattern}%", "contains": f"%{pattern}%", "limit": limit}
+        database_name = os.path.basename(path)
+
+        hits = []
+        for table in tables:
+            columns = [column[1] for column in connection.execute(f'PRAGMA table_info("{table}")')]
+            if not columns:
+                continue
+            # One ranked SELECT per column, so every matching cell is its own hit
+            query = " UNION ALL ".join(
+                f'SELECT rowid, :column_{idx}, "{column}", '
+                f'CASE WHEN lower("{column}") = :text THEN {EXACT_MATCH} WHEN "{column}" LIKE :prefix ESCAPE \'\\\' THEN {PREFIX_MATCH} ELSE {SUBSTRING_MATCH} END AS rank, '
+                f'length("{column}") AS value_length FROM "{table}" WHERE "{column}" LIKE :contains ESCAPE \'\\\''
+                for idx, column in enumerate(columns)
+            ) + " ORDER BY rank, value_length LIMIT :limit"
+            column_parameters = {f"column_{idx}": column for idx, column in enumerate(columns)}
+            for rowid, column, value, rank, value_length in connection.execute(query, {**parameters, **column_parameters}):
+                hits.append((rank, value_length, database_name, table, rowid, column, value))
+        return hits
+    finally:
+        connection.close()
+
+
+class DatabaseSearcher:
+
+    def __init__(self, database_directory: str, limit: int = SEARCH_RESULT_LIMIT, max_workers: int = MAX_SEARCH_THREADS):
+        """
+        Searches every .db file of a directory at the same time.
+
+        Each database is searched on its own thread with its own read-only connection. SQLite
+        releases the GIL while a query runs, so the searches overlap and the whole search takes
+        about as long as the slowest database. The matches are merged into one list ranked by
+        how closely the cell matches: whole value first, then start of the value, then anywhere,
+        shorter values first within each rank.
+
+        :param database_directory: The directory holding the .db files.
+        :param limit: Most matches returned.
+        :param max_workers: Most databases searched at once.
+        """
+        self.database_directory = database_directory
+        self.limit = limit
+        self.max_workers = max_workers
+
+    def database_paths(self) -> list:
+        return sorted(
+            os.path.join(self.database_directory, name)
+            for name in os.listdir(self.database_directory) if name.endswith(".db")
+        )
+
+    def search(self, text: str) -> tuple:
+        """
+        Args:
+            text (str): The text to look for.
+
+        Returns:
+            tuple: The best matches as (rank, value length, database, table, rowid, column, value)
+                tuples, and a dictionary of the databases that could not be searched mapped to
+                the error.
+        """
+        paths = self.database_paths()
+        if not paths:
+            return [], {}
+
+        hits = []
+        errors = {}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(paths))) as executor:
+            futures = {executor.submit(search_database, path, text, self.limit): path for path in paths}
+            for future in as_completed(futures):
+                try:
+                    hits.extend(future.result())
+                except sqlite3.Error as e:
+                    errors[os.path.basename(futures[future])] = str(e)
+
+        return heapq.nsmallest(self.limit, hits), errors
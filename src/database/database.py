@@ -1,11 +1,28 @@
 import sqlite3
 import os
+import time
+import urllib.parse
 from rich.console import Console
 from message_panel.system_message import SystemMessage
 from message_panel.instruction_message import InstructionMessage
 from autocomplete.autocomplete import Autocomplete
 from rich.panel import Panel
+from rich.table import Table
+from rich.markup import escape
 from settings.settings import Settings
+from .bulk_import import CSVImporter
+from .export import TableExporter
+from .workbook_import import WORKBOOK_EXTENSIONS, WorkbookImporter, list_sheets
+from .indexes import IndexCatalog
+from .metadata import is_metadata_table
+from .cross_search import DatabaseSearcher
+from .catalog import DatabaseCatalog
+from .maintenance import DatabaseMaintenance
+from .table_transfer import MERGE_MODES, TableTransfer
+from .conversion import DedupeStage, FileConverter, SortStage
+from table_builder.external_sort import SORT_MEMORY_BUDGET
+from table_builder.io.stream_writers import STREAM_WRITERS
+from table_builder.io import compression
 
 class Database:
     def __init__(self, console: Console, settings: Settings):
@@ -41,8 +58,7 @@ class Database:
                 return
 
             # Fetch all table names in the database
-            self.cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-            tables = [row[0] for row in self.cursor.fetchall()]
+            tables = self.list_tables()
 
             if not tables:
                 self.system_message.create_error_message("No tables found in the database.")
@@ -112,6 +128,471 @@ class Database:
 
 
 
+    def search_all_databases(self) -> None:
+        """
+        Search every database in the 'databases' directory at once and show the best matches.
+        Needs no connected database; each one is opened read-only.
+        """
+        search_string = self.console.input("[bold yellow]Enter the search query[/]: ").strip()
+        if not search_string:
+            self.system_message.create_error_message("Search query cannot be empty.")
+            return
+
+        searcher = DatabaseSearcher(self.database_directory)
+        database_count = len(searcher.database_paths())
+        if not database_count:
+            self.system_message.create_error_message("No databases found.")
+            return
+
+        start = time.perf_counter()
+        with self.console.status(f"[bold yellow]Searching {database_count} databases...[/]"):
+            hits, errors = searcher.search(search_string)
+        elapsed = time.perf_counter() - start
+
+        for database_name, error in errors.items():
+            self.system_message.create_error_message(f"Could not search '[bold cyan]{database_name}[/]': {error}")
+        if not hits:
+            self.system_message.create_information_message(f"No matches found for '[bold cyan]{search_string}[/]' in {database_count} databases.")
+            return
+
+        capped = f", best {searcher.limit} shown" if len(hits) == searcher.limit else ""
+        table = Table(
+            title=f"[bold red]Search Results for '{search_string}'[/]",
+            caption=f"[bold yellow]{len(hits)} matches{capped}, {database_count} databases searched in {elapsed:.2f} seconds[/]",
+            border_style="cyan", show_lines=True
+        )
+        table.add_column("#", style="bold yellow", justify="right")
+        table.add_column("Database", style="red")
+        table.add_column("Table", style="cyan")
+        table.add_column("Row", justify="right")
+        table.add_column("Column", style="green")
+        table.add_column("Value")
+        for idx, (_, _, database_name, table_name, rowid, column, value) in enumerate(hits, start=1):
+            table.add_row(str(idx), database_name, table_name, str(rowid), column, escape(str(value)))
+        self.console.print(table)
+
+    def import_csv_to_table(self, csv_path: str = None, table_name: str = None) -> None:
+        """
+        Import a CSV file straight into a table of the connected database. The file is streamed
+        in batches and never loaded into the Table Builder, so files larger than memory work.
+
+        :param csv_path: Path to the CSV file. If not provided, prompts the user.
+        :param table_name: Name of the new table. If not provided, prompts the user.
+        """
+        if not self.is_connected():
+            self.system_message.create_error_message("No database is connected. Please connect to a database first.")
+            return
+
+        csv_path = csv_path or self.console.input("[bold yellow]Enter path to CSV file[/]: ").strip()
+        if not os.path.isfile(csv_path):
+            self.system_message.create_error_message("Invalid path or file does not exist.")
+            return
+
+        default_name = compression.strip_extensions(csv_path)
+        table_name = table_name or self.console.input(f"[bold yellow]Enter a name for the table (press Enter for '[bold cyan]{default_name}[/]')[/]: ").strip() or default_name
+
+        replace = False
+        if table_name in self.list_tables():
+            overwrite = self.console.input(f"[bold yellow]Table '[bold cyan]{table_name}[/]' already exists. Overwrite it? (y/n)[/]: ").strip().lower()
+            if overwrite != "y":
+                self.system_message.create_information_message("Import cancelled.")
+                return
+            replace = True
+
+        importer = CSVImporter(self.connection, infer_types=self.settings.get_setting("infer_data_types") == "on")
+        try:
+            start = time.perf_counter()
+            with self.console.status("[bold yellow]Importing CSV file...[/]") as status:
+                imported = importer.import_csv(
+                    csv_path, table_name, replace,
+                    progress=lambda count: status.update(f"[bold yellow]Imported [bold cyan]{count:,}[/] rows...[/]")
+                )
+            self.system_message.create_information_message(
+                f"Imported [bold cyan]{imported:,}[/] rows into table '[bold cyan]{table_name}[/]' in [bold cyan]{time.perf_counter() - start:.1f}[/] seconds."
+            )
+            self.rebuild_indexes(table_name)
+            self.auto_maintain([table_name])
+        except UnicodeDecodeError:
+            self.system_message.create_error_message("Failed to decode file. Ensure it is UTF-8 encoded.")
+        except (ValueError, sqlite3.Error, OSError) as e:
+            self.system_message.create_error_message(f"Failed to import CSV file: {e}")
+
+    def load_workbook(self, path: str = None) -> None:
+        """
+        Import sheets of an XLSX or ODS workbook into tables of the connected database, one
+        table per sheet. The sheets are listed with their sizes, and the chosen ones are parsed
+        in parallel worker processes.
+
+        :param path: Path to the workbook. If not provided, prompts the user.
+        """
+        if not self.is_connected():
+            self.system_message.create_error_message("No database is connected. Please connect to a database first.")
+            return
+
+        path = path or self.console.input("[bold yellow]Enter path to the workbook (.xlsx or .ods)[/]: ").strip()
+        if not os.path.isfile(path):
+            self.system_message.create_error_message("Invalid path or file does not exist.")
+            return
+        if not path.lower().endswith(WORKBOOK_EXTENSIONS):
+            self.system_message.create_error_message("Only .xlsx, .xlsm and .ods workbooks can be loaded.")
+            return
+
+        try:
+            with self.console.status("[bold yellow]Reading workbook...[/]"):
+                sheets = list_sheets(path)
+        except Exception as e:
+            self.system_message.create_error_message(f"Failed to read workbook: {e}")
+            return
+        if not sheets:
+            self.system_message.create_error_message("The workbook has no sheets.")
+            return
+
+        table = Table(title=f"[bold red]{os.path.basename(path)}[/]", border_style="yellow", show_lines=True)
+        table.add_column("#", style="cyan", justify="right")
+        table.add_column("Sheet", style="green")
+        table.add_column("Rows", justify="right")
+        table.add_column("Columns", justify="right")
+        for idx, (sheet_name, rows, columns) in enumerate(sheets, start=1):
+            table.add_row(str(idx), sheet_name, "?" if rows is None else f"{rows:,}", "?" if columns is None else str(columns))
+        self.console.print(table)
+
+        selection = self.console.input("[bold yellow]Enter the numbers of the sheets to import, separated by commas (press Enter for all)[/]: ").strip()
+        if selection and selection.lower() != "all":
+            try:
+                numbers = [int(number) for number in selection.split(",") if number.strip()]
+            except ValueError:
+                self.system_message.create_error_message("Invalid input. Please enter sheet numbers separated by commas.")
+                return
+            if not numbers or not all(1 <= number <= len(sheets) for number in numbers):
+                self.system_message.create_error_message("Invalid sheet number.")
+                return
+            sheets = [sheets[number - 1] for number in dict.fromkeys(numbers)]
+
+        prefix = self.console.input("[bold yellow]Enter a prefix for the table names (press Enter to name the tables after the sheets)[/]: ").strip()
+        # Largest sheets first, so the longest parses start straight away
+        sheets.sort(key=lambda sheet: sheet[1] or 0, reverse=True)
+        table_names = {sheet_name: f"{prefix}{sheet_name}" for sheet_name, _, _ in sheets}
+
+        tables = set(self.list_tables())
+        existing = [name for name in table_names.values() if name in tables]
+        replace = False
+        if existing:
+            overwrite = self.console.input(f"[bold yellow]Tables {', '.join(f'[bold cyan]{name}[/]' for name in existing)} already exist. Overwrite them? (y/n)[/]: ").strip().lower()
+            if overwrite != "y":
+                self.system_message.create_information_message("Import cancelled.")
+                return
+            replace = True
+
+        importer = WorkbookImporter(self.connection, infer_types=self.settings.get_setting("infer_data_types") == "on")
+        done = []
+        try:
+            start = time.perf_counter()
+            with self.console.status(f"[bold yellow]Importing {len(table_names)} sheets...[/]") as status:
+                def sheet_imported(sheet_name: str) -> None:
+                    done.append(sheet_name)
+                    status.update(f"[bold yellow]Imported [bold cyan]{len(done)}[/] of {len(table_names)} sheets...[/]")
+
+                imported = importer.import_sheets(path, table_names, replace, progress=sheet_imported)
+            summary = "\n".join(f"- [bold cyan]{name}[/]: {rows:,} rows" for name, rows in imported.items())
+            self.system_message.create_information_message(
+                f"Imported [bold cyan]{len(imported)}[/] sheets in [bold cyan]{time.perf_counter() - start:.1f}[/] seconds:\n{summary}"
+            )
+            for table_name in imported:
+                self.rebuild_indexes(table_name)
+            self.auto_maintain(list(imported))
+        except Exception as e:
+            self.system_message.create_error_message(f"Failed to import workbook: {e}")
+            if done:
+                self.system_message.create_information_message(f"Sheets imported before the failure: {', '.join(done)}")
+
+    def choose_table(self, action: str) -> str:
+        """
+        List the tables of the connected database and let the user pick one by number.
+
+        Args:
+            action (str): What will be done with the table, shown in the prompt.
+
+        Returns:
+            str: The chosen table, or None if there are no tables or the input was invalid.
+        """
+        tables = self.list_tables()
+        if not tables:
+            self.system_message.create_error_message("No tables found in the database.")
+            return None
+
+        self.console.print("[bold green]Available Tables:[/]")
+        for idx, table in enumerate(tables, start=1):
+            self.console.print(f"{idx}. {table}")
+
+        try:
+            table_number = int(self.console.input(f"[bold yellow]Enter the number of the table to {action}[/]: ")) - 1
+        except ValueError:
+            self.system_message.create_error_message("Invalid input. Please enter a valid number.")
+            return None
+        if not 0 <= table_number < len(tables):
+            self.system_message.create_error_message("Invalid table number.")
+            return None
+        return tables[table_number]
+
+    def resolve_database(self, db_name: str) -> str:
+        """
+        Find a database of the 'databases' directory by name, ignoring case and the .db extension.
+
+        Returns:
+            str: The path of the database, or None if there is no such database.
+        """
+        wanted = db_name.strip().lower()
+        if not wanted.endswith(".db"):
+            wanted += ".db"
+        for name in os.listdir(self.database_directory):
+            if name.lower() == wanted:
+                return os.path.join(self.database_directory, name)
+        return None
+
+    def choose_transfer_target(self, target: str, action: str) -> tuple:
+        """
+        Resolve the database a table is copied or merged into, prompting for it when not given.
+
+        Returns:
+            tuple: The path of the target database and the name of the table in it, or None if
+                the input was invalid.
+        """
+        table_name = self.choose_table(action)
+        if table_name is None:
+            return None
+
+        target = target or self.console.input("[bold yellow]Enter the name of the target database[/]: ").strip()
+        target_path = self.resolve_database(target) if target else None
+        if target_path is None:
+            self.system_message.create_error_message(f"Database '[bold cyan]{target}[/]' does not exist. Use 'create database' to create it first.")
+            return None
+        if os.path.samefile(target_path, self.current_database):
+            self.system_message.create_error_message("The target database must be a different database from the current one.")
+            return None
+
+        target_table = self.console.input(f"[bold yellow]Enter the name of the table in the target database (press Enter for '[bold cyan]{table_name}[/]')[/]: ").strip() or table_name
+        return table_name, target_path, target_table
+
+    def copy_table(self, target: str = None) -> None:
+        """
+        Copy a table of the connected database into another database inside SQLite, without
+        loading it.
+
+        :param target: Name of the target database. If not provided, prompts the user.
+        """
+        if not self.is_connected():
+            self.system_message.create_error_message("No database is connected. Please connect to a database first.")
+            return
+        choice = self.choose_transfer_target(target, "copy")
+        if choice is None:
+            return
+        table_name, target_path, target_table = choice
+
+        transfer = TableTransfer(self.connection)
+        replace = False
+        if target_table in self.tables_of(target_path):
+            overwrite = self.console.input(f"[bold yellow]Table '[bold cyan]{target_table}[/]' already exists in the target database. Overwrite it? (y/n)[/]: ").strip().lower()
+            if overwrite != "y":
+                self.system_message.create_information_message("Copy cancelled.")
+                return
+            replace = True
+
+        try:
+            start = time.perf_counter()
+            with self.console.status("[bold yellow]Copying table...[/]"):
+                copied = transfer.copy_table(table_name, target_path, target_table, replace)
+            self.system_message.create_information_message(
+                f"Copied [bold cyan]{copied:,}[/] rows from '[bold cyan]{table_name}[/]' to '[bold cyan]{target_table}[/]' in "
+                f"'[bold red]{os.path.basename(target_path)}[/]' in [bold cyan]{time.perf_counter() - start:.2f}[/] seconds."
+            )
+        except (ValueError, sqlite3.Error) as e:
+            self.system_message.create_error_message(f"Failed to copy table: {e}")
+
+    def merge_table(self, target: str = None) -> None:
+        """
+        Add the rows of a table of the connected database to a table of another database inside
+        SQLite, without loading them.
+
+        :param target: Name of the target database. If not provided, prompts the user.
+        """
+        if not self.is_connected():
+            self.system_message.create_error_message("No database is connected. Please connect to a database first.")
+            return
+        choice = self.choose_transfer_target(target, "merge")
+        if choice is None:
+            return
+        table_name, target_path, target_table = choice
+
+        mode = "append"
+        if target_table in self.tables_of(target_path):
+            modes = "\n".join(f"- [bold cyan]{name}[/]: {description}" for name, description in MERGE_MODES.items())
+            self.console.print(f"[bold green]Merge modes:[/]\n{modes}")
+            mode = self.console.input("[bold yellow]Enter the merge mode (press Enter for 'append')[/]: ").strip().lower() or "append"
+            if mode not in MERGE_MODES:
+                self.system_message.create_error_message("Invalid merge mode.")
+                return
+
+        try:
+            start = time.perf_counter()
+            with self.console.status("[bold yellow]Merging table...[/]"):
+                merged = TableTransfer(self.connection).merge_table(table_name, target_path, target_table, mode)
+            self.system_message.create_information_message(
+                f"Merged [bold cyan]{merged:,}[/] rows from '[bold cyan]{table_name}[/]' into '[bold cyan]{target_table}[/]' in "
+                f"'[bold red]{os.path.basename(target_path)}[/]' in [bold cyan]{time.perf_counter() - start:.2f}[/] seconds."
+            )
+        except (ValueError, sqlite3.Error) as e:
+            self.system_message.create_error_message(f"Failed to merge table: {e}")
+
+    def sql_console(self) -> None:
+        """
+        Run SQL statements against the connected database. A query result that is imported opens
+        in a new Table Builder session.
+        """
+        if not self.is_connected():
+            self.system_message.create_error_message("No database is connected. Please connect to a database first.")
+            return
+
+        # Imported here: the Table Builder itself imports this module
+        from table_builder.builder import TableBuilder
+        table_builder = TableBuilder(self.console, self.settings, self, name_on_start=True)
+        if table_builder.sql_console.run():
+            table_builder.launch_builder(print_on_start=True)
+
+    def tables_of(self, database_path: str) -> list:
+        """
+        Returns:
+            list: The names of the tables of another database, read through a read-only connection.
+        """
+        connection = sqlite3.connect(f"file:{urllib.parse.quote(os.path.abspath(database_path))}?mode=ro", uri=True)
+        try:
+            return [row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type='table'") if not is_metadata_table(row[0])]
+        finally:
+            connection.close()
+
+    def export_table(self) -> None:
+        """
+        Export a table of the connected database to a CSV, XLSX, ODS or NDJSON file. Rows are
+        streamed from the database in batches, so the table is never loaded into memory.
+        """
+        if not self.is_connected():
+            self.system_message.create_error_message("No database is connected. Please connect to a database first.")
+            return
+
+        table_name = self.choose_table("export")
+        if table_name is None:
+            return
+
+        file_format = self.console.input(f"[bold yellow]Enter the file format ({'/'.join(STREAM_WRITERS)})[/]: ").strip().lower()
+        if file_format not in STREAM_WRITERS:
+            self.system_message.create_error_message("Invalid file format.")
+            return
+
+        columns = self.console.input("[bold yellow]Enter the columns to export, separated by commas (press Enter for all)[/]: ").strip()
+        columns = [name.strip() for name in columns.split(",") if name.strip()]
+        where = self.console.input("[bold yellow]Enter a condition for the rows to export, e.g. price > 10 (press Enter for all rows)[/]: ").strip()
+
+        extension = STREAM_WRITERS[file_format][1]
+        file_name = self.console.input(f"[bold yellow]Enter the name of the file (press Enter for '[bold cyan]{table_name}{extension}[/]', add .gz, .bz2, .xz or .zst to compress CSV and NDJSON)[/]: ").strip() or table_name
+        if not compression.has_extension(file_name, extension):
+            file_name = compression.add_extension(file_name, extension)
+        if file_format in ("xlsx", "ods") and compression.codec_from_extension(file_name):
+            self.system_message.create_error_message("XLSX and ODS files are already compressed. Only CSV and NDJSON exports can be compressed.")
+            return
+
+        exporter = TableExporter(self.connection)
+        try:
+            start = time.perf_counter()
+            with self.console.status("[bold yellow]Exporting table...[/]") as status:
+                written = exporter.export(
+                    table_name, file_name, file_format, columns=columns, where=where,
+                    progress=lambda count: status.update(f"[bold yellow]Exported [bold cyan]{count:,}[/] rows...[/]")
+                )
+            self.system_message.create_information_message(
+                f"Exported [bold cyan]{written:,}[/] rows from '[bold cyan]{table_name}[/]' to '[bold red]{file_name}[/]' in [bold cyan]{time.perf_counter() - start:.1f}[/] seconds."
+            )
+        except (ValueError, sqlite3.Error, OSError) as e:
+            self.system_message.create_error_message(f"Failed to export table: {e}")
+
+    def convert_file(self) -> None:
+        """
+        Convert a CSV file to a CSV, XLSX, ODS or NDJSON file or a table of the connected
+        database, optionally removing duplicate rows and sorting it on the way. The file is
+        streamed and never loaded into the Table Builder; duplicates are found by row digests,
+        and a sort that does not fit in memory spills sorted runs to disk.
+        """
+        csv_path = self.console.input("[bold yellow]Enter path to CSV file[/]: ").strip()
+        if not os.path.isfile(csv_path):
+            self.system_message.create_error_message("Invalid path or file does not exist.")
+            return
+
+        formats = [*STREAM_WRITERS, "table"]
+        file_format = self.console.input(f"[bold yellow]Enter the output format ({'/'.join(formats)})[/]: ").strip().lower()
+        if file_format not in formats:
+            self.system_message.create_error_message("Invalid file format.")
+            return
+        if file_format == "table" and not self.is_connected():
+            self.system_message.create_error_message("No database is connected. Please connect to a database first.")
+            return
+
+        stages = []
+        dedupe = self.console.input("[bold yellow]Remove duplicate rows? Enter 'all' or the columns that must match, and 'keep last' to keep the last of every group (press Enter to keep every row)[/]: ").strip()
+        if dedupe:
+            stages.append(DedupeStage(dedupe))
+        sort_keys = self.console.input("[bold yellow]Enter the columns to sort by, e.g. region, price desc (press Enter to keep the file's order)[/]: ").strip()
+        if sort_keys:
+            budget = self.console.input(f"[bold yellow]Enter the memory the sort may use in MiB (press Enter for {SORT_MEMORY_BUDGET // 2**20})[/]: ").strip()
+            try:
+                budget = int(budget) * 2**20 if budget else SORT_MEMORY_BUDGET
+                if budget <= 0:
+                    raise ValueError
+            except ValueError:
+                self.system_message.create_error_message("The memory budget must be a positive whole number.")
+                return
+            stages.append(SortStage(sort_keys, budget))
+
+        default_name = compression.strip_extensions(csv_path)
+        replace = False
+        if file_format == "table":
+            target = self.console.input(f"[bold yellow]Enter a name for the table (press Enter for '[bold cyan]{default_name}[/]')[/]: ").strip() or default_name
+            if target in self.list_tables():
+                overwrite = self.console.input(f"[bold yellow]Table '[bold cyan]{target}[/]' already exists. Overwrite it? (y/n)[/]: ").strip().lower()
+                if overwrite != "y":
+                    self.system_message.create_information_message("Conversion cancelled.")
+                    return
+                replace = True
+        else:
+            extension = STREAM_WRITERS[file_format][1]
+            target = self.console.input(f"[bold yellow]Enter the name of the file (press Enter for '[bold cyan]{default_name}{extension}[/]', add .gz, .bz2, .xz or .zst to compress CSV and NDJSON)[/]: ").strip() or default_name
+            if not compression.has_extension(target, extension):
+                target = compression.add_extension(target, extension)
+            if file_format in ("xlsx", "ods") and compression.codec_from_extension(target):
+                self.system_message.create_error_message("XLSX and ODS files are already compressed. Only CSV and NDJSON files can be compressed.")
+                return
+            if os.path.abspath(target) == os.path.abspath(csv_path):
+                self.system_message.create_error_message("The output file cannot be the file being converted.")
+                return
+
+        converter = FileConverter(self.connection, infer_types=self.settings.get_setting("infer_data_types") == "on")
+        try:
+            start = time.perf_counter()
+            with self.console.status("[bold yellow]Converting file...[/]") as status:
+                written = converter.convert(
+                    csv_path, target, file_format, stages, replace,
+                    progress=lambda count: status.update(f"[bold yellow]Wrote [bold cyan]{count:,}[/] rows...[/]")
+                )
+            destination = f"table '[bold cyan]{target}[/]'" if file_format == "table" else f"'[bold red]{target}[/]'"
+            details = "".join(f" Rows {stage.describe()}." for stage in stages)
+            self.system_message.create_information_message(
+                f"Wrote [bold cyan]{written:,}[/] rows to {destination} in [bold cyan]{time.perf_counter() - start:.1f}[/] seconds.{details}"
+            )
+            if file_format == "table":
+                self.rebuild_indexes(target)
+                self.auto_maintain([target])
+        except UnicodeDecodeError:
+            self.system_message.create_error_message("Failed to decode file. Ensure it is UTF-8 encoded.")
+        except (ValueError, sqlite3.Error, OSError) as e:
+            self.system_message.create_error_message(f"Failed to convert file: {e}")
+
     def ensure_database_directory(self):
         """
         Ensure the 'databases' directory exists in the current working directory.
@@ -156,6 +637,12 @@ class Database:
         Close the current database connection.
         """
         if self.connection:
+            if self.settings.get_setting("auto_maintenance") == "on":
+                try:
+                    # Recommended by SQLite before closing a connection; usually a no-op
+                    self.connection.execute("PRAGMA optimize")
+                except sqlite3.Error:
+                    pass
             self.connection.close()
             self.connection = None
             self.cursor = None
@@ -168,6 +655,143 @@ class Database:
         """
         return self.current_database
 
+    def list_tables(self) -> list:
+        """
+        Returns:
+            list: The names of the tables in the connected database, without SQLite's internal
+                tables and the Table Builder's metadata tables.
+        """
+        self.cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        return [row[0] for row in self.cursor.fetchall() if not is_metadata_table(row[0])]
+
+    def rebuild_indexes(self, table_name: str) -> None:
+        """
+        Create the declared indexes of a table after it was written, reporting any that could not be built.
+        """
+        try:
+            built, skipped = IndexCatalog(self.connection).rebuild_indexes(table_name)
+        except sqlite3.Error as e:
+            self.system_message.create_error_message(f"Failed to rebuild the indexes of '[bold cyan]{table_name}[/]': {e}")
+            return
+        if built:
+            self.system_message.create_information_message(f"Rebuilt indexes on '[bold cyan]{table_name}[/]': {', '.join(built)}")
+        if skipped:
+            self.system_message.create_error_message(f"Skipped indexes on '[bold cyan]{table_name}[/]' whose columns no longer exist: {', '.join(skipped)}")
+
+    def maintenance(self) -> DatabaseMaintenance:
+        """
+        Returns:
+            DatabaseMaintenance: Maintenance tools for the connected database, or None if no database is connected.
+        """
+        if not self.is_connected():
+            self.system_message.create_error_message("No database is connected. Please connect to a database first.")
+            return None
+        return DatabaseMaintenance(self.connection, self.current_database)
+
+    def report_maintenance(self, operation: str, before: int, after: int, elapsed: float) -> None:
+        self.system_message.create_information_message(
+            f"{operation} finished in [bold cyan]{elapsed:.2f}[/] seconds. "
+            f"File size: [bold cyan]{before / 2**20:.2f}[/] MiB -> [bold cyan]{after / 2**20:.2f}[/] MiB."
+        )
+
+    def vacuum(self) -> None:
+        """
+        Rebuild the connected database without its free pages, shrinking the file.
+        """
+        maintenance = self.maintenance()
+        if maintenance is None:
+            return
+        page_count, freelist_count = maintenance.page_counts()
+        self.system_message.create_information_message(f"[bold cyan]{freelist_count:,}[/] of [bold cyan]{page_count:,}[/] pages are free.")
+        try:
+            with self.console.status("[bold yellow]Vacuuming database...[/]"):
+                self.report_maintenance("VACUUM", *maintenance.vacuum())
+        except sqlite3.Error as e:
+            self.system_message.create_error_message(f"Failed to vacuum database: {e}")
+
+    def vacuum_into(self) -> None:
+        """
+        Write a compacted copy of the connected database to a new file, leaving the database untouched.
+        """
+        maintenance = self.maintenance()
+        if maintenance is None:
+            return
+        default_name = os.path.splitext(os.path.basename(self.current_database))[0] + "_compacted.db"
+        target = self.console.input(f"[bold yellow]Enter a name or path for the copy (press Enter for '[bold cyan]{default_name}[/]')[/]: ").strip() or default_name
+        if not os.path.splitext(target)[1]:
+            target += ".db"
+        if not os.path.dirname(target):
+            target = os.path.join(self.database_directory, target)
+        try:
+            with self.console.status("[bold yellow]Writing compacted copy...[/]"):
+                self.report_maintenance(f"VACUUM INTO '[bold cyan]{target}[/]'", *maintenance.vacuum_into(target))
+        except (ValueError, sqlite3.Error) as e:
+            self.system_message.create_error_message(f"Failed to write compacted copy: {e}")
+
+    def analyze(self) -> None:
+        """
+        Gather query planner statistics for every table and index of the connected database.
+        """
+        maintenance = self.maintenance()
+        if maintenance is None:
+            return
+        try:
+            with self.console.status("[bold yellow]Analyzing database...[/]"):
+                self.report_maintenance("ANALYZE", *maintenance.analyze())
+        except sqlite3.Error as e:
+            self.system_message.create_error_message(f"Failed to analyze database: {e}")
+
+    def optimize(self) -> None:
+        """
+        Refresh the query planner statistics that SQLite judges out of date.
+        """
+        maintenance = self.maintenance()
+        if maintenance is None:
+            return
+        try:
+            with self.console.status("[bold yellow]Optimizing database...[/]"):
+                self.report_maintenance("PRAGMA optimize", *maintenance.optimize())
+        except sqlite3.Error as e:
+            self.system_message.create_error_message(f"Failed to optimize database: {e}")
+
+    def integrity_check(self) -> None:
+        """
+        Check the connected database for corruption and list any problems found.
+        """
+        maintenance = self.maintenance()
+        if maintenance is None:
+            return
+        try:
+            with self.console.status("[bold yellow]Checking database integrity...[/]"):
+                problems, elapsed = maintenance.integrity_check()
+        except sqlite3.Error as e:
+            self.system_message.create_error_message(f"Failed to check database integrity: {e}")
+            return
+        if not problems:
+            self.system_message.create_information_message(f"No problems found in [bold cyan]{elapsed:.2f}[/] seconds.")
+            return
+        details = "\n".join(f"- {escape(problem)}" for problem in problems)
+        self.system_message.create_error_message(f"Found [bold cyan]{len(problems)}[/] problems in [bold cyan]{elapsed:.2f}[/] seconds:\n{details}")
+
+    def auto_maintain(self, table_names: list) -> None:
+        """
+        When the auto_maintenance setting is on, gather statistics for tables that were just
+        written, and vacuum the database once too much of it is free pages.
+
+        :param table_names: The tables that were written.
+        """
+        if self.settings.get_setting("auto_maintenance") != "on" or not self.is_connected():
+            return
+        maintenance = DatabaseMaintenance(self.connection, self.current_database)
+        try:
+            for table_name in table_names:
+                maintenance.analyze(table_name)
+            if maintenance.needs_vacuum():
+                with self.console.status("[bold yellow]Vacuuming database...[/]"):
+                    self.report_maintenance("Auto-maintenance VACUUM", *maintenance.vacuum())
+        except sqlite3.Error as e:
+            self.system_message.create_error_message(f"Auto-maintenance failed: {e}")
+
     def is_connected(self):
         """
         Check if a database is currently connected.
@@ -219,6 +843,44 @@ class Database:
             self.console.print(f"{idx}. {db}")
         return databases
 
+    def database_catalog(self) -> None:
+        """
+        Show the size, tables, row counts and storage details of every database in the
+        'databases' directory. Details are cached, so only new and changed databases are read.
+        """
+        start = time.perf_counter()
+        with self.console.status("[bold yellow]Reading database catalog...[/]"):
+            entries, rescanned, errors = DatabaseCatalog(self.database_directory).refresh()
+        elapsed = time.perf_counter() - start
+
+        for database_name, error in errors.items():
+            self.system_message.create_error_message(f"Could not read '[bold cyan]{database_name}[/]': {error}")
+        if not entries:
+            self.system_message.create_error_message("No databases found.")
+            return
+
+        table = Table(
+            title="[bold red]Database Catalog[/]",
+            caption=f"[bold yellow]{len(entries)} databases, {len(rescanned)} rescanned in {elapsed:.2f} seconds[/]",
+            border_style="cyan", show_lines=True
+        )
+        table.add_column("#", style="bold yellow", justify="right")
+        table.add_column("Database", style="red")
+        table.add_column("MiB", justify="right")
+        table.add_column("Tables", justify="right")
+        table.add_column("Rows", justify="right")
+        table.add_column("Pages", justify="right")
+        table.add_column("Free Pages", justify="right")
+        table.add_column("Modified", style="magenta")
+
+        for idx, (database_name, entry) in enumerate(entries.items(), start=1):
+            table.add_row(
+                str(idx), database_name, f"{entry['size'] / 2**20:.1f}", str(len(entry["tables"])),
+                f"{sum(entry['tables'].values()):,}", f"{entry['page_count']:,}", f"{entry['freelist_count']:,}",
+                time.strftime("%Y-%m-%d %H:%M", time.localtime(entry["modified"]))
+            )
+        self.console.print(table)
+
     def select_database(self):
         """
         Allow the user to select a database from the 'databases' directory.
@@ -264,6 +926,9 @@ class Database:
             elif command == "list databases":
                 self.list_databases()
 
+            elif command == "database catalog":
+                self.database_catalog()
+
             elif command == "select database":
                 self.select_database()
 
@@ -273,9 +938,48 @@ class Database:
             elif command == "close database":
                 self.close()
                 
+            elif command == "vacuum":
+                self.vacuum()
+
+            elif command == "vacuum into":
+                self.vacuum_into()
+
+            elif command == "analyze":
+                self.analyze()
+
+            elif command == "optimize":
+                self.optimize()
+
+            elif command == "integrity check":
+                self.integrity_check()
+
+            elif command == "copy table" or command.startswith("copy table to "):
+                self.copy_table(command[len("copy table to "):].strip() or None)
+
+            elif command == "merge table" or command.startswith("merge table into "):
+                self.merge_table(command[len("merge table into "):].strip() or None)
+
+            elif command == "sql":
+                self.sql_console()
+
             elif command == "search":
                 self.search()
 
+            elif command == "search all databases":
+                self.search_all_databases()
+
+            elif command == "import csv to table":
+                self.import_csv_to_table()
+
+            elif command == "export table":
+                self.export_table()
+
+            elif command == "load workbook":
+                self.load_workbook()
+
+            elif command == "convert file":
+                self.convert_file()
+
             elif command == "help":
                 self.instruction_message.print_database_instructions()
 
@@ -0,0 +1,92 @@
+import sqlite3
+from table_builder.io.stream_writers import open_stream_writer
+
+# Rows fetched from SQLite per fetchmany call.
+EXPORT_FETCH_SIZE = 5_000
+
+
+class TableExporter:
+
+    def __init__(self, connection: sqlite3.Connection, fetch_size: int = EXPORT_FETCH_SIZE):
+        """
+        Streams a database table into a file with `fetchmany`, so only one batch of rows is in
+        memory at a time whatever the size of the table.
+
+        :param connection: Connection to the database holding the table.
+        :param fetch_size: Rows fetched and written per batch.
+        """
+        self.connection = connection
+        self.fetch_size = fetch_size
+
+    def table_columns(self, table_name: str) -> list:
+        """
+        Returns:
+            list: The table's columns as {"name", "type"} dictionaries with the declared SQL types.
+        """
+        cursor = self.connection.execute(f'PRAGMA table_info("{table_name}")')
+        return [{"name": col[1], "type": col[2].upper()} for col in cursor.fetchall()]
+
+    def export(self, table_name: str, path: str, file_format: str, columns: list = None, where: str = None, progress=None) -> int:
+        """
+        Write the rows of a table to a file.
+
+        Args:
+            table_name (str): The table to export.
+            path (str): Path of the file to write.
+            file_format (str): "csv", "xlsx", "ods" or "ndjson".
+            columns (list): Names of the columns to export, in order. All columns if not given.
+            where (str): Optional SQL condition the exported rows must match.
+            progress (callable): Called with the number of rows written so far after each batch.
+
+        Returns:
+            int: The number of rows written.
+
+        Raises:
+            ValueError: If the table or one of the columns does not exist.
+        """
+        table_columns = self.table_columns(table_name)
+        if not table_columns:
+            raise ValueError(f"Table '{table_name}' does not exist.")
+
+        if columns:
+            by_name = {column["name"]: column for column in table_columns}
+            missing = [name for name in columns if name not in by_name]
+            if missing:
+                raise ValueError(f"Unknown columns: {', '.join(missing)}")
+            table_columns = [by_name[name] for name in columns]
+
+        column_list = ", ".join(f'"{column["name"]}"' for column in table_columns)
+        query = f'SELECT {column_list} FROM "{table_name}"'
+        if where:
+            query += f" WHERE {where}"
+
+        # BOOLEAN columns are stored as 1/0; give the writers real booleans like the Table Builder does
+        bool_columns = [idx for idx, column in enumerate(table_columns) if column["type"] == "BOOLEAN"]
+
+        cursor = self.connection.cursor()
+        written = 0
+        try:
+            cursor.execute(query)
+            with open_stream_writer(path, file_format) as writer:
+                writer.write_header([column["name"] for column in table_columns])
+                while True:
+                    rows = cursor.fetchmany(self.fetch_size)
+                    if not rows:
+                        break
+                    if bool_columns:
+                        rows = [self._convert_booleans(row, bool_columns) for row in rows]
+                    writer.write_rows(rows)
+                    written += len(rows)
+                    if progress:
+                        progress(written)
+        finally:
+            cursor.close()
+        return written
+
+    @staticmethod
+    def _convert_booleans(row: tuple, bool_columns: list) -> list:
+        row = list(row)
+        for idx in bool_columns:
+            if row[idx] in (0, 1):
+                row[idx] = bool(row[idx])
+        return row
@@ -0,0 +1,149 @@
+import json
+import sqlite3
+from .metadata import METADATA_TABLE_PREFIX
+
+# Metadata table holding the declared indexes of a database.
+INDEX_CATALOG_TABLE = f"{METADATA_TABLE_PREFIX}indexes"
+
+
+class IndexCatalog:
+
+    def __init__(self, connection: sqlite3.Connection):
+        """
+        Index definitions kept in a metadata table of the database, so they survive the table
+        being dropped and written again.
+
+        Saving a table from the Table Builder drops and re-creates it, which drops its indexes.
+        The declared indexes are created again once the rows are in, since building an index
+        after a bulk load is much faster than updating it on every insert.
+
+        :param connection: Connection to the database.
+        """
+        self.connection = connection
+
+    def ensure_catalog(self) -> None:
+        self.connection.execute(
+            f'CREATE TABLE IF NOT EXISTS "{INDEX_CATALOG_TABLE}" ('
+            "index_name TEXT PRIMARY KEY, table_name TEXT NOT NULL, columns TEXT NOT NULL, is_unique BOOLEAN NOT NULL DEFAULT 0)"
+        )
+
+    def has_catalog(self) -> bool:
+        return self.connection.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (INDEX_CATALOG_TABLE,)).fetchone() is not None
+
+    def table_columns(self, table_name: str) -> list:
+        return [column[1] for column in self.connection.execute(f'PRAGMA table_info("{table_name}")').fetchall()]
+
+    @staticmethod
+    def default_index_name(table_name: str, columns: list) -> str:
+        return f"idx_{table_name}_{'_'.join(columns)}"
+
+    def declare_index(self, table_name: str, columns: list, unique: bool = False, index_name: str = None) -> tuple:
+        """
+        Declare an index and create it straight away if the table is in the database. An index
+        on a table that has not been saved yet is created when the table is saved.
+
+        Args:
+            table_name (str): The indexed table.
+            columns (list): The indexed columns, in order.
+            unique (bool): Make it a UNIQUE index.
+            index_name (str): Name of the index. Defaults to idx_<table>_<columns>.
+
+        Returns:
+            tuple: The index name and whether the index was built now.
+
+        Raises:
+            ValueError: If no columns are given, an index with the name already exists or the
+                table has no such column.
+            sqlite3.IntegrityError: If a unique index is built on columns with duplicate values.
+        """
+        if not columns:
+            raise ValueError("An index needs at least one column.")
+        index_name = index_name or self.default_index_name(table_name, columns)
+        if self.connection.execute("SELECT 1 FROM sqlite_master WHERE type='index' AND name=?", (index_name,)).fetchone():
+            raise ValueError(f"An index named '{index_name}' already exists.")
+
+        table_columns = self.table_columns(table_name)
+        if table_columns:
+            missing = [name for name in columns if name not in table_columns]
+            if missing:
+                raise ValueError(f"Unknown columns: {', '.join(missing)}")
+
+        try:
+            self.ensure_catalog()
+            self.connection.execute(
+                f'INSERT OR REPLACE INTO "{INDEX_CATALOG_TABLE}" (index_name, table_name, columns, is_unique) VALUES (?, ?, ?, ?)',
+                (index_name, table_name, json.dumps(columns), int(unique))
+            )
+            if table_columns:
+                self._create_index(index_name, table_name, columns, unique)
+            self.connection.commit()
+        except BaseException:
+            self.connection.rollback()
+            raise
+        return index_name, bool(table_columns)
+
+    def drop_index(self, index_name: str) -> None:
+        """
+        Drop an index and remove its declaration.
+        """
+        try:
+            self.connection.execute(f'DROP INDEX IF EXISTS "{index_name}"')
+            if self.has_catalog():
+                self.connection.execute(f'DELETE FROM "{INDEX_CATALOG_TABLE}" WHERE index_name=?', (index_name,))
+            self.connection.commit()
+        except BaseException:
+            self.connection.rollback()
+            raise
+
+    def forget_table(self, table_name: str) -> None:
+        """
+        Remove the declarations of a table's indexes, e.g. after the table is deleted.
+        """
+        if self.has_catalog():
+            self.connection.execute(f'DELETE FROM "{INDEX_CATALOG_TABLE}" WHERE table_name=?', (table_name,))
+            self.connection.commit()
+
+    def declared_indexes(self, table_name: str = None) -> list:
+        """
+        Returns:
+            list: The declared indexes, of one table or all of them, as dictionaries with
+                "name", "table", "columns", "unique" and "built" keys. "built" is False when
+                the index is declared but missing from the database.
+        """
+        if not self.has_catalog():
+            return []
+        query = f'SELECT index_name, table_name, columns, is_unique FROM "{INDEX_CATALOG_TABLE}"'
+        parameters = ()
+        if table_name is not None:
+            query += " WHERE table_name=?"
+            parameters = (table_name,)
+        built = {row[0] for row in self.connection.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+        return [
+            {"name": name, "table": table, "columns": json.loads(columns), "unique": bool(unique), "built": name in built}
+            for name, table, columns, unique in self.connection.execute(query + " ORDER BY table_name, index_name", parameters)
+        ]
+
+    def rebuild_indexes(self, table_name: str) -> tuple:
+        """
+        Create the declared indexes of a table that are missing, e.g. after it was written again.
+        Indexes on columns the table no longer has are skipped.
+
+        Returns:
+            tuple: The names of the indexes built and of those skipped.
+        """
+        built, skipped = [], []
+        table_columns = set(self.table_columns(table_name))
+        for index in self.declared_indexes(table_name):
+            if index["built"]:
+                continue
+            if not table_columns.issuperset(index["columns"]):
+                skipped.append(index["name"])
+                continue
+            self._create_index(index["name"], table_name, index["columns"], index["unique"])
+            built.append(index["name"])
+        self.connection.commit()
+        return built, skipped
+
+    def _create_index(self, index_name: str, table_name: str, columns: list, unique: bool) -> None:
+        column_list = ", ".join(f'"{name}"' for name in columns)
+        self.connection.execute(f'CREATE {"UNIQUE " if unique else ""}INDEX IF NOT EXISTS "{index_name}" ON "{table_name}" ({column_list})')
@@ -0,0 +1,123 @@
+import os
+import sqlite3
+import time
+
+# Auto-maintenance vacuums a database once this share of its pages is free.
+AUTO_VACUUM_FREELIST_RATIO = 0.25
+
+# Databases with fewer free pages than this are not worth vacuuming.
+AUTO_VACUUM_MIN_FREE_PAGES = 256
+
+# Most problems listed by an integrity check.
+INTEGRITY_CHECK_MAX_ERRORS = 100
+
+
+class DatabaseMaintenance:
+
+    def __init__(self, connection: sqlite3.Connection, database_path: str):
+        """
+        Compaction, statistics and consistency checks for one SQLite database.
+
+        Dropping and recreating tables, as every overwrite save does, leaves the old pages on the
+        freelist: the file keeps its size and the pages are only reused by later writes. VACUUM
+        rebuilds the file without them. ANALYZE stores row count and selectivity statistics that
+        the query planner uses to choose between indexes.
+
+        :param connection: Connection to the database.
+        :param database_path: Path of the database file, used to report its size.
+        """
+        self.connection = connection
+        self.database_path = database_path
+
+    def file_size(self) -> int:
+        """
+        Returns:
+            int: Size in bytes of the database file and its write-ahead log, if it has one.
+        """
+        return sum(os.path.getsize(path) for path in (self.database_path, self.database_path + "-wal") if os.path.exists(path))
+
+    def page_counts(self) -> tuple:
+        """
+        Returns:
+            tuple: The number of pages in the database and the number of them that are free.
+        """
+        page_count = self.connection.execute("PRAGMA page_count").fetchone()[0]
+        freelist_count = self.connection.execute("PRAGMA freelist_count").fetchone()[0]
+        return page_count, freelist_count
+
+    def freelist_ratio(self) -> float:
+        page_count, freelist_count = self.page_counts()
+        return freelist_count / page_count if page_count else 0.0
+
+    def _timed(self, statement: str, parameters: tuple = ()) -> tuple:
+        """
+        Run a maintenance statement outside of any transaction.
+
+        Returns:
+            tuple: File size before, file size after, and seconds taken.
+        """
+        # VACUUM cannot run inside a transaction
+        self.connection.commit()
+        before = self.file_size()
+        start = time.perf_counter()
+        self.connection.execute(statement, parameters)
+        elapsed = time.perf_counter() - start
+        return before, self.file_size(), elapsed
+
+    def vacuum(self) -> tuple:
+        """
+        Rebuild the database file without its free pages.
+
+        Returns:
+            tuple: File size before, file size after, and seconds taken.
+        """
+        return self._timed("VACUUM")
+
+    def vacuum_into(self, target_path: str) -> tuple:
+        """
+        Write a compacted copy of the database to a new file. The database itself is only read,
+        so it stays usable while the copy is written.
+
+        Returns:
+            tuple: Size of the database, size of the copy, and seconds taken.
+
+        Raises:
+            ValueError: If the target file already exists.
+        """
+        if os.path.exists(target_path):
+            raise ValueError(f"'{target_path}' already exists.")
+        before, _, elapsed = self._timed("VACUUM INTO ?", (target_path,))
+        return before, os.path.getsize(target_path), elapsed
+
+    def analyze(self, table_name: str = None) -> tuple:
+        """
+        Gather query planner statistics for one table, or for the whole database.
+
+        Returns:
+            tuple: File size before, file size after, and seconds taken.
+        """
+        return self._timed(f'ANALYZE "{table_name}"' if table_name else "ANALYZE")
+
+    def optimize(self) -> tuple:
+        """
+        Let SQLite refresh the statistics it judges out of date. Much cheaper than a full ANALYZE.
+
+        Returns:
+            tuple: File size before, file size after, and seconds taken.
+        """
+        return self._timed("PRAGMA optimize")
+
+    def integrity_check(self, max_errors: int = INTEGRITY_CHECK_MAX_ERRORS) -> tuple:
+        """
+        Returns:
+            tuple: The problems found, empty if the database is intact, and seconds taken.
+        """
+        start = time.perf_counter()
+        rows = self.connection.execute(f"PRAGMA integrity_check({int(max_errors)})").fetchall()
+        elapsed = time.perf_counter() - start
+        problems = [row[0] for row in rows if row[0] != "ok"]
+        return problems, elapsed
+
+    def needs_vacuum(self, ratio: float = AUTO_VACUUM_FREELIST_RATIO, min_free_pages: int = AUTO_VACUUM_MIN_FREE_PAGES) -> bool:
+        page_count, freelist_count = self.page_counts()
+        return freelist_count >= min_free_pages and freelist_count >= ratio * page_count
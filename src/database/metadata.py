@@ -0,0 +1,11 @@
+# Tables the Table Builder keeps its own bookkeeping in start with this prefix. They are hidden
+# from table listings.
+METADATA_TABLE_PREFIX = "_table_builder_"
+
+
+def is_metadata_table(table_name: str) -> bool:
+    """
+    Returns:
+        bool: True for SQLite's internal tables and the Table Builder's metadata tables.
+    """
+    return table_name.startswith(METADATA_TABLE_PREFIX) or table_name.startswith("sqlite_")
@@ -0,0 +1,164 @@
+import sqlite3
+from .indexes import IndexCatalog
+
+# How a merge treats the rows it adds.
+MERGE_MODES = {
+    "append": "Add every row.",
+    "skip": "Skip rows identical to a row already in the target table, and repeated rows.",
+    "ignore": "Skip rows that break a unique index of the target table.",
+    "replace": "Replace the target rows that share a unique index value with the new rows.",
+}
+
+
+class TableTransfer:
+
+    def __init__(self, connection: sqlite3.Connection):
+        """
+        Copies and merges tables of the connected database into other database files.
+
+        The target database is attached to the connection and the rows are moved with one
+        `INSERT ... SELECT`, so they never pass through Python. All writes to the target happen
+        in one transaction: a failed transfer leaves the target as it was.
+
+        :param connection: Connection to the database holding the source table.
+        """
+        self.connection = connection
+
+    def _attach(self, target_path: str) -> sqlite3.Cursor:
+        # ATTACH cannot run inside a transaction
+        self.connection.commit()
+        cursor = self.connection.cursor()
+        cursor.execute("ATTACH DATABASE ? AS transfer_target", (target_path,))
+        return cursor
+
+    def _detach(self, cursor: sqlite3.Cursor) -> None:
+        cursor.execute("DETACH DATABASE transfer_target")
+        cursor.close()
+
+    def _columns(self, cursor: sqlite3.Cursor, schema: str, table_name: str) -> list:
+        """
+        Returns:
+            list: (name, declared type) of every column of a table, empty if it does not exist.
+        """
+        return [(column[1], column[2]) for column in cursor.execute(f'PRAGMA {schema}.table_info("{table_name}")').fetchall()]
+
+    def _rebuild_target_indexes(self, target_path: str, table_name: str) -> list:
+        """
+        Create the indexes the target database declares for a table it received.
+
+        Returns:
+            list: The names of the indexes built.
+        """
+        connection = sqlite3.connect(target_path)
+        try:
+            catalog = IndexCatalog(connection)
+            if not catalog.has_catalog():
+                return []
+            built, _ = catalog.rebuild_indexes(table_name)
+            return built
+        finally:
+            connection.close()
+
+    def copy_table(self, table_name: str, target_path: str, target_table: str = None, replace: bool = False) -> int:
+        """
+        Copy a table, with its column types, into another database.
+
+        Args:
+            table_name (str): The table to copy.
+            target_path (str): Path of the target database file.
+            target_table (str): Name of the new table. Defaults to the source table's name.
+            replace (bool): Drop a table with the same name in the target first.
+
+        Returns:
+            int: The number of rows copied.
+
+        Raises:
+            ValueError: If the source table does not exist, or the target table does and replace is off.
+        """
+        target_table = target_table or table_name
+        cursor = self._attach(target_path)
+        try:
+            columns = self._columns(cursor, "main", table_name)
+            if not columns:
+                raise ValueError(f"Table '{table_name}' does not exist.")
+            if self._columns(cursor, "transfer_target", target_table) and not replace:
+                raise ValueError(f"Table '{target_table}' already exists in the target database.")
+
+            quoted_target = f'transfer_target."{target_table}"'
+            columns_definition = ", ".join(f'"{name}" {data_type}' for name, data_type in columns)
+            cursor.execute("BEGIN")
+            try:
+                cursor.execute(f"DROP TABLE IF EXISTS {quoted_target}")
+                cursor.execute(f"CREATE TABLE {quoted_target} ({columns_definition})")
+                cursor.execute(f'INSERT INTO {quoted_target} SELECT * FROM main."{table_name}"')
+                copied = cursor.rowcount
+                self.connection.commit()
+            except BaseException:
+                self.connection.rollback()
+                raise
+        finally:
+            self._detach(cursor)
+
+        # Indexes are built after the rows are in, as on every other bulk load
+        self._rebuild_target_indexes(target_path, target_table)
+        return copied
+
+    def merge_table(self, table_name: str, target_path: str, target_table: str = None, mode: str = "append") -> int:
+        """
+        Add the rows of a table to a table of another database, matching columns by name.
+        The target table is created like `copy_table` when it does not exist yet.
+
+        Args:
+            table_name (str): The table whose rows are added.
+            target_path (str): Path of the target database file.
+            target_table (str): The table the rows are added to. Defaults to the source table's name.
+            mode (str): One of MERGE_MODES.
+
+        Returns:
+            int: The number of rows added or replaced.
+
+        Raises:
+            ValueError: If the mode is unknown, the source table does not exist, or the tables
+                share no columns.
+        """
+        if mode not in MERGE_MODES:
+            raise ValueError(f"Unknown merge mode '{mode}'. Use one of: {', '.join(MERGE_MODES)}.")
+        target_table = target_table or table_name
+
+        cursor = self._attach(target_path)
+        try:
+            source_columns = self._columns(cursor, "main", table_name)
+            if not source_columns:
+                raise ValueError(f"Table '{table_name}' does not exist.")
+            target_columns = self._columns(cursor, "transfer_target", target_table)
+        finally:
+            self._detach(cursor)
+        if not target_columns:
+            return self.copy_table(table_name, target_path, target_table)
+
+        target_names = {name for name, _ in target_columns}
+        shared = [name for name, _ in source_columns if name in target_names]
+        if not shared:
+            raise ValueError(f"Tables '{table_name}' and '{target_table}' have no columns in common.")
+        column_list = ", ".join(f'"{name}"' for name in shared)
+        quoted_target = f'transfer_target."{target_table}"'
+
+        statement = f'INSERT INTO {quoted_target} ({column_list}) SELECT {column_list} FROM main."{table_name}"'
+        if mode == "skip":
+            statement += f" EXCEPT SELECT {column_list} FROM {quoted_target}"
+        elif mode in ("ignore", "replace"):
+            statement = statement.replace("INSERT INTO", f"INSERT OR {mode.upper()} INTO", 1)
+
+        cursor = self._attach(target_path)
+        try:
+            cursor.execute("BEGIN")
+            try:
+                cursor.execute(statement)
+                merged = cursor.rowcount
+                self.connection.commit()
+            except BaseException:
+                self.connection.rollback()
+                raise
+        finally:
+            self._detach(cursor)
+        return merged
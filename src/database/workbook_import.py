@@ -0,0 +1,245 @@
+import datetime
+import itertools
+import os
+import sqlite3
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from openpyxl import load_workbook
+from table_builder.table_utils import InputHandler
+from table_builder.io.ods_reader import ODSReader
+from .bulk_import import IMPORT_BATCH_SIZE, SQL_TYPES, TYPE_SAMPLE_ROWS
+
+WORKBOOK_EXTENSIONS = (".xlsx", ".xlsm", ".ods")
+
+
+def list_sheets(path: str) -> list:
+    """
+    Args:
+        path (str): Path to an .xlsx, .xlsm or .ods workbook.
+
+    Returns:
+        list: (sheet name, data rows, columns) of every sheet, in workbook order. Data rows
+            exclude the header row. XLSX sizes come from the sheet's stored dimensions and
+            may be None when the file does not record them.
+    """
+    if path.lower().endswith(".ods"):
+        return [(name, max(rows - 1, 0), columns) for name, rows, columns in ODSReader(path).sheet_dimensions()]
+
+    workbook = load_workbook(path, read_only=True)
+    try:
+        sheets = []
+        for sheet in workbook.worksheets:
+            rows = None if sheet.max_row is None else max(sheet.max_row - 1, 0)
+            sheets.append((sheet.title, rows, sheet.max_column))
+        return sheets
+    finally:
+        workbook.close()
+
+
+def iter_sheet_rows(path: str, sheet_name: str):
+    """
+    Yields:
+        The rows of one sheet of a workbook, header first, reading only that sheet.
+    """
+    if path.lower().endswith(".ods"):
+        yield from ODSReader(path).iter_rows(sheet_name)
+        return
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        yield from workbook[sheet_name].iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def parse_sheet(path: str, sheet_name: str, database_path: str, infer_types: bool = True, batch_size: int = IMPORT_BATCH_SIZE, sample_rows: int = TYPE_SAMPLE_ROWS) -> int:
+    """
+    Parse one sheet into a table named "sheet" in a new SQLite database file. Runs in a worker
+    process, so every sheet of a workbook is parsed at the same time.
+
+    Returns:
+        int: The number of rows written.
+
+    Raises:
+        ValueError: If the sheet is empty.
+    """
+    rows = iter(iter_sheet_rows(path, sheet_name))
+    header = next(rows, None)
+    if not header or all(cell is None for cell in header):
+        raise ValueError(f"Sheet '{sheet_name}' is empty.")
+
+    names = _column_names(header)
+    width = len(names)
+    sample = [_prepare_row(row, width) for row in itertools.islice(rows, sample_rows)]
+    types = _sample_types(sample, width) if infer_types else ["str"] * width
+    rows = itertools.chain(sample, (_prepare_row(row, width) for row in rows))
+
+    bool_columns = [idx for idx, data_type in enumerate(types) if data_type == "bool"]
+    if bool_columns:
+        rows = _convert_booleans(rows, bool_columns)
+
+    columns_definition = ", ".join(f'"{name}" {SQL_TYPES[data_type]}' for name, data_type in zip(names, types))
+    placeholders = ", ".join("?" for _ in names)
+
+    connection = sqlite3.connect(database_path)
+    try:
+        # A scratch file that is deleted after it is copied: durability is not needed
+        connection.execute("PRAGMA journal_mode=OFF")
+        connection.execute("PRAGMA synchronous=OFF")
+        connection.execute(f"CREATE TABLE sheet ({columns_definition})")
+        written = 0
+        while batch := list(itertools.islice(rows, batch_size)):
+            connection.executemany(f"INSERT INTO sheet VALUES ({placeholders})", batch)
+            written += len(batch)
+        connection.commit()
+    finally:
+        connection.close()
+    return written
+
+
+def _column_names(header) -> list:
+    """
+    Turn a header row into unique column names, naming blank headers after their position.
+    """
+    names = []
+    seen = set()
+    for idx, cell in enumerate(header, start=1):
+        name = str(cell).strip() if cell is not None and str(cell).strip() else f"Column {idx}"
+        base, suffix = name, 2
+        while name.lower() in seen:
+            name = f"{base}_{suffix}"
+            suffix += 1
+        seen.add(name.lower())
+        names.append(name)
+    return names
+
+
+def _prepare_row(row, width: int) -> list:
+    """
+    Fit a row to the header width, store empty text as NULL and dates and times as ISO text.
+    """
+    row = list(row[:width])
+    if len(row) < width:
+        row.extend([None] * (width - len(row)))
+    for idx, value in enumerate(row):
+        if value == "":
+            row[idx] = None
+        elif isinstance(value, (datetime.date, datetime.time)):
+            row[idx] = value.isoformat()
+    return row
+
+
+def _sample_types(sample: list, width: int) -> list:
+    """
+    Infer a type per column from the non-empty cells of the sample, as the CSV importer does.
+    """
+    types = []
+    for idx in range(width):
+        found = {InputHandler.infer_data_type(row[idx]) for row in sample if row[idx] is not None}
+        if found == {"int", "float"}:
+            found = {"float"}
+        types.append(found.pop() if len(found) == 1 else "str")
+    return types
+
+
+def _convert_booleans(rows, bool_columns: list):
+    booleans = {"true": 1, "false": 0}
+    for row in rows:
+        for idx in bool_columns:
+            if isinstance(row[idx], str):
+                row[idx] = booleans.get(row[idx].strip().lower(), row[idx])
+        yield row
+
+
+class WorkbookImporter:
+
+    def __init__(self, connection: sqlite3.Connection, infer_types: bool = True, max_workers: int = None):
+        """
+        Imports the sheets of an XLSX or ODS workbook into tables of a SQLite database.
+
+        Sheets are parsed in parallel worker processes, each writing its sheet to a scratch
+        database file. As each sheet finishes, its rows are copied into the target database
+        with one `INSERT ... SELECT` through ATTACH, which runs inside SQLite. The import takes
+        about as long as the largest sheet instead of the sum of all of them.
+
+        :param connection: Connection to the database the tables are created in.
+        :param infer_types: Infer column types from each sheet's first rows. When off, every column is TEXT.
+        :param max_workers: Most sheets parsed at once. Defaults to the number of CPUs.
+        """
+        self.connection = connection
+        self.infer_types = infer_types
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def import_sheets(self, path: str, sheets: dict, replace: bool = False, progress=None) -> dict:
+        """
+        Args:
+            path (str): Path to the workbook.
+            sheets (dict): Sheet name mapped to the name of the table to create. Larger sheets
+                should come first so they start parsing first.
+            replace (bool): Drop existing tables with the same names.
+            progress (callable): Called with the name of each sheet once it is imported.
+
+        Returns:
+            dict: Table name mapped to the number of rows imported.
+
+        Raises:
+            ValueError: If a table already exists and replace is off, or a sheet is empty.
+        """
+        if not replace:
+            existing = [name for name in sheets.values()
+                        if self.connection.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (name,)).fetchone()]
+            if existing:
+                raise ValueError(f"Tables already exist: {', '.join(existing)}")
+
+        imported = {}
+        with tempfile.TemporaryDirectory(prefix="workbook_import_") as scratch_directory:
+            workers = min(self.max_workers, len(sheets)) or 1
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {}
+                for number, (sheet_name, table_name) in enumerate(sheets.items()):
+                    database_path = os.path.join(scratch_directory, f"sheet_{number}.db")
+                    future = executor.submit(parse_sheet, path, sheet_name, database_path, self.infer_types)
+                    futures[future] = (sheet_name, table_name, database_path)
+
+                try:
+                    for future in as_completed(futures):
+                        sheet_name, table_name, database_path = futures[future]
+                        future.result()
+                        imported[table_name] = self._copy_sheet(database_path, table_name, replace)
+                        os.remove(database_path)
+                        if progress:
+                            progress(sheet_name)
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+        return imported
+
+    def _copy_sheet(self, database_path: str, table_name: str, replace: bool) -> int:
+        """
+        Copy the parsed table of a scratch database into the target database as `table_name`.
+
+        Returns:
+            int: The number of rows copied.
+        """
+        quoted_table_name = f'"{table_name}"'
+        cursor = self.connection.cursor()
+        cursor.execute("ATTACH DATABASE ? AS sheet_source", (database_path,))
+        try:
+            columns = cursor.execute("PRAGMA sheet_source.table_info(sheet)").fetchall()
+            columns_definition = ", ".join(f'"{column[1]}" {column[2]}' for column in columns)
+            cursor.execute("BEGIN")
+            try:
+                if replace:
+                    cursor.execute(f"DROP TABLE IF EXISTS main.{quoted_table_name}")
+                cursor.execute(f"CREATE TABLE main.{quoted_table_name} ({columns_definition})")
+                cursor.execute(f"INSERT INTO main.{quoted_table_name} SELECT * FROM sheet_source.sheet")
+                copied = cursor.rowcount
+                self.connection.commit()
+            except BaseException:
+                self.connection.rollback()
+                raise
+        finally:
+            cursor.execute("DETACH DATABASE sheet_source")
+            cursor.close()
+        return copied
@@ -52,7 +52,12 @@ class InstructionMessage:
 - [bold cyan]add row[/]: Adds a row to the table.
 - [bold cyan]remove column[/]: Removes a column from the table.
 - [bold cyan]remove row[/]: Removes a row from the table.
-- [bold cyan]edit cell[/]: Allows you to edit the content of a cell in the table.
+- [bold cyan]edit cell[/]: Allows you to edit the content of a cell in the table. Add the cell to skip the picker, e.g. 'edit cell 2,3' or 'edit cell id=7 price'.
+- [bold cyan]find[/]: Finds the cells containing some text, ignoring case, e.g. 'find acme'. Matches are shown a page at a time.
+- [bold cyan]sort[/]: Sorts the rows on one or more columns, compared as their types, e.g. 'sort region, price desc'.
+- [bold cyan]dedupe[/]: Removes duplicate rows, comparing whole rows or some columns, e.g. 'dedupe region, name keep last'.
+- [bold cyan]describe[/]: Shows statistics of every column, or of the columns given, e.g. 'describe price, region'. They are cached and kept current as the table changes.
+- [bold cyan]diff[/]: Compares two versions of a table, files, database tables or the working table, by key columns and shows the rows added, removed and changed.
 - [bold cyan]print table[/]: Prints the table to the screen.
 - [bold cyan]rename[/]: Renames the table.
 - [bold cyan]print table data[/]: Prints the JSON data for the table.
@@ -60,11 +65,24 @@ class InstructionMessage:
 - [bold cyan]load table[/]: Loads a table from the database.
 - [bold cyan]delete table[/]: Deletes the table from the database.
 - [bold cyan]save table[/]: Saves the table to the database or overwrite existing one.
+- [bold cyan]create index[/]: Adds an index on columns of a database table. It is re-created every time the table is saved.
+- [bold cyan]drop index[/]: Removes an index from the database.
+- [bold cyan]list indexes[/]: Lists the indexes of the database and whether they are built.
+- [bold cyan]sql[/]: Runs SQL statements against the database. Results are shown a page at a time and can be loaded into the table. 'explain <query>' shows the query plan, and Ctrl+C cancels a running statement.
 - [bold cyan]current table[/]: Shows the current working table.
+- [bold cyan]set load options[/]: Chooses the columns, a condition on the rows (e.g. region = North and price >= 10), rows to skip and most rows that the load commands read. Leave everything empty to load whole files again.
+- [bold cyan]preview[/]: Loads and prints a sample of a file or database table, the first rows or a random sample, before a full load.
+- [bold cyan]load full[/]: Loads the whole file or table of the last preview.
 - [bold cyan]load csv[/]: Loads a CSV file into a formatted table.
 - [bold cyan]load xl[/]: Loads a XLSX file into the Table Builder.
 - [bold cyan]load ods[/]: Loads a ODS file into the Table Builder.
+- [bold cyan]load ods range[/]: Loads part of a ODS file: a chosen sheet, a range of rows and a set of columns.
+- [bold cyan]open csv indexed[/]: Pages through a large CSV file without loading it, using a saved index of row positions. A page can be loaded into the table.
 - [bold cyan]load csv batch[/]: Loads a bunch of CSV files automatically from a directory into the database.
+- [bold cyan]import csv to table[/]: Streams a CSV file straight into a database table without loading it into the Table Builder. Use it for very large files.
+- [bold cyan]load workbook[/]: Imports the sheets you choose from a XLSX or ODS workbook into the database, one table per sheet.
+- [bold cyan]cache info[/]: Shows the files in the import cache, which makes loading an unchanged file again near instant.
+- [bold cyan]purge cache[/]: Removes every file from the import cache.
 - [bold cyan]list tables[/]: Lists the available tables from the database.
 - [bold cyan]save csv[/]: Saves the data from the table to a CSV file.
 - [bold cyan]save xl[/]: Saves the data from the table to a XLSX file.
@@ -107,10 +125,24 @@ Below you can find your current settings.
 - [bold cyan]create database:[/] Create a new SQLite database and set it as the current database.
 - [bold cyan]delete database:[/] Delete an existing SQLite database.
 - [bold cyan]list databases:[/] List all databases in a specified directory.
+- [bold cyan]database catalog:[/] Show the size, table count, row count, pages, free pages and last change of every database.
 - [bold cyan]select database:[/] Choose a database from a list of available databases.
 - [bold cyan]current database:[/] Show the currently connected database.
 - [bold cyan]close database:[/] Close the current database connection.
 - [bold cyan]search:[/] Search through the current database based on a query. Returns information on the table, type, and position.
+- [bold cyan]search all databases:[/] Search every database in the databases folder at once. Shows the best matches, whole-value matches first.
+- [bold cyan]import csv to table:[/] Stream a CSV file straight into a new table of the current database. Works with files larger than memory.
+- [bold cyan]export table:[/] Stream a table, or the rows and columns you choose, to a CSV, XLSX, ODS or NDJSON file without loading it.
+- [bold cyan]load workbook:[/] List the sheets of a XLSX or ODS workbook and import the ones you choose, or all of them, as tables of the current database.
+- [bold cyan]convert file:[/] Stream a CSV file to a CSV, XLSX, ODS or NDJSON file or a table, optionally deduplicated and sorted. Sorts larger than memory are merged from sorted pieces on disk.
+- [bold cyan]sql:[/] Run SQL statements against the current database. Results are shown a page at a time, and one can be opened in the Table Builder. 'explain <query>' shows the query plan, and Ctrl+C cancels a running statement.
+- [bold cyan]copy table to <database>:[/] Copy a table of the current database into another database, inside SQLite and without loading it.
+- [bold cyan]merge table into <database>:[/] Add the rows of a table to a table of another database. Choose to append all rows, skip rows it already has, or resolve unique index conflicts with ignore or replace.
+- [bold cyan]vacuum:[/] Shrink the current database by removing the free space left by deleted and overwritten tables.
+- [bold cyan]vacuum into:[/] Write a compacted copy of the current database to a new file, leaving the database as it is.
+- [bold cyan]analyze:[/] Gather statistics on every table and index so queries pick the best index.
+- [bold cyan]optimize:[/] Refresh only the statistics SQLite considers out of date. Much quicker than analyze.
+- [bold cyan]integrity check:[/] Check the current database for corruption.
 - [bold cyan]help:[/] Print this instruction screen.
 - [bold cyan]exit:[/] Return to the main menu.
 
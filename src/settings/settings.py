@@ -9,6 +9,16 @@ from rich.panel import Panel
 from .styles.styles import StylesSetting
 from app_utils.app_utils import get_resource_path
 
+# Factory settings, also used for settings missing from an older settings file.
+DEFAULT_SETTINGS = {
+    "autoprint_table": False,
+    "hide_instructions": False,
+    "auto_update": False,
+    "infer_data_types": True,
+    "import_cache": True,
+    "auto_maintenance": False,
+}
+
 class Settings:
     
     def __init__(self, console: Console):
@@ -31,7 +41,9 @@ class Settings:
             "autoprint_table": "Automatically prints the table after a change has been made.",
             "hide_instructions": "Hide the instructions message when using the app.",
             "auto_update": "Automatically update the database table when a change is made.",
-            "infer_data_types": "Enable automatic type inference when loading data."
+            "infer_data_types": "Enable automatic type inference when loading data.",
+            "import_cache": "Cache parsed CSV, XLSX, ODS and PDF files so loading them again is near instant.",
+            "auto_maintenance": "Refresh query statistics after saves and imports, and vacuum a database once a quarter of it is free space."
         }
         
     def launch_settings(self) -> None:
@@ -72,18 +84,13 @@ class Settings:
         """
         try:
             with open(self.settings_file, 'r') as f:
-                settings =  json.load(f)
+                settings = {**DEFAULT_SETTINGS, **json.load(f)}
         except (FileNotFoundError, json.JSONDecodeError):
 
             self.system_message.create_error_message("Unable to load settings. Loading defaults.")
 
             # Default settings if file is missing or corrupted
-            settings =  {
-                "autoprint_table": False,
-                "hide_instructions": False,
-                "auto_update": False,
-                "infer_data_types": True
-                }
+            settings = dict(DEFAULT_SETTINGS)
         return settings        
 
     def save_settings(self) -> None:
@@ -160,12 +167,7 @@ class Settings:
 
 
         if confirm == "y":
-            self.settings = {
-                "autoprint_table": False,
-                "hide_instructions": False,
-                "auto_update": False,
-                "infer_data_types": True,
-                }
+            self.settings = dict(DEFAULT_SETTINGS)
             self.save_settings()
             self.system_message.create_information_message("Settings reset to defaults.")
         elif confirm == "n":
@@ -13,6 +13,15 @@ from .database_handler import DatabaseHandler
 from .table_operations import TableOperations
 from .table_display import TableDisplay
 from .table_utils import InputHandler, TableSpecs
+from .table_encoding import TableEncoding
+from .table_nulls import TableNulls
+from .table_search import TableSearch
+from .table_stats import TableStats
+from .import_cache import ImportCache
+from .sql_console import SQLConsole
+from .table_preview import TablePreview
+from .table_diff import TableDiff
+from .load_options import LoadOptions
 
 class TableBuilder:
 
@@ -34,13 +43,37 @@ class TableBuilder:
         self.table_display = TableDisplay(self)
         self.input_handler = InputHandler(self)
         self.table_specs = TableSpecs(self)
+        self.table_encoding = TableEncoding(self)
+        self.table_nulls = TableNulls(self)
+        self.table_search = TableSearch(self)
+        self.table_stats = TableStats(self)
+        self.import_cache = ImportCache(self)
+        self.sql_console = SQLConsole(self)
+        self.table_preview = TablePreview(self)
+        self.table_diff = TableDiff(self)
+
+        # Components that derive data from the table and are told about every change to it
+        self.table_trackers = [self.table_encoding, self.table_nulls, self.table_display.render_cache, self.table_search, self.table_stats]
 
         
         if not name_on_start:
             self.name = self.table_operations.name_table()
         self.table_data = {"columns": [], "rows": []}
         self.table_saved = False
+        # Columns and rows every loader reads; changed with 'set load options'
+        self.load_options = LoadOptions()
+
+
+    def notify(self, event: str, *args) -> None:
+        """
+        Pass a table change on to every tracker.
 
+        Args:
+            event (str): The tracker method to call, e.g. "row_added" or "table_loaded".
+            args: Arguments for the event.
+        """
+        for tracker in self.table_trackers:
+            getattr(tracker, event)(*args)
 
     def launch_builder(self, print_on_start: bool = False):
         from .table_commands import TableCommands
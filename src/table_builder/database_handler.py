@@ -1,4 +1,12 @@
+import json
+import random
 import sqlite3
+from rich.table import Table
+from database.indexes import IndexCatalog
+from .load_options import LoadOptions
+
+# Extra rowids drawn for a random sample, to make up for rowids freed by deleted rows.
+SAMPLE_ROWID_OVERDRAW = 1.2
 
 class DatabaseHandler:
 
@@ -31,8 +39,7 @@ class DatabaseHandler:
             quoted_table_name = f'"{self.table_builder.name}"'
 
             # Check if the table exists
-            self.table_builder.database.cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            existing_tables = [row[0] for row in self.table_builder.database.cursor.fetchall()]
+            existing_tables = self.table_builder.database.list_tables()
 
             if self.table_builder.name in existing_tables:
                 if self.table_builder.settings.get_auto_update() == "on":
@@ -41,7 +48,7 @@ class DatabaseHandler:
                 else:
                     # Prompt the user for action
                     action = self.table_builder.input_handler.get_user_input(
-                        f"[bold yellow]Table '[bold cyan]{self.name}[/]' already exists. "
+                        f"[bold yellow]Table '[bold cyan]{self.table_builder.name}[/]' already exists. "
                         "Do you want to overwrite it or save with a new name? (overwrite/new)[/]: "
                     ).strip().lower()
 
@@ -83,57 +90,115 @@ class DatabaseHandler:
             # Create the table
             self.table_builder.database.cursor.execute(f"CREATE TABLE {quoted_table_name} ({columns_definition_str})")
 
-            # Insert rows
-            for row in self.table_builder.table_data["rows"]:
-                column_names = ", ".join(f'"{col["name"]}"' for col in self.table_builder.table_data["columns"])
-                placeholders = ", ".join("?" for _ in self.table_builder.table_data["columns"])
-                values = [row.get(col["name"], None) for col in self.table_builder.table_data["columns"]]
-                self.table_builder.database.cursor.execute(
-                    f"INSERT INTO {quoted_table_name} ({column_names}) VALUES ({placeholders})", values
-                )
+            # Insert rows; missing (None) cells are stored as NULL
+            column_names = ", ".join(f'"{col["name"]}"' for col in self.table_builder.table_data["columns"])
+            placeholders = ", ".join("?" for _ in self.table_builder.table_data["columns"])
+            self.table_builder.database.cursor.executemany(
+                f"INSERT INTO {quoted_table_name} ({column_names}) VALUES ({placeholders})",
+                self.table_builder.table_specs.iter_row_values()
+            )
 
             self.table_builder.database.connection.commit()
             self.table_builder.table_saved = True
             self.table_builder.system_message.create_information_message(
                 f"Table '[bold cyan]{self.table_builder.name}[/]' saved to database '[bold red]{self.table_builder.database.get_current_database()}[/]'."
             )
+            # Indexes are built after the rows are in; updating them on every insert is much slower
+            self.table_builder.database.rebuild_indexes(self.table_builder.name)
+            self.table_builder.database.auto_maintain([self.table_builder.name])
         except Exception as e:
             self.table_builder.system_message.create_error_message(f"Failed to save table to database: {e}")
 
-    def load_from_database(self) -> None:
+    def sample_rowids(self, table_name: str, size: int, rng: random.Random = None) -> list:
+        """
+        Pick the rowids of a uniform random sample of a table without reading the table.
+
+        Rowids are drawn at random between the smallest and largest rowid, with some extra to
+        cover the gaps deleted rows leave, and only those rows are then looked up. This reads
+        `size` rows through the rowid b-tree instead of sorting the whole table by random(),
+        like TABLESAMPLE in other databases.
+
+        Returns:
+            list: The rowids to load, or None if the table has no rowids or too many gaps, or is
+                not larger than the sample, in which case the sample is drawn by SQLite.
         """
-        Load a table from the connected database, including column data types.
+        rng = rng or random.Random()
+        cursor = self.table_builder.database.connection.cursor()
+        try:
+            # SQLite only reads the ends of the b-tree when min() or max() is alone in the query
+            low = cursor.execute(f'SELECT min(rowid) FROM "{table_name}"').fetchone()[0]
+            high = cursor.execute(f'SELECT max(rowid) FROM "{table_name}"').fetchone()[0]
+            if low is None:
+                return None
+            span = high - low + 1
+            if span <= size:
+                return None
+            drawn = rng.sample(range(low, high + 1), min(span, int(size * SAMPLE_ROWID_OVERDRAW) + 10))
+            found = [row[0] for row in cursor.execute(
+                f'SELECT rowid FROM "{table_name}" WHERE rowid IN (SELECT value FROM json_each(?))', (json.dumps(drawn),)
+            )]
+        except sqlite3.OperationalError:
+            # WITHOUT ROWID tables, or SQLite built without JSON support
+            return None
+        finally:
+            cursor.close()
+        if len(found) < size:
+            return None
+        # Every drawn rowid was equally likely, so any `size` of the rows found are a uniform sample
+        return sorted(rng.sample(found, size))
+
+    def load_from_database(self, options: LoadOptions = None, table_name: str = None) -> str:
+        """
+        Load a table from the connected database, including column data types. The load options
+        become part of the query, so SQLite only returns the selected columns and rows.
+
+        Args:
+            options (LoadOptions): The columns and rows to load. Defaults to the table's load options.
+            table_name (str): The table to load. If not provided, prompts the user.
+
+        Returns:
+            str: The name of the table loaded, or None if nothing was loaded.
         """
         if not self.ensure_connected_database():
-            return
+            return None
 
         try:
-            self.table_builder.database.cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            tables = [row[0] for row in self.table_builder.database.cursor.fetchall()]
+            tables = self.table_builder.database.list_tables()
 
             if not tables:
                 self.table_builder.system_message.create_error_message("No tables found in database.")
-                return
+                return None
 
-            self.table_builder.console.print("[bold green]Available Tables:[/]")
-            for idx, table in enumerate(tables, start=1):
-                self.table_builder.console.print(f"{idx}. {table}")
+            if table_name is None:
+                self.table_builder.console.print("[bold green]Available Tables:[/]")
+                for idx, table in enumerate(tables, start=1):
+                    self.table_builder.console.print(f"{idx}. {table}")
 
-            table_number = int(self.table_builder.input_handler.get_user_input("[bold yellow]Enter the number of the table to load[/]: ")) - 1
-            
-            if table_number is None:
-                return
-            
-            if not (0 <= table_number < len(tables)):
-                self.table_builder.system_message.create_error_message("Invalid table number.")
-                return
+                table_number = int(self.table_builder.input_handler.get_user_input("[bold yellow]Enter the number of the table to load[/]: ")) - 1
+
+                if table_number is None:
+                    return None
+
+                if not (0 <= table_number < len(tables)):
+                    self.table_builder.system_message.create_error_message("Invalid table number.")
+                    return None
+
+                table_name = tables[table_number]
+            elif table_name not in tables:
+                self.table_builder.system_message.create_error_message(f"Table '{table_name}' not found in database.")
+                return None
 
-            table_name = tables[table_number]
             quoted_table_name = f'"{table_name}"'
+            options = options or self.table_builder.load_options
 
             # Fetch column information
             self.table_builder.database.cursor.execute(f"PRAGMA table_info({quoted_table_name})")
             columns_info = self.table_builder.database.cursor.fetchall()
+            rowids = None
+            if options.sample is not None and options.sampling == "random" and not options.conditions and options.limit is None and not options.offset:
+                rowids = self.sample_rowids(table_name, options.sample)
+            selected, query, parameters = options.to_sql(table_name, [col[1] for col in columns_info], rowids)
+            columns_info = [next(col for col in columns_info if col[1] == name) for name in selected]
 
             # Map SQL types back to program types
             sql_to_program_types = {
@@ -145,7 +210,7 @@ class DatabaseHandler:
             columns = [{"name": col[1], "type": sql_to_program_types.get(col[2].upper(), "str")} for col in columns_info]
 
             # Fetch rows
-            self.table_builder.database.cursor.execute(f"SELECT * FROM {quoted_table_name}")
+            self.table_builder.database.cursor.execute(query, parameters)
             raw_rows = self.table_builder.database.cursor.fetchall()
 
             # Convert rows to dictionaries and handle boolean conversion
@@ -154,21 +219,140 @@ class DatabaseHandler:
                 row = {}
                 for idx, column in enumerate(columns):
                     value = raw_row[idx]
-                    if column["type"] == "bool":
+                    if column["type"] == "bool" and value is not None:
                         value = bool(value)  # Convert 1/0 to True/False
                     row[column["name"]] = value
                 rows.append(row)
 
             self.table_builder.table_data["columns"] = columns
             self.table_builder.table_data["rows"] = rows
+            self.table_builder.table_encoding.encode_columns()
+            self.table_builder.notify("table_loaded")
 
-            self.table_builder.name = table_name
-            self.table_builder.table_saved = True
+            # A partial table gets its own name, so saving it does not overwrite the full table
+            self.table_builder.name = table_name if options.is_default() else f"{table_name}_subset"
+            self.table_builder.table_saved = options.is_default()
             self.table_builder.system_message.create_information_message(
                 f"Table '[bold cyan]{table_name}[/]' loaded successfully from database '[bold red]{self.table_builder.database.get_current_database()}[/]'."
+                + ("" if options.is_default() else f" Loaded {options.describe()}.")
             )
+            return table_name
         except Exception as e:
             self.table_builder.system_message.create_error_message(f"Failed to load table: {e}")
+            return None
+
+    def import_csv_to_table(self) -> None:
+        """
+        Import a CSV file straight into the connected database without loading it into the table.
+        """
+        if not self.ensure_connected_database():
+            return
+        self.table_builder.database.import_csv_to_table()
+
+    def load_workbook(self) -> None:
+        """
+        Import sheets of an XLSX or ODS workbook into the connected database, one table per sheet.
+        """
+        if not self.ensure_connected_database():
+            return
+        self.table_builder.database.load_workbook()
+
+    def create_index(self) -> None:
+        """
+        Declare an index on a table of the connected database. It is built straight away if the
+        table has been saved, and re-created every time the table is saved again.
+        """
+        if not self.ensure_connected_database():
+            return
+
+        get_user_input = self.table_builder.input_handler.get_user_input
+        table_name = get_user_input(f"[bold yellow]Enter the table to index (press Enter for '[bold cyan]{self.table_builder.name}[/]')[/]: ")
+        if table_name is None:
+            return
+        table_name = table_name.strip() or self.table_builder.name
+
+        columns = get_user_input("[bold yellow]Enter the columns to index, separated by commas[/]: ")
+        if columns is None:
+            return
+        columns = [name.strip() for name in columns.split(",") if name.strip()]
+
+        unique = get_user_input("[bold yellow]Should the indexed values be unique? (y/n)[/]: ")
+        if unique is None:
+            return
+
+        catalog = IndexCatalog(self.table_builder.database.connection)
+        index_name = get_user_input(f"[bold yellow]Enter a name for the index (press Enter for '[bold cyan]{catalog.default_index_name(table_name, columns)}[/]')[/]: ")
+        if index_name is None:
+            return
+
+        try:
+            index_name, built = catalog.declare_index(table_name, columns, unique.strip().lower() == "y", index_name.strip() or None)
+        except (ValueError, sqlite3.Error) as e:
+            self.table_builder.system_message.create_error_message(f"Failed to create index: {e}")
+            return
+
+        if built:
+            self.table_builder.system_message.create_information_message(f"Index '[bold cyan]{index_name}[/]' created on '[bold cyan]{table_name}[/]'.")
+        else:
+            self.table_builder.system_message.create_information_message(
+                f"Index '[bold cyan]{index_name}[/]' declared. It will be built when table '[bold cyan]{table_name}[/]' is saved."
+            )
+
+    def drop_index(self) -> None:
+        """
+        Drop a declared index, chosen from a list, and remove its declaration.
+        """
+        if not self.ensure_connected_database():
+            return
+
+        catalog = IndexCatalog(self.table_builder.database.connection)
+        indexes = catalog.declared_indexes()
+        if not indexes:
+            self.table_builder.system_message.create_error_message("No indexes found in the database.")
+            return
+
+        self.print_indexes(indexes)
+        number = self.table_builder.input_handler.get_user_input("[bold yellow]Enter the number of the index to drop[/]: ")
+        if number is None:
+            return
+        number = int(number) if number.strip().isdigit() else 0
+        if not 1 <= number <= len(indexes):
+            self.table_builder.system_message.create_error_message("Invalid index number.")
+            return
+        index = indexes[number - 1]
+
+        try:
+            catalog.drop_index(index["name"])
+        except sqlite3.Error as e:
+            self.table_builder.system_message.create_error_message(f"Failed to drop index: {e}")
+            return
+        self.table_builder.system_message.create_information_message(f"Index '[bold cyan]{index['name']}[/]' dropped.")
+
+    def list_indexes(self) -> None:
+        """
+        List the declared indexes of the connected database.
+        """
+        if not self.ensure_connected_database():
+            return
+
+        indexes = IndexCatalog(self.table_builder.database.connection).declared_indexes()
+        if not indexes:
+            self.table_builder.system_message.create_information_message("No indexes declared. Use '[bold cyan]create index[/]' to add one.")
+            return
+        self.print_indexes(indexes)
+
+    def print_indexes(self, indexes: list) -> None:
+        table = Table(title="[bold red]Indexes[/]", border_style="yellow", show_lines=True)
+        table.add_column("#", style="cyan", justify="right")
+        table.add_column("Index", style="green")
+        table.add_column("Table", style="cyan")
+        table.add_column("Columns")
+        table.add_column("Unique")
+        table.add_column("Status")
+        for idx, index in enumerate(indexes, start=1):
+            status = "[bold green]built[/]" if index["built"] else "[bold yellow]built on next save[/]"
+            table.add_row(str(idx), index["name"], index["table"], ", ".join(index["columns"]), "yes" if index["unique"] else "no", status)
+        self.table_builder.console.print(table)
 
     def get_tables(self) -> list:
         """
@@ -179,8 +363,7 @@ class DatabaseHandler:
             return []
         
         try:
-            self.table_builder.database.cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            return [row[0] for row in self.table_builder.database.cursor.fetchall()]
+            return self.table_builder.database.list_tables()
         except sqlite3.Error as e:
             self.table_builder.system_message.create_error_message(f"Failed to fetch tables [blue]{e}[/]")
 
@@ -193,8 +376,7 @@ class DatabaseHandler:
 
         try:
             # Get the list of available tables
-            self.table_builder.database.cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            tables = [row[0] for row in self.table_builder.database.cursor.fetchall()]
+            tables = self.table_builder.database.list_tables()
 
             if not tables:
                 self.table_builder.system_message.create_error_message("[bold yellow]No tables found in the database.[/]")
@@ -222,6 +404,7 @@ class DatabaseHandler:
                     # Execute deletion
                     self.table_builder.database.cursor.execute(f"DROP TABLE {quoted_table_name}")
                     self.table_builder.database.connection.commit()
+                    IndexCatalog(self.table_builder.database.connection).forget_table(table_name)
                     self.table_builder.system_message.create_information_message(f"Table '[bold cyan]{table_name}[/]' has been deleted successfully.")
                 else:
                     self.table_builder.system_message.create_information_message("[bold yellow]Table deletion cancelled.[/]")
@@ -0,0 +1,282 @@
+import heapq
+import itertools
+import marshal
+import os
+import re
+import sys
+import tempfile
+
+# Memory a sort may use for the rows it holds before it spills sorted runs to disk.
+SORT_MEMORY_BUDGET = 256 * 2**20
+
+# Most runs merged at once. More runs are first merged into longer runs, so the number of
+# open files stays bounded.
+SORT_MERGE_FAN_IN = 64
+
+# Most rows marshalled per block of a run file; a merge holds one block of every run.
+SORT_RUN_BLOCK_ROWS = 1_000
+
+# Rows measured at the start of every run to estimate the memory a row takes.
+SORT_SIZE_SAMPLE_ROWS = 256
+
+# One sort key: a column (optionally in double quotes) and an optional direction.
+_SORT_KEY = re.compile(r'^\s*(?:"(?P<quoted>[^"]+)"|(?P<column>.+?))(?:\s+(?P<direction>asc|desc))?\s*$', re.IGNORECASE)
+
+
+# Marks the end of the input rows.
+_END = object()
+
+
+def parse_sort_keys(text: str, column_names: list) -> list:
+    """
+    Parse sort keys such as `region, price desc`. Keys are separated by commas and sort
+    ascending unless followed by `desc`. Column names with spaces or commas can be written in
+    double quotes.
+
+    Args:
+        text (str): The sort keys.
+        column_names (list): The names of the columns that can be sorted on.
+
+    Returns:
+        list: (column position, descending) of every key.
+
+    Raises:
+        ValueError: If no key is given or a key names an unknown column.
+    """
+    keys = []
+    for part in re.findall(r'(?:"[^"]*"|[^,])+', text or ""):
+        if not part.strip():
+            continue
+        match = _SORT_KEY.match(part)
+        name = match.group("quoted") or match.group("column").strip()
+        if name not in column_names:
+            raise ValueError(f"Unknown column '{name}'.")
+        keys.append((column_names.index(name), (match.group("direction") or "asc").lower() == "desc"))
+    if not keys:
+        raise ValueError("Enter at least one column to sort by.")
+    return keys
+
+
+class _Descending:
+    """
+    Reverses the order of a key component, so ascending and descending keys can share one tuple.
+    """
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other) -> bool:
+        return other.value < self.value
+
+    def __eq__(self, other) -> bool:
+        return self.value == other.value
+
+
+def _number_component(value):
+    # Missing values sort first, as NULL does in SQLite, and text that is not a number last
+    if value is None or value.__class__ is bool:
+        return (0,) if value is None else (1, int(value))
+    if value.__class__ is int or value.__class__ is float:
+        return (1, value)
+    text = str(value).strip()
+    if not text:
+        return (0,)
+    try:
+        return (1, int(text))
+    except ValueError:
+        pass
+    try:
+        return (1, float(text))
+    except ValueError:
+        return (2, text)
+
+
+def _bool_component(value):
+    if value is None or value.__class__ is bool:
+        return (0,) if value is None else (1, int(value))
+    text = str(value).strip().lower()
+    if not text:
+        return (0,)
+    if text in ("true", "false"):
+        return (1, int(text == "true"))
+    return (2, text)
+
+
+def _text_component(value):
+    if value is None or value == "":
+        return (0,)
+    return (1, value if value.__class__ is str else str(value))
+
+
+_COMPONENTS = {"int": _number_component, "float": _number_component, "bool": _bool_component, "str": _text_component}
+
+
+def sort_key(keys: list, types: list):
+    """
+    Build the key function of a multi-key sort with typed comparisons.
+
+    Numbers are compared as numbers and booleans as false before true, whether the cells hold
+    values or the text of a file. Missing and empty cells sort first in ascending order, and
+    cells that do not match their column's type sort after the others.
+
+    Args:
+        keys (list): (column, descending) of every key. The column is what the rows are
+            indexed with: a position for lists, a name for dictionaries.
+        types (list): The data type of every key's column, as in `table_data["columns"]`.
+
+    Returns:
+        callable: The key of a row.
+    """
+    parts = []
+    for (column, descending), data_type in zip(keys, types):
+        component = _COMPONENTS.get(data_type, _text_component)
+        parts.append((column, component, descending))
+
+    if len(parts) == 1 and not parts[0][2]:
+        column, component, _ = parts[0]
+        return lambda row: component(row[column])
+
+    def key(row):
+        return tuple(
+            _Descending(component(row[column])) if descending else component(row[column])
+            for column, component, descending in parts
+        )
+    return key
+
+
+class ExternalSorter:
+
+    def __init__(self, key, memory_budget: int = SORT_MEMORY_BUDGET, temp_dir: str = None, fan_in: int = SORT_MERGE_FAN_IN):
+        """
+        Sorts rows of any number, in memory when they fit the memory budget and with an external
+        merge sort when they do not.
+
+        Rows are read into memory until the budget is used up. If the input ends first it is
+        sorted in place. Otherwise every full load of rows is sorted and spilled to a temporary
+        file as a sorted run, in blocks encoded with `marshal`, and the runs are then streamed
+        back through a k-way heap merge. The sort is stable: rows with equal keys keep their
+        input order.
+
+        :param key: The key function of the sort, see `sort_key`.
+        :param memory_budget: Bytes the rows held in memory may take.
+        :param temp_dir: Directory for the run files. The system's temporary directory if not given.
+        :param fan_in: Most runs merged at once.
+        """
+        self.key = key
+        self.memory_budget = memory_budget
+        self.temp_dir = temp_dir
+        self.fan_in = max(2, fan_in)
+        self.run_count = 0
+        self.merge_passes = 0
+        self.bytes_spilled = 0
+        self.block_rows = SORT_RUN_BLOCK_ROWS
+
+    @property
+    def spilled(self) -> bool:
+        return self.run_count > 0
+
+    def _row_size(self, row) -> int:
+        """
+        Returns:
+            int: Estimated bytes a row and its sort key take in memory.
+        """
+        size = sys.getsizeof(row) + sum(map(sys.getsizeof, row.values() if isinstance(row, dict) else row))
+        key = self.key(row)
+        size += sys.getsizeof(key)
+        if isinstance(key, tuple):
+            size += sum(map(sys.getsizeof, key))
+        # The list holding the row and the key list of list.sort
+        return size + 16
+
+    def _read_chunk(self, rows) -> list:
+        """
+        Returns:
+            list: The next rows, as many as fit the memory budget. Empty at the end of the input.
+        """
+        chunk = list(itertools.islice(rows, SORT_SIZE_SAMPLE_ROWS))
+        if not chunk:
+            return chunk
+        row_size = max(1, sum(map(self._row_size, chunk)) // len(chunk))
+        capacity = max(len(chunk), self.memory_budget // row_size)
+        # Keep a block of every merged run within the budget too
+        self.block_rows = max(1, min(SORT_RUN_BLOCK_ROWS, capacity // (2 * self.fan_in)))
+        chunk.extend(itertools.islice(rows, capacity - len(chunk)))
+        return chunk
+
+    def _write_run(self, directory: str, rows) -> str:
+        """
+        Write sorted rows to a new run file.
+
+        Returns:
+            str: The path of the run file.
+        """
+        path = os.path.join(directory, f"run_{self.run_count:06d}.bin")
+        self.run_count += 1
+        rows = iter(rows)
+        with open(path, "wb") as run_file:
+            while block := list(itertools.islice(rows, self.block_rows)):
+                marshal.dump(block, run_file)
+        self.bytes_spilled += os.path.getsize(path)
+        return path
+
+    @staticmethod
+    def _read_run(path: str):
+        with open(path, "rb") as run_file:
+            while True:
+                try:
+                    block = marshal.load(run_file)
+                except EOFError:
+                    return
+                yield from block
+
+    def _merge(self, paths: list):
+        readers = [self._read_run(path) for path in paths]
+        try:
+            yield from heapq.merge(*readers, key=self.key)
+        finally:
+            for reader in readers:
+                reader.close()
+
+    def sort(self, rows):
+        """
+        Sort rows. Rows must be lists or dictionaries of values `marshal` can encode (None,
+        bool, int, float, str and bytes).
+
+        Yields:
+            The rows in sorted order. Run files are removed once the rows are read or the
+            generator is closed.
+        """
+        rows = iter(rows)
+        chunk = self._read_chunk(rows)
+        if not chunk:
+            return
+        # One more row tells whether the input fits in memory
+        following = next(rows, _END)
+        if following is _END:
+            chunk.sort(key=self.key)
+            yield from chunk
+            return
+
+        with tempfile.TemporaryDirectory(prefix="table_sort_", dir=self.temp_dir) as directory:
+            rows = itertools.chain([following], rows)
+            runs = []
+            while chunk:
+                chunk.sort(key=self.key)
+                runs.append(self._write_run(directory, chunk))
+                # Let go of the run before the next one is read, or both would be in memory
+                chunk = None
+                chunk = self._read_chunk(rows)
+
+            # Merge runs into longer ones until one merge can take them all
+            while len(runs) > self.fan_in:
+                self.merge_passes += 1
+                merged = []
+                for start in range(0, len(runs), self.fan_in):
+                    group = runs[start:start + self.fan_in]
+                    merged.append(self._write_run(directory, self._merge(group)))
+                    for path in group:
+                        os.remove(path)
+                runs = merged
+            self.merge_passes += 1
+            yield from self._merge(runs)
@@ -0,0 +1,204 @@
+import hashlib
+import marshal
+import os
+import time
+from rich.table import Table
+
+# Largest total size of the cache directory; the least recently used entries are removed beyond it.
+MAX_CACHE_BYTES = 1024 ** 3
+
+# Bumped when the entry layout changes, so old entries are ignored.
+CACHE_FORMAT_VERSION = 1
+
+# Bytes read at a time when a file is hashed.
+HASH_CHUNK_BYTES = 1024 ** 2
+
+
+class ImportCache:
+
+    def __init__(self, table_builder, cache_directory: str = None, max_bytes: int = MAX_CACHE_BYTES):
+        """
+        On-disk cache of parsed import files, keyed by the file's content hash and the options
+        it was loaded with.
+
+        Each entry stores the typed columns and rows of a loaded table with `marshal`, so loading
+        an unchanged file again skips parsing entirely. The column dictionaries are stored in the
+        same dump, and marshal keeps the cells pointing at the shared dictionary strings. Entries are touched when they are read,
+        and the least recently used ones are removed once the cache grows past `max_bytes`.
+
+        :param cache_directory: Where entries are stored. Defaults to 'import_cache' in the working directory.
+        :param max_bytes: Size cap of the cache directory.
+        """
+        self.table_builder = table_builder
+        self.cache_directory = cache_directory or os.path.join(os.getcwd(), "import_cache")
+        self.max_bytes = max_bytes
+        self.digests = {}
+
+    def enabled(self) -> bool:
+        return self.table_builder.settings.get_setting("import_cache") == "on"
+
+    def file_digest(self, path: str) -> str:
+        """
+        Hash a file's content. Digests are remembered per path, size and modification time, so a
+        file is hashed once per session while it is unchanged.
+
+        Returns:
+            str: The SHA-256 hex digest.
+        """
+        stat = os.stat(path)
+        signature = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+        digest = self.digests.get(signature)
+        if digest is None:
+            sha256 = hashlib.sha256()
+            with open(path, "rb") as f:
+                while chunk := f.read(HASH_CHUNK_BYTES):
+                    sha256.update(chunk)
+            digest = sha256.hexdigest()
+            self.digests[signature] = digest
+        return digest
+
+    def entry_key(self, path: str, loader: str, options: dict) -> str:
+        """
+        Returns:
+            str: The cache key for a file loaded by a loader with some options.
+        """
+        options = dict(options, infer_data_types=self.table_builder.settings.get_setting("infer_data_types"))
+        description = repr((CACHE_FORMAT_VERSION, loader, sorted(options.items())))
+        return hashlib.sha256(f"{self.file_digest(path)}:{description}".encode("utf-8")).hexdigest()
+
+    def entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_directory, f"{key}.cache")
+
+    def restore(self, path: str, loader: str, **options) -> bool:
+        """
+        Replace the table data with the cached result of loading a file, if there is one.
+
+        Args:
+            path (str): The file being loaded.
+            loader (str): Name of the loader, e.g. "pdf".
+            options: Loader options that change the result, such as the sheet name.
+
+        Returns:
+            bool: True if the table was restored from the cache.
+        """
+        if not self.enabled():
+            return False
+
+        entry_path = self.entry_path(self.entry_key(path, loader, options))
+        try:
+            with open(entry_path, "rb") as f:
+                marshal.load(f)  # Entry description
+                columns, rows, dictionaries = marshal.loads(f.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return False
+        os.utime(entry_path)  # Mark the entry as recently used
+
+        names = [column["name"] for column in columns]
+        self.table_builder.table_data["columns"] = columns
+        self.table_builder.table_data["rows"] = [dict(zip(names, row)) for row in rows]
+        self.table_builder.table_encoding.use_dictionaries(dictionaries)
+        self.table_builder.notify("table_loaded")
+        return True
+
+    def store(self, path: str, loader: str, **options) -> None:
+        """
+        Save the current table data as the result of loading a file, then evict old entries if
+        the cache is over its size cap. Failures to write are ignored; the cache is only an
+        optimization.
+        """
+        if not self.enabled():
+            return
+
+        entry_path = self.entry_path(self.entry_key(path, loader, options))
+        description = {
+            "source": os.path.abspath(path),
+            "loader": loader,
+            "rows": len(self.table_builder.table_data["rows"]),
+            "created": time.time(),
+        }
+        temporary_path = f"{entry_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.cache_directory, exist_ok=True)
+            with open(temporary_path, "wb") as f:
+                marshal.dump(description, f)
+                marshal.dump((
+                    self.table_builder.table_data["columns"],
+                    list(self.table_builder.table_specs.iter_row_values()),
+                    {name: dictionary.values for name, dictionary in self.table_builder.table_encoding.dictionaries.items()},
+                ), f)
+            os.replace(temporary_path, entry_path)
+            self.evict()
+        except (OSError, ValueError):
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+    def entries(self) -> list:
+        """
+        Returns:
+            list: (path, size, last used time) of every entry, least recently used first.
+        """
+        if not os.path.isdir(self.cache_directory):
+            return []
+        entries = []
+        for entry in os.scandir(self.cache_directory):
+            if entry.name.endswith(".cache"):
+                stat = entry.stat()
+                entries.append((entry.path, stat.st_size, stat.st_mtime))
+        return sorted(entries, key=lambda entry: entry[2])
+
+    def evict(self) -> None:
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for entry_path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            os.remove(entry_path)
+            total -= size
+
+    def describe(self, entry_path: str) -> dict:
+        with open(entry_path, "rb") as f:
+            return marshal.load(f)
+
+    def purge(self) -> int:
+        """
+        Remove every entry.
+
+        Returns:
+            int: The number of entries removed.
+        """
+        entries = self.entries()
+        for entry_path, _, _ in entries:
+            os.remove(entry_path)
+        return len(entries)
+
+    def print_cache_info(self) -> None:
+        """
+        Print the cached files, most recently used first, and the size of the cache.
+        """
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        state = "[bold green]on[/]" if self.enabled() else "[bold red]off[/]"
+
+        table = Table(title="[bold red]Import Cache[/]", caption=f"[bold yellow]{len(entries)} entries, {total / 2**20:.1f} of {self.max_bytes / 2**20:.0f} MiB used. Cache is {state}.[/]", border_style="yellow", show_lines=True)
+        table.add_column("Source File", style="cyan")
+        table.add_column("Loader", style="green")
+        table.add_column("Rows", justify="right")
+        table.add_column("MiB", justify="right")
+        table.add_column("Last Used", style="magenta")
+
+        for entry_path, size, last_used in reversed(entries):
+            try:
+                description = self.describe(entry_path)
+            except (OSError, EOFError, ValueError, TypeError):
+                continue
+            table.add_row(description["source"], description["loader"], f"{description['rows']:,}", f"{size / 2**20:.1f}", time.strftime("%Y-%m-%d %H:%M", time.localtime(last_used)))
+
+        self.table_builder.console.print(table)
+
+    def purge_cache(self) -> None:
+        confirm = self.table_builder.input_handler.get_user_input("[bold red]Remove every entry from the import cache? (y/n)[/]: ")
+        if confirm is None or confirm.lower() != "y":
+            self.table_builder.system_message.create_information_message("Purge cancelled.")
+            return
+        removed = self.purge()
+        self.table_builder.system_message.create_information_message(f"Removed [bold cyan]{removed}[/] entries from the import cache.")
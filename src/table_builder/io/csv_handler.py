@@ -1,5 +1,11 @@
 import csv
 import os
+from . import compression
+from .csv_index import CSVIndex
+from ..load_options import LoadOptions
+
+# Rows shown per page when paging through an indexed CSV file.
+INDEXED_PAGE_SIZE = 20
 
 class CSVHandler:
     def __init__(self, table_builder):
@@ -16,23 +22,27 @@ class CSVHandler:
             file_name = f"{self.table_builder.name}.csv"
         elif use_table_name == "n":
             file_name = self.table_builder.input_handler.get_user_input(
-                "[bold yellow]Enter the name of the file (without extension)[/]: ") + ".csv"
+                "[bold yellow]Enter the name of the file (without extension, add .gz, .bz2, .xz or .zst to compress it)[/]: ")
+            if file_name is None:
+                return
+            file_name = compression.add_extension(file_name, ".csv")
         else:
             self.table_builder.system_message.create_error_message("Invalid input.")
             return
 
         # Write table data to the CSV file
         try:
-            with open(file_name, 'w', newline='', encoding='utf-8') as csvfile:
+            with compression.open_text(file_name, 'w', newline='') as csvfile:
                 writer = csv.writer(csvfile)
 
+                column_headers = [column["name"] for column in self.table_builder.table_data["columns"]]
+
                 # Write header row (columns)
-                if self.table_builder.table_data["columns"]:
-                    writer.writerow(self.table_builder.table_data["columns"])
+                if column_headers:
+                    writer.writerow(column_headers)
 
-                # Write data rows
-                for row in self.table_builder.table_data["rows"]:
-                    writer.writerow([row.get(column, "") for column in self.table_builder.table_data["columns"]])
+                # Write data rows; the csv module writes missing (None) cells as empty fields
+                writer.writerows(self.table_builder.table_specs.iter_row_values())
 
             self.table_builder.table_saved = True
             self.table_builder.system_message.create_information_message(
@@ -41,12 +51,14 @@ class CSVHandler:
         except Exception as e:
             self.table_builder.system_message.create_error_message(f"Failed to save file: {e}")
 
-    def load_csv(self, path: str | os.PathLike = None) -> None:
+    def load_csv(self, path: str | os.PathLike = None, options: LoadOptions = None) -> None:
         """
         Load a CSV file and update the table data with all columns defaulting to strings.
+        gzip, bz2, xz and zstd compressed files are decompressed as they are read.
 
         Args:
             path (str): Path to the CSV file. If not provided, prompts the user.
+            options (LoadOptions): The columns and rows to load. Defaults to the table's load options.
         """
         # Prompt for CSV path if not provided through CLI arg.
         csv_path = path or self.table_builder.input_handler.get_user_input("[bold yellow]Enter path to CSV file[/]: ").strip()
@@ -59,36 +71,113 @@ class CSVHandler:
             self.table_builder.system_message.create_error_message("Invalid path or file does not exist.")
             return
 
+        options = options or self.table_builder.load_options
+        cache_options = options.cache_options()
         try:
-            with open(csv_path, 'r', encoding='utf-8') as csv_file:
+            # A plain CSV file parses about as fast as it is hashed, so only compressed ones are cached
+            cacheable = options.cacheable() and compression.detect_codec(csv_path) is not None
+            if cacheable and self.table_builder.import_cache.restore(csv_path, "csv", **cache_options):
+                self.table_builder.name = compression.strip_extensions(csv_path)
+                self.table_builder.table_saved = False
+                self.table_builder.system_message.create_information_message("CSV file loaded from the import cache.")
+                return
+
+            with compression.open_text(csv_path, 'r', newline='') as csv_file:
                 reader = csv.reader(csv_file)
-                rows = list(reader)  # Convert CSV reader to a list of rows
+                header = next(reader, None)
 
                 # Ensure the CSV is not empty
-                if not rows:
+                if header is None:
                     self.table_builder.system_message.create_error_message("CSV file is empty.")
                     return
 
-                # Use the first row as column names, defaulting to string type
-                self.table_builder.table_data["columns"] = [{"name": col, "type": "str"} for col in rows[0]]
+                # Use the first row as column names and stream the rest into the table,
+                # dropping unselected fields and rows before they are converted
+                header, rows = options.select(header, reader, options.read_columns(header))
+                self.table_builder.table_specs.load_table(header, rows)
+                if cacheable:
+                    self.table_builder.import_cache.store(csv_path, "csv", **cache_options)
+                self.table_builder.name = compression.strip_extensions(csv_path) # Change table name to file basename without extensions
+                self.table_builder.table_saved = False # Mark the table as unsaved
+                self.table_builder.system_message.create_information_message(options.loaded_message("CSV file"))
 
-                # Populate the rows with column-value dictionaries
-                self.table_builder.table_data["rows"] = [
-                    {col: value for col, value in zip([c["name"] for c in self.table_builder.table_data["columns"]], row)}
-                    for row in rows[1:]
-                ]
+        except UnicodeDecodeError:
+            self.table_builder.system_message.create_error_message("Failed to decode file. Ensure it is UTF-8 encoded.")
+        except Exception as e:
+            self.table_builder.system_message.create_error_message(f"Failed to load CSV file: {e}")
 
+    def open_csv_indexed(self, path: str | os.PathLike = None) -> None:
+        """
+        Page through a CSV file without loading it. A sidecar index of row offsets is built on
+        the first open and reused afterwards, so any row can be shown straight away. The page
+        being shown can be loaded into the table to edit it.
 
-                if self.table_builder.settings.get_setting("infer_data_types") == "on":
-                    self.table_builder.table_specs.infer_column_types() # Infer column types and apply
-                self.table_builder.name = os.path.splitext(os.path.basename(csv_path))[0] # Change table name to file basename without extension
-                self.table_builder.table_saved = False # Mark the table as unsaved
-                self.table_builder.system_message.create_information_message("CSV file loaded successfully.")
+        Args:
+            path (str): Path to the CSV file. If not provided, prompts the user.
+        """
+        csv_path = path or self.table_builder.input_handler.get_user_input("[bold yellow]Enter path to CSV file[/]: ")
 
+        if csv_path is None:
+            return
+
+        if not os.path.isfile(csv_path):
+            self.table_builder.system_message.create_error_message("Invalid path or file does not exist.")
+            return
+
+        if compression.detect_codec(csv_path):
+            self.table_builder.system_message.create_error_message("Compressed files cannot be opened indexed. Decompress the file or use 'load csv'.")
+            return
+
+        index = CSVIndex(csv_path)
+        try:
+            with self.table_builder.console.status("[bold yellow]Indexing CSV file...[/]"):
+                rebuilt = index.open()
+            if rebuilt and index.index_saved:
+                self.table_builder.system_message.create_information_message(
+                    f"Indexed [bold cyan]{index.row_count:,}[/] rows. The index is saved in '[bold red]{index.index_path}[/]'."
+                )
+            elif rebuilt:
+                self.table_builder.system_message.create_information_message(
+                    f"Indexed [bold cyan]{index.row_count:,}[/] rows. The index could not be saved in '[bold red]{index.index_path}[/]', so it will be rebuilt the next time the file is opened."
+                )
+            self._page_indexed_csv(index)
         except UnicodeDecodeError:
             self.table_builder.system_message.create_error_message("Failed to decode file. Ensure it is UTF-8 encoded.")
         except Exception as e:
-            self.table_builder.system_message.create_error_message(f"Failed to load CSV file: {e}")
+            self.table_builder.system_message.create_error_message(f"Failed to open CSV file: {e}")
+        finally:
+            index.close()
+
+    def _page_indexed_csv(self, index: CSVIndex) -> None:
+        name = compression.strip_extensions(index.csv_path)
+        start = 0
+
+        while True:
+            rows = index.read_rows(start, INDEXED_PAGE_SIZE)
+            caption = f"[bold yellow]Rows {start + 1:,}-{start + len(rows):,} of {index.row_count:,}[/]"
+            self.table_builder.console.print(self.table_builder.table_display.build_page_table(index.header, rows, start, name, caption))
+
+            choice = self.table_builder.input_handler.get_user_input(
+                "[bold yellow]Enter 'n'/'p' for the next/previous page, a row number to jump to, "
+                "'load' to load this page into the table, or 'q' to close the file[/]: "
+            )
+            if choice is None or choice.lower() == "q":
+                return
+            choice = choice.lower().replace(",", "")
+            if choice == "n":
+                start = min(start + INDEXED_PAGE_SIZE, max(index.row_count - 1, 0))
+            elif choice == "p":
+                start = max(start - INDEXED_PAGE_SIZE, 0)
+            elif choice.isdigit():
+                start = min(max(int(choice) - 1, 0), max(index.row_count - 1, 0))
+            elif choice == "load":
+                self.table_builder.table_specs.load_table(index.header, rows)
+                self.table_builder.name = f"{name} rows {start + 1}-{start + len(rows)}"
+                self.table_builder.table_saved = False
+                self.table_builder.system_message.create_information_message(f"Loaded rows [bold cyan]{start + 1:,}-{start + len(rows):,}[/] into the table.")
+                return
+            else:
+                self.table_builder.system_message.create_error_message("Invalid input.")
 
     def load_batch_csv(self) -> None:
         """
@@ -116,9 +205,9 @@ class CSVHandler:
         try:
             if recursive_load == 'y':
                 for root, _, files in os.walk(directory):
-                    csv_files.extend([os.path.join(root, file) for file in files if file.endswith('.csv')])
+                    csv_files.extend([os.path.join(root, file) for file in files if compression.has_extension(file, '.csv')])
             elif recursive_load == 'n':
-                csv_files = [os.path.join(directory, file) for file in os.listdir(directory) if file.endswith('.csv')]
+                csv_files = [os.path.join(directory, file) for file in os.listdir(directory) if compression.has_extension(file, '.csv')]
             else:
                 self.table_builder.system_message.create_error_message("Invalid input! Please enter 'y' or 'n'.")
                 return
@@ -139,7 +228,7 @@ class CSVHandler:
             try:
                 self.load_csv(path=file)
 
-                base_name = os.path.splitext(os.path.basename(file))[0]  # Use filename as default table name
+                base_name = compression.strip_extensions(file)  # Use filename as default table name
                 if base_name in existing_tables:
                     # Prompt user to rename or use default
                     user_choice = self.table_builder.input_handler.get_user_input(
@@ -0,0 +1,164 @@
+import csv
+import itertools
+import mmap
+import os
+import struct
+from array import array
+
+# One byte offset is stored for every this many rows; reading a row parses at most this many rows.
+INDEX_STRIDE = 32
+
+_INDEX_MAGIC = b"TTBCSVI1"
+
+# Magic, file size, file mtime (ns), row count and stride.
+_INDEX_HEADER = struct.Struct("<8sQqQI")
+
+
+class CSVIndex:
+
+    def __init__(self, csv_path: str, stride: int = INDEX_STRIDE):
+        """
+        Random access to the rows of a large CSV file through a sidecar index of row byte offsets.
+
+        The index is built with one pass over the file and saved next to it as '<file>.idx'. It
+        is reused as long as the file's size and modification time match, so later opens only
+        read the index. Rows are read by seeking a memory map of the file to the nearest indexed
+        offset and parsing forward from there.
+
+        :param csv_path: Path to an uncompressed, UTF-8 encoded CSV file.
+        :param stride: Rows between two indexed offsets.
+        """
+        self.csv_path = csv_path
+        self.index_path = csv_path + ".idx"
+        self.stride = stride
+        self.offsets = array("Q")
+        self.row_count = 0
+        self.header = []
+        self.file = None
+        self.map = None
+        self.index_saved = False
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def open(self) -> bool:
+        """
+        Load the sidecar index, building it first if it is missing or out of date, and map the file.
+
+        Returns:
+            bool: True if the index was rebuilt.
+        """
+        rebuilt = not self.load_index()
+        if rebuilt:
+            self.build_index()
+            self.index_saved = self.save_index()
+
+        self.file = open(self.csv_path, "rb")
+        if os.path.getsize(self.csv_path):
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.header = next(self._reader_at(0), [])
+        return rebuilt
+
+    def close(self) -> None:
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def _file_signature(self) -> tuple:
+        stat = os.stat(self.csv_path)
+        return stat.st_size, stat.st_mtime_ns
+
+    def load_index(self) -> bool:
+        """
+        Returns:
+            bool: True if a sidecar index matching the current file was loaded.
+        """
+        if not os.path.exists(self.index_path):
+            return False
+        try:
+            with open(self.index_path, "rb") as f:
+                header = f.read(_INDEX_HEADER.size)
+                if len(header) != _INDEX_HEADER.size:
+                    return False
+                magic, size, mtime_ns, row_count, stride = _INDEX_HEADER.unpack(header)
+                if magic != _INDEX_MAGIC or (size, mtime_ns) != self._file_signature():
+                    return False
+                offsets = array("Q")
+                offsets.frombytes(f.read())
+        except OSError:
+            return False
+
+        self.offsets, self.row_count, self.stride = offsets, row_count, stride
+        return True
+
+    def build_index(self) -> None:
+        """
+        Record the byte offset of every `stride`-th data row. Quotes are counted per line so a
+        quoted field spanning several lines stays inside one row.
+        """
+        offsets = array("Q")
+        stride = self.stride
+        offset = 0
+        next_row = -1  # The header is row -1
+        in_quotes = False
+
+        with open(self.csv_path, "rb") as f:
+            for line in f:
+                if not in_quotes and next_row >= 0 and next_row % stride == 0:
+                    offsets.append(offset)
+                if b'"' in line and line.count(b'"') & 1:
+                    in_quotes = not in_quotes
+                offset += len(line)
+                if not in_quotes:
+                    next_row += 1
+
+        self.offsets = offsets
+        self.row_count = max(next_row, 0)
+
+    def save_index(self) -> bool:
+        """
+        Write the sidecar index. The index only saves rebuilding it on the next open, so a file
+        that cannot be written, e.g. in a read-only directory or on a full disk, is skipped and
+        the index is kept in memory.
+
+        Returns:
+            bool: True if the index was saved.
+        """
+        size, mtime_ns = self._file_signature()
+        try:
+            with open(self.index_path, "wb") as f:
+                f.write(_INDEX_HEADER.pack(_INDEX_MAGIC, size, mtime_ns, self.row_count, self.stride))
+                self.offsets.tofile(f)
+        except OSError:
+            # A partly written index would be read back as a complete one
+            try:
+                os.remove(self.index_path)
+            except OSError:
+                pass
+            return False
+        return True
+
+    def _reader_at(self, offset: int):
+        self.map.seek(offset)
+        return csv.reader(line.decode("utf-8") for line in iter(self.map.readline, b""))
+
+    def read_rows(self, start: int, count: int) -> list:
+        """
+        Args:
+            start (int): 0-based index of the first data row.
+            count (int): Most rows to return.
+
+        Returns:
+            list: The rows as lists of strings.
+        """
+        if self.map is None or not 0 <= start < self.row_count:
+            return []
+        block, skip = divmod(start, self.stride)
+        return list(itertools.islice(self._reader_at(self.offsets[block]), skip, skip + count))
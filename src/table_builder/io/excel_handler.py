@@ -1,4 +1,5 @@
 from openpyxl import load_workbook, Workbook
+from ..load_options import LoadOptions
 import os
 
 class ExcelHandler:
@@ -7,7 +8,15 @@ class ExcelHandler:
         self.table_builder = table_builder
 
 
-    def load_excel(self, path: str | os.PathLike = None) -> None:
+    def load_excel(self, path: str | os.PathLike = None, options: LoadOptions = None) -> None:
+        """
+        Load table data from the first sheet of an .xlsx file. The sheet is read as a stream,
+        and cells to the right of the last needed column are not read.
+
+        Args:
+            path (str): Path to the Excel file. If not provided, prompts the user.
+            options (LoadOptions): The columns and rows to load. Defaults to the table's load options.
+        """
         file_name = path or self.table_builder.input_handler.get_user_input("[bold yellow]Enter the path to the Excel file[/]: ")
 
         if file_name is None:
@@ -17,21 +26,34 @@ class ExcelHandler:
             self.table_builder.system_message.create_error_message("File not found.")
             return
 
+        options = options or self.table_builder.load_options
+        cache_options = options.cache_options()
         try:
-            wb = load_workbook(filename=file_name, data_only=True)
-            sheet = wb.active  # Get the first sheet
-
-            data = [[cell.value for cell in row] for row in sheet.iter_rows()]
-            if not data:
-                self.table_builder.system_message.create_error_message("The Excel file is empty.")
+            if options.cacheable() and self.table_builder.import_cache.restore(file_name, "xlsx", **cache_options):
+                self.table_builder.name = os.path.splitext(os.path.basename(file_name))[0]
+                self.table_builder.system_message.create_information_message("Excel file loaded from the import cache.")
                 return
 
-            self.table_builder.table_data["columns"] = [{"name": col, "type": "str"} for col in data[0]]
-            self.table_builder.table_data["rows"] = [{col: row[i] if i < len(row) else "" for i, col in enumerate(data[0])} for row in data[1:]]
+            wb = load_workbook(filename=file_name, read_only=True, data_only=True)
+            try:
+                sheet = wb.active  # Get the first sheet
+
+                header = next(sheet.iter_rows(max_row=1, values_only=True), None)
+                if header is None:
+                    self.table_builder.system_message.create_error_message("The Excel file is empty.")
+                    return
+
+                read_columns = options.read_columns(header)
+                last_column = max(read_columns) + 1 if read_columns else None
+                rows = sheet.iter_rows(min_row=2, max_col=last_column, values_only=True)
+                header, rows = options.select(header, rows, read_columns)
+                self.table_builder.table_specs.load_table(header, rows)
+            finally:
+                wb.close()
+            if options.cacheable():
+                self.table_builder.import_cache.store(file_name, "xlsx", **cache_options)
             self.table_builder.name = os.path.splitext(os.path.basename(file_name))[0]
-            if self.table_builder.settings.get_setting("infer_data_types") == "on":
-                self.table_builder.table_specs.infer_column_types()
-            self.table_builder.system_message.create_information_message("Excel file loaded successfully.")
+            self.table_builder.system_message.create_information_message(options.loaded_message("Excel file"))
         except Exception as e:
             self.table_builder.system_message.create_error_message(f"Failed to load Excel file: {e}")
 
@@ -64,9 +86,9 @@ class ExcelHandler:
             column_headers = [col["name"] for col in self.table_builder.table_data["columns"]]
             ws.append(column_headers)
 
-            # Write row data
-            for row in self.table_builder.table_data["rows"]:
-                ws.append([row.get(col, "") for col in column_headers])
+            # Write row data; missing (None) cells are left empty
+            for values in self.table_builder.table_specs.iter_row_values():
+                ws.append(values)
 
             wb.save(file_name)
             self.table_builder.system_message.create_information_message(f"Table data successfully saved to '[bold cyan]{file_name}[/]'.")
@@ -1,4 +1,5 @@
 import json
+from . import compression
 
 class JSONHandler:
 
@@ -9,22 +10,24 @@ class JSONHandler:
     def save_json(self):
         """Save the table data to a JSON file."""
         use_table_name = self.table_builder.input_handler.get_user_input(
-            "[bold yellow]Use table name as save file name? (y/n)[/]: ").lower().strip()
+            "[bold yellow]Use table name as save file name? (y/n)[/]: ")
+        if use_table_name is None:
+            return
+        use_table_name = use_table_name.lower().strip()
 
         if use_table_name == "y":
             file_name = f"{self.table_builder.name}.json"
         elif use_table_name == "n":
             file_name = self.table_builder.input_handler.get_user_input(
-                "[bold yellow]Enter the name of the file (without extension)[/]: ") + ".json"
+                "[bold yellow]Enter the name of the file (without extension, add .gz, .bz2, .xz or .zst to compress it)[/]: ")
             if file_name is None:
                 return
-        elif file_name is None:
-            return
+            file_name = compression.add_extension(file_name, ".json")
         else:
             self.table_builder.system_message.create_error_message("Invalid input.")
             return
         
-        with open(file_name, 'w') as f:
+        with compression.open_text(file_name, 'w') as f:
             json.dump(self.table_builder.table_data, f, indent=4)
 
             self.table_builder.table_saved = True
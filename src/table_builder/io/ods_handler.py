@@ -1,44 +1,99 @@
-from pyexcel_ods3 import get_data, save_data
+from .ods_reader import ODSReader
+from .stream_writers import ODSStreamWriter
+from ..load_options import LoadOptions
 import os
 
 class ODSHandler:
     def __init__(self, table_builder):
         self.table_builder = table_builder
 
-    def load_ods(self, path: str | os.PathLike = None) -> None:
+    def load_ods(self, path: str | os.PathLike = None, sheet_name: str = None, options: LoadOptions = None) -> None:
         """
-        Load table data from an .ods file using pyexcel-ods3.
+        Load table data from one sheet of an .ods file. Only the selected sheet and rows are
+        parsed, as a stream, so large spreadsheets load without holding the whole workbook.
+
+        Args:
+            path (str): Path to the ODS file. If not provided, prompts the user.
+            sheet_name (str): The sheet to load. The first sheet if not given.
+            options (LoadOptions): The columns and rows to load. Defaults to the table's load options.
         """
-        file_name = path or self.table_builder.input_handler.get_user_input("[bold yellow]Enter path to the ODS file[/]: ").strip()
+        file_name = path or self.table_builder.input_handler.get_user_input("[bold yellow]Enter path to the ODS file[/]: ")
 
         if file_name is None:
             return
+        file_name = file_name.strip()
 
         if not os.path.exists(file_name):
             self.table_builder.system_message.create_error_message("File not found.")
             return
 
+        options = options or self.table_builder.load_options
+        cache_options = {"sheet_name": sheet_name, **options.cache_options()}
         try:
-            data = get_data(file_name)
-            sheet_name = list(data.keys())[0]  # Ensure we get the first sheet correctly
-            sheet_data = data[sheet_name]
+            if options.cacheable() and self.table_builder.import_cache.restore(file_name, "ods", **cache_options):
+                self.table_builder.name = os.path.splitext(os.path.basename(file_name))[0]
+                self.table_builder.system_message.create_information_message("ODS file loaded from the import cache.")
+                return
 
-            if not sheet_data or not isinstance(sheet_data, list):
+            reader = ODSReader(file_name)
+            header = next(reader.iter_rows(sheet_name, row_limit=1), None)
+            if not header:
                 self.table_builder.system_message.create_error_message("The ODS file is empty or has an invalid format.")
                 return
 
-            self.table_builder.table_data["columns"] = [{"name": col, "type": "str"} for col in sheet_data[0]]
-            self.table_builder.table_data["rows"] = [{col: row[i] if i < len(row) else "" for i, col in enumerate(sheet_data[0])} for row in sheet_data[1:]]
+            read_columns = options.read_columns(header)
+            if options.conditions:
+                rows = reader.iter_rows(sheet_name, start_row=1, columns=read_columns)
+            else:
+                # Without a condition the reader skips to the first wanted row and stops after the last
+                rows = reader.iter_rows(sheet_name, start_row=options.offset + 1, row_limit=options.limit, columns=read_columns)
+            header, rows = options.select(header, rows, read_columns, projected=True, windowed=not options.conditions)
+            self.table_builder.table_specs.load_table(header, rows)
+            if options.cacheable():
+                self.table_builder.import_cache.store(file_name, "ods", **cache_options)
             self.table_builder.name = os.path.splitext(os.path.basename(file_name))[0]
-            if self.table_builder.settings.get_setting("infer_data_types") == "on":
-                self.table_builder.table_specs.infer_column_types()
-            self.table_builder.system_message.create_information_message("ODS file loaded successfully.")
+            self.table_builder.system_message.create_information_message(options.loaded_message("ODS file"))
         except Exception as e:
             self.table_builder.system_message.create_error_message(f"Failed to load ODS file: {e}")
 
+    def load_ods_range(self) -> None:
+        """
+        Prompt for a sheet, a range of rows and the columns to load from an .ods file, then load them.
+        """
+        get_user_input = self.table_builder.input_handler.get_user_input
+
+        file_name = get_user_input("[bold yellow]Enter path to the ODS file[/]: ")
+        if file_name is None:
+            return
+        sheet_name = get_user_input("[bold yellow]Enter the sheet name (leave empty for the first sheet)[/]: ")
+        if sheet_name is None:
+            return
+        first_row = get_user_input("[bold yellow]Enter the first row to load, 1 being the row below the header (leave empty for 1)[/]: ")
+        if first_row is None:
+            return
+        row_limit = get_user_input("[bold yellow]Enter the number of rows to load (leave empty for all)[/]: ")
+        if row_limit is None:
+            return
+        columns = get_user_input("[bold yellow]Enter the columns to load, separated by commas (leave empty for all)[/]: ")
+        if columns is None:
+            return
+
+        try:
+            start_row = int(first_row) - 1 if first_row.strip() else 0
+            row_limit = int(row_limit) if row_limit.strip() else None
+        except ValueError:
+            self.table_builder.system_message.create_error_message("The first row and number of rows must be whole numbers.")
+            return
+        if start_row < 0 or (row_limit is not None and row_limit < 1):
+            self.table_builder.system_message.create_error_message("The first row and number of rows must be at least 1.")
+            return
+
+        columns = [name.strip() for name in columns.split(",") if name.strip()]
+        self.load_ods(file_name, sheet_name=sheet_name.strip() or None, options=LoadOptions(columns, limit=row_limit, offset=start_row))
+
     def save_ods(self) -> None:
         """
-        Save the current table data to an .ods file using pyexcel-ods3.
+        Save the current table data to an .ods file, writing the rows as a stream.
         """
         if not self.table_builder.table_data["columns"] or not self.table_builder.table_data["rows"]:
             self.table_builder.system_message.create_error_message("No table data to export to ODS.")
@@ -57,11 +112,11 @@ class ODSHandler:
             return
 
         try:
-            column_headers = [col["name"] for col in self.table_builder.table_data["columns"]]
-            data = [[col for col in column_headers]]
-            data.extend([[row.get(col, "") for col in column_headers] for row in self.table_builder.table_data["rows"]])
+            # Rows are rendered and compressed as they are written instead of being collected first
+            with ODSStreamWriter(file_name) as writer:
+                writer.write_header([col["name"] for col in self.table_builder.table_data["columns"]])
+                writer.write_rows(self.table_builder.table_specs.iter_row_values())
 
-            save_data(file_name, {"Sheet1": data})
             self.table_builder.system_message.create_information_message(f"Table data successfully saved to '[bold cyan]{file_name}[/]'.")
         except Exception as e:
             self.table_builder.system_message.create_error_message(f"Failed to save table as ODS file: {e}")
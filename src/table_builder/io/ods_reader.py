@@ -0,0 +1,226 @@
+import zipfile
+from xml.etree.ElementTree import iterparse
+
+_OFFICE = "{urn:oasis:names:tc:opendocument:xmlns:office:1.0}"
+_TABLE = "{urn:oasis:names:tc:opendocument:xmlns:table:1.0}"
+_TEXT = "{urn:oasis:names:tc:opendocument:xmlns:text:1.0}"
+
+_SHEET = _TABLE + "table"
+_SHEET_NAME = _TABLE + "name"
+_ROW = _TABLE + "table-row"
+_CELL = _TABLE + "table-cell"
+_COVERED_CELL = _TABLE + "covered-table-cell"
+_ROWS_REPEATED = _TABLE + "number-rows-repeated"
+_COLUMNS_REPEATED = _TABLE + "number-columns-repeated"
+_VALUE_TYPE = _OFFICE + "value-type"
+_VALUE = _OFFICE + "value"
+_BOOLEAN_VALUE = _OFFICE + "boolean-value"
+_DATE_VALUE = _OFFICE + "date-value"
+_STRING_VALUE = _OFFICE + "string-value"
+_PARAGRAPH = _TEXT + "p"
+_SPACE = _TEXT + "s"
+_SPACE_COUNT = _TEXT + "c"
+_TAB = _TEXT + "tab"
+_LINE_BREAK = _TEXT + "line-break"
+
+_NUMBER_TYPES = ("float", "percentage", "currency")
+
+
+class ODSReader:
+
+    def __init__(self, path: str):
+        """
+        Reads the rows of one sheet of an .ods file as a stream.
+
+        content.xml is parsed incrementally straight out of the archive, and every row is
+        discarded once it has been read, so memory use does not grow with the size of the
+        sheet. Other sheets are parsed past without building their rows, and reading stops as
+        soon as the selected rows have been read.
+
+        Cells are returned as int, float, bool or str, and empty cells as None. Dates are kept as
+        their ISO text. Trailing empty cells and rows, which spreadsheet applications write as
+        huge repeat counts, are dropped.
+
+        :param path: Path to the .ods file.
+        """
+        self.path = path
+
+    def _events(self):
+        """
+        Yields:
+            The iterparse (event, element) pairs of content.xml. Finished rows are removed from
+            their parent so the parsed tree stays small.
+        """
+        with zipfile.ZipFile(self.path) as archive, archive.open("content.xml") as content:
+            parents = []
+            for event, element in iterparse(content, events=("start", "end")):
+                if event == "start":
+                    parents.append(element)
+                    yield event, element
+                    continue
+                parents.pop()
+                yield event, element
+                if element.tag == _ROW and parents:
+                    parents[-1].remove(element)
+
+    def sheet_names(self) -> list:
+        """
+        Returns:
+            list: The names of the sheets, in order.
+        """
+        return [element.get(_SHEET_NAME) for event, element in self._events() if event == "start" and element.tag == _SHEET]
+
+    def sheet_dimensions(self) -> list:
+        """
+        Count the rows and columns of every sheet in one pass, up to the last non-empty row
+        and column.
+
+        Returns:
+            list: (sheet name, rows, columns) of every sheet, in order.
+        """
+        dimensions = []
+        rows = columns = 0
+        row_index = 0
+        for event, element in self._events():
+            if element.tag == _SHEET:
+                if event == "start":
+                    rows = columns = row_index = 0
+                else:
+                    dimensions.append((element.get(_SHEET_NAME), rows, columns))
+            elif element.tag == _ROW and event == "end":
+                row_index += int(element.get(_ROWS_REPEATED, 1))
+                width = len(self._row_values(element))
+                if width:
+                    rows = row_index
+                    columns = max(columns, width)
+        return dimensions
+
+    def iter_rows(self, sheet_name: str = None, start_row: int = 0, row_limit: int = None, columns: list = None):
+        """
+        Args:
+            sheet_name (str): The sheet to read. The first sheet if not given.
+            start_row (int): 0-based index of the first row to return.
+            row_limit (int): Most rows to return. All remaining rows if not given.
+            columns (list): 0-based indexes of the columns to return, in order. All columns if not given.
+
+        Yields:
+            list: The cell values of each row.
+
+        Raises:
+            ValueError: If the sheet does not exist.
+        """
+        if row_limit is not None and row_limit <= 0:
+            return
+        end_row = None if row_limit is None else start_row + row_limit
+        last_column = max(columns) + 1 if columns else None
+
+        in_sheet = False
+        found = False
+        row_index = 0
+        pending_empty_rows = 0
+
+        for event, element in self._events():
+            tag = element.tag
+            if event == "start":
+                if tag == _SHEET and not found:
+                    in_sheet = sheet_name is None or element.get(_SHEET_NAME) == sheet_name
+                    found = in_sheet
+                continue
+
+            if tag == _SHEET and in_sheet:
+                return
+            if tag != _ROW or not in_sheet:
+                continue
+
+            repeat = int(element.get(_ROWS_REPEATED, 1))
+            if row_index + pending_empty_rows + repeat <= start_row:
+                # Entirely before the first wanted row: skip without reading the cells
+                row_index += pending_empty_rows + repeat
+                pending_empty_rows = 0
+                continue
+
+            values = self._row_values(element, last_column)
+            if not values:
+                # Empty rows are only returned when a row with values follows them
+                pending_empty_rows += repeat
+                continue
+
+            for row_values, count in (([], pending_empty_rows), (values, repeat)):
+                for _ in range(count):
+                    if end_row is not None and row_index >= end_row:
+                        return
+                    if row_index >= start_row:
+                        yield self._project(row_values, columns)
+                    row_index += 1
+            pending_empty_rows = 0
+
+        if not found:
+            raise ValueError(f"Sheet '{sheet_name}' not found.")
+
+    @staticmethod
+    def _project(values: list, columns: list) -> list:
+        if columns is None:
+            return values
+        width = len(values)
+        return [values[idx] if idx < width else None for idx in columns]
+
+    def _row_values(self, row, last_column: int = None) -> list:
+        """
+        Returns:
+            list: The row's cell values, without trailing empty cells. Reading stops at
+                `last_column` when given.
+        """
+        values = []
+        pending_empty = 0
+        for cell in row:
+            if cell.tag != _CELL and cell.tag != _COVERED_CELL:
+                continue
+            repeat = int(cell.get(_COLUMNS_REPEATED, 1))
+            value = self._cell_value(cell)
+            if value is None:
+                pending_empty += repeat
+            else:
+                values.extend([None] * pending_empty)
+                values.extend([value] * repeat)
+                pending_empty = 0
+            if last_column is not None and len(values) + pending_empty >= last_column:
+                break
+        if last_column is not None:
+            del values[last_column:]
+        return values
+
+    def _cell_value(self, cell):
+        value_type = cell.get(_VALUE_TYPE)
+        if value_type in _NUMBER_TYPES:
+            value = cell.get(_VALUE)
+            try:
+                return int(value)
+            except ValueError:
+                return float(value)
+        if value_type == "boolean":
+            return cell.get(_BOOLEAN_VALUE) == "true"
+        if value_type == "date":
+            return cell.get(_DATE_VALUE)
+        if value_type == "string" and cell.get(_STRING_VALUE) is not None:
+            return cell.get(_STRING_VALUE)
+
+        paragraphs = [self._paragraph_text(p) for p in cell if p.tag == _PARAGRAPH]
+        if not paragraphs:
+            return None
+        return "\n".join(paragraphs) or None
+
+    def _paragraph_text(self, element) -> str:
+        if not len(element):
+            return element.text or ""
+        parts = [element.text or ""]
+        for child in element:
+            if child.tag == _SPACE:
+                parts.append(" " * int(child.get(_SPACE_COUNT, 1)))
+            elif child.tag == _TAB:
+                parts.append("\t")
+            elif child.tag == _LINE_BREAK:
+                parts.append("\n")
+            else:
+                parts.append(self._paragraph_text(child))
+            parts.append(child.tail or "")
+        return "".join(parts)
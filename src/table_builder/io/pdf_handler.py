@@ -2,6 +2,7 @@ import pdfplumber
 from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate, Table as PDFTable, TableStyle
 from reportlab.lib import colors
+from ..load_options import LoadOptions
 import os
 
 
@@ -44,8 +45,7 @@ class PDFHandler:
             pdf_data = [column_headers]  # Header row
 
             # Add row data
-            for row in self.table_builder.table_data["rows"]:
-                pdf_data.append([row.get(column["name"], "") for column in self.table_builder.table_data["columns"]])
+            pdf_data.extend(self.table_builder.table_specs.iter_row_values(null_value=""))
 
             # Create the table with styling
             table = PDFTable(pdf_data)
@@ -70,12 +70,14 @@ class PDFHandler:
         except Exception as e:
             self.table_builder.system_message.create_error_message(f"Failed to save table as PDF: {e}")
 
-    def load_pdf(self, path: str | os.PathLike = None) -> None:
+    def load_pdf(self, path: str | os.PathLike = None, options: LoadOptions = None) -> None:
         """
-        Load table data from a PDF file using pdfplumber.
+        Load table data from a PDF file using pdfplumber. Pages are extracted one at a time,
+        and extraction stops once the row limit of the load options is reached.
 
         Args:
             path (str): Path to the PDF file. If not provided through CLI shortcut, prompt the user.
+            options (LoadOptions): The columns and rows to load. Defaults to the table's load options.
         """
         file_name = path or self.table_builder.input_handler.get_user_input("[bold yellow]Enter path to the PDF file[/]: ").strip()
 
@@ -86,24 +88,29 @@ class PDFHandler:
             self.table_builder.system_message.create_error_message("File not found.")
             return
 
+        options = options or self.table_builder.load_options
+        cache_options = options.cache_options()
         try:
-            with pdfplumber.open(file_name) as pdf:
-                extracted_data = []
-                for page in pdf.pages:
-                    tables = page.extract_table()
-                    if tables:
-                        extracted_data.extend(tables)
-
-            if not extracted_data:
-                self.table_builder.system_message.create_error_message("No table data found in the PDF.")
+            if options.cacheable() and self.table_builder.import_cache.restore(file_name, "pdf", **cache_options):
+                self.table_builder.name = os.path.splitext(os.path.basename(file_name))[0]
+                self.table_builder.system_message.create_information_message("PDF file loaded from the import cache.")
                 return
 
-            # Use first row as column headers
-            self.table_builder.table_data["columns"] = [{"name": col, "type": "str"} for col in extracted_data[0]]
-            self.table_builder.table_data["rows"] = [{col: row[i] if i < len(row) else "" for i, col in enumerate(extracted_data[0])} for row in extracted_data[1:]]
-            if self.table_builder.settings.get_setting("infer_data_types") == "on":
-                self.table_builder.table_specs.infer_column_types()
+            with pdfplumber.open(file_name) as pdf:
+                # The table rows of every page, extracted as they are needed
+                rows = (row for page in pdf.pages for row in (page.extract_table() or []))
+
+                # Use first row as column headers
+                header = next(rows, None)
+                if header is None:
+                    self.table_builder.system_message.create_error_message("No table data found in the PDF.")
+                    return
+
+                header, rows = options.select(header, rows, options.read_columns(header))
+                self.table_builder.table_specs.load_table(header, rows)
+            if options.cacheable():
+                self.table_builder.import_cache.store(file_name, "pdf", **cache_options)
             self.table_builder.name = os.path.splitext(os.path.basename(file_name))[0]
-            self.table_builder.system_message.create_information_message("PDF file loaded successfully.")
+            self.table_builder.system_message.create_information_message(options.loaded_message("PDF file"))
         except Exception as e:
             self.table_builder.system_message.create_error_message(f"Failed to load PDF file: {e}")
\ No newline at end of file
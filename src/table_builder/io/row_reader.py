@@ -0,0 +1,62 @@
+import contextlib
+import csv
+import os
+import pdfplumber
+from openpyxl import load_workbook
+from . import compression
+from .ods_reader import ODSReader
+
+# File types `open_rows` can read, by extension.
+ROW_READER_EXTENSIONS = (".csv", ".xlsx", ".xlsm", ".ods", ".pdf")
+
+
+def is_readable(path: str) -> bool:
+    """
+    Returns:
+        bool: True if `open_rows` can read the file, going by its extension.
+    """
+    return compression.has_extension(path, ".csv") or os.path.splitext(path)[1].lower() in ROW_READER_EXTENSIONS
+
+
+@contextlib.contextmanager
+def open_rows(path: str):
+    """
+    Open a CSV, XLSX, ODS or PDF file as a stream of rows, without loading it into the table.
+
+    CSV files may be compressed. XLSX files are read from their first sheet in read-only mode,
+    ODS files from their first sheet with the streaming reader, and PDF tables page by page.
+
+    Yields:
+        tuple: The header and an iterator of the data rows, valid until the block exits.
+
+    Raises:
+        ValueError: If the file type is not supported or the file has no rows.
+    """
+    if compression.has_extension(path, ".csv"):
+        with compression.open_text(path, "r", newline="") as csv_file:
+            reader = csv.reader(csv_file)
+            yield _split_header(reader, path)
+        return
+
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".xlsx", ".xlsm"):
+        workbook = load_workbook(filename=path, read_only=True, data_only=True)
+        try:
+            yield _split_header(workbook.active.iter_rows(values_only=True), path)
+        finally:
+            workbook.close()
+    elif extension == ".ods":
+        yield _split_header(ODSReader(path).iter_rows(), path)
+    elif extension == ".pdf":
+        with pdfplumber.open(path) as pdf:
+            yield _split_header((row for page in pdf.pages for row in (page.extract_table() or [])), path)
+    else:
+        raise ValueError(f"Cannot read '{path}'. Use a CSV, XLSX, ODS or PDF file.")
+
+
+def _split_header(rows, path: str) -> tuple:
+    rows = iter(rows)
+    header = next(rows, None)
+    if not header:
+        raise ValueError(f"'{path}' is empty.")
+    return [str(name) if name is not None else "" for name in header], rows
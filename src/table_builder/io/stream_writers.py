@@ -0,0 +1,202 @@
+import csv
+import itertools
+import json
+import zipfile
+from abc import ABC, abstractmethod
+from xml.sax.saxutils import escape
+from openpyxl import Workbook
+from . import compression
+
+_ODS_MIMETYPE = "application/vnd.oasis.opendocument.spreadsheet"
+
+_ODS_MANIFEST = """<?xml version="1.0" encoding="UTF-8"?>
+<manifest:manifest xmlns:manifest="urn:oasis:names:tc:opendocument:xmlns:manifest:1.0" manifest:version="1.2">
+ <manifest:file-entry manifest:full-path="/" manifest:media-type="application/vnd.oasis.opendocument.spreadsheet"/>
+ <manifest:file-entry manifest:full-path="content.xml" manifest:media-type="text/xml"/>
+</manifest:manifest>
+"""
+
+_ODS_CONTENT_START = """<?xml version="1.0" encoding="UTF-8"?>
+<office:document-content xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0" \
+xmlns:table="urn:oasis:names:tc:opendocument:xmlns:table:1.0" \
+xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0" office:version="1.2">
+<office:body><office:spreadsheet><table:table table:name="{sheet_name}">
+"""
+
+_ODS_CONTENT_END = "</table:table></office:spreadsheet></office:body></office:document-content>\n"
+
+# Rows rendered to XML per write, so a large iterable of rows is never held as one string.
+ODS_WRITE_BATCH_SIZE = 1_000
+
+# Most rows an XLSX sheet holds, the header included.
+XLSX_MAX_ROWS = 1_048_576
+
+
+class StreamWriter(ABC):
+
+    def __init__(self, path: str):
+        """
+        Writes a table to a file one row at a time, so the rows never have to be held in memory.
+
+        Use as a context manager: write the header, then any number of row batches. Missing
+        (None) cells are written as empty cells.
+
+        :param path: Path of the file to write.
+        """
+        self.path = path
+        self.header = []
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @abstractmethod
+    def open(self) -> None:
+        pass
+
+    def write_header(self, header: list) -> None:
+        self.header = list(header)
+
+    @abstractmethod
+    def write_rows(self, rows) -> None:
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
+
+
+class CSVStreamWriter(StreamWriter):
+
+    def open(self) -> None:
+        self.file = compression.open_text(self.path, "w", newline="")
+        self.writer = csv.writer(self.file)
+
+    def write_header(self, header: list) -> None:
+        super().write_header(header)
+        self.writer.writerow(self.header)
+
+    def write_rows(self, rows) -> None:
+        self.writer.writerows(rows)
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class XLSXStreamWriter(StreamWriter):
+
+    def open(self) -> None:
+        # Write-only workbooks stream each appended row to a temporary file instead of keeping cells
+        self.workbook = Workbook(write_only=True)
+        self.sheet = self.workbook.create_sheet("Sheet1")
+        self.rows_written = 0
+        self.overflowed = False
+
+    def write_header(self, header: list) -> None:
+        super().write_header(header)
+        self.write_rows([self.header])
+
+    def write_rows(self, rows) -> None:
+        """
+        Raises:
+            ValueError: If the sheet would hold more than XLSX_MAX_ROWS rows. The workbook is
+                then not saved, so no cut-off file is left behind.
+        """
+        append = self.sheet.append
+        for row in rows:
+            if self.rows_written >= XLSX_MAX_ROWS:
+                self.overflowed = True
+                raise ValueError(
+                    f"An XLSX sheet holds at most {XLSX_MAX_ROWS:,} rows, the header included. "
+                    "Save as CSV, ODS or NDJSON instead."
+                )
+            append(row)
+            self.rows_written += 1
+
+    def close(self) -> None:
+        if self.overflowed:
+            # Finish the sheet's temporary file without writing the workbook
+            self.sheet.close()
+        else:
+            self.workbook.save(self.path)
+
+
+class ODSStreamWriter(StreamWriter):
+
+    def __init__(self, path: str, sheet_name: str = "Sheet1"):
+        super().__init__(path)
+        self.sheet_name = sheet_name
+
+    def open(self) -> None:
+        self.archive = zipfile.ZipFile(self.path, "w", compression=zipfile.ZIP_DEFLATED)
+        # The mimetype entry must come first and be stored uncompressed
+        self.archive.writestr(zipfile.ZipInfo("mimetype"), _ODS_MIMETYPE, compress_type=zipfile.ZIP_STORED)
+        self.archive.writestr("META-INF/manifest.xml", _ODS_MANIFEST)
+        self.content = self.archive.open("content.xml", "w", force_zip64=True)
+        self.content.write(_ODS_CONTENT_START.format(sheet_name=escape(self.sheet_name, {'"': "&quot;"})).encode("utf-8"))
+
+    def write_header(self, header: list) -> None:
+        super().write_header(header)
+        self.write_rows([self.header])
+
+    def write_rows(self, rows) -> None:
+        cell = self.cell_xml
+        rows = iter(rows)
+        while batch := list(itertools.islice(rows, ODS_WRITE_BATCH_SIZE)):
+            self.content.write("".join(
+                f"<table:table-row>{''.join(map(cell, row))}</table:table-row>\n" for row in batch
+            ).encode("utf-8"))
+
+    @staticmethod
+    def cell_xml(value) -> str:
+        if value is None or value == "":
+            return "<table:table-cell/>"
+        if value is True or value is False:
+            text = "true" if value else "false"
+            return f'<table:table-cell office:value-type="boolean" office:boolean-value="{text}"><text:p>{text.upper()}</text:p></table:table-cell>'
+        if isinstance(value, (int, float)):
+            return f'<table:table-cell office:value-type="float" office:value="{value!r}"><text:p>{value}</text:p></table:table-cell>'
+        return f'<table:table-cell office:value-type="string"><text:p>{escape(str(value))}</text:p></table:table-cell>'
+
+    def close(self) -> None:
+        self.content.write(_ODS_CONTENT_END.encode("utf-8"))
+        self.content.close()
+        self.archive.close()
+
+
+class NDJSONStreamWriter(StreamWriter):
+
+    def open(self) -> None:
+        self.file = compression.open_text(self.path, "w")
+
+    def write_rows(self, rows) -> None:
+        header = self.header
+        self.file.writelines(json.dumps(dict(zip(header, row)), ensure_ascii=False) + "\n" for row in rows)
+
+    def close(self) -> None:
+        self.file.close()
+
+
+# File format mapped to its writer and file extension.
+STREAM_WRITERS = {
+    "csv": (CSVStreamWriter, ".csv"),
+    "xlsx": (XLSXStreamWriter, ".xlsx"),
+    "ods": (ODSStreamWriter, ".ods"),
+    "ndjson": (NDJSONStreamWriter, ".ndjson"),
+}
+
+
+def open_stream_writer(path: str, file_format: str) -> StreamWriter:
+    """
+    Args:
+        path (str): Path of the file to write.
+        file_format (str): One of the STREAM_WRITERS formats.
+
+    Returns:
+        StreamWriter: An unopened writer for the format; use it in a `with` block.
+    """
+    writer_class, _ = STREAM_WRITERS[file_format]
+    return writer_class(path)
@@ -0,0 +1,445 @@
+import itertools
+import json
+import math
+import operator
+import random
+import re
+from database.cross_search import escape_like
+
+# One condition: a column (optionally in double quotes), an operator and a value.
+_CONDITION = re.compile(r'^\s*(?:"(?P<quoted>[^"]+)"|(?P<column>.+?))\s*(?P<op>==|!=|<>|<=|>=|=|<|>|\bcontains\b)\s*(?P<value>.*?)\s*$', re.IGNORECASE)
+_AND = re.compile(r"\s+and\s+", re.IGNORECASE)
+
+_OPERATORS = {
+    "=": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+_BOOLEANS = {"true": 1, "false": 0}
+
+# A comparison with a number in SQL, made the way `_compile_condition` makes it for files: cells
+# holding a number, numeric text or true/false compare as numbers, and any other text compares
+# as text. Text is numeric when it is a JSON number, which covers the numbers files and
+# databases write. Takes the number three times, then the value as text.
+_SQL_NUMBER_COMPARISON = (
+    'CASE WHEN typeof("{column}") IN (\'integer\', \'real\') THEN "{column}" {op} ? '
+    'WHEN lower(trim("{column}")) IN (\'true\', \'false\') THEN (lower(trim("{column}")) = \'true\') {op} ? '
+    'WHEN CASE WHEN json_valid(trim("{column}")) THEN json_type(trim("{column}")) END IN (\'integer\', \'real\') '
+    'THEN CAST(trim("{column}") AS REAL) {op} ? '
+    'ELSE CAST("{column}" AS TEXT) {op} ? END'
+)
+
+# How a sample picks its rows.
+SAMPLING_METHODS = {
+    "head": "The first rows, so reading stops as soon as the sample is full.",
+    "random": "A uniform random sample of all rows, drawn in one pass.",
+}
+
+# Rows previewed when no sample size is given.
+PREVIEW_ROWS = 100
+
+
+def _as_number(value):
+    """
+    Returns:
+        The value as an int or float, with true and false as 1 and 0, or None if it is not a number.
+    """
+    if isinstance(value, (int, float)):
+        return int(value) if isinstance(value, bool) else value
+    if not isinstance(value, str):
+        return None
+    text = value.strip()
+    lowered = text.lower()
+    if lowered in _BOOLEANS:
+        return _BOOLEANS[lowered]
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+def _split_conditions(text: str) -> list:
+    """
+    Split a condition on `and`, except inside quoted values. A quote only opens a value at the
+    start of a word, so apostrophes inside unquoted values are kept as they are.
+    """
+    parts = []
+    start = idx = 0
+    quote = None
+    while idx < len(text):
+        char = text[idx]
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"" and (idx == 0 or text[idx - 1] in " =<>!"):
+            quote = char
+        else:
+            match = _AND.match(text, idx)
+            if match:
+                parts.append(text[start:idx])
+                start = idx = match.end()
+                continue
+        idx += 1
+    parts.append(text[start:])
+    return parts
+
+
+def parse_conditions(text: str) -> list:
+    """
+    Parse a row condition such as `region = North and price >= 10 and name contains acme`.
+
+    Conditions are joined with `and`. The operators are =, !=, <, <=, >, >= and contains.
+    Column names with spaces can be written in double quotes, and values in single or double
+    quotes are always compared as text.
+
+    Returns:
+        list: (column, operator, value, number) of every condition. The number is the value
+            as a number, or None if it is compared as text.
+
+    Raises:
+        ValueError: If a condition cannot be parsed.
+    """
+    conditions = []
+    for part in _split_conditions(text.strip()):
+        match = _CONDITION.match(part)
+        if not match or not match.group("value"):
+            raise ValueError(f"Invalid condition '{part}'. Use a column, an operator (=, !=, <, <=, >, >=, contains) and a value.")
+        column = match.group("quoted") or match.group("column").strip()
+        op = match.group("op").lower()
+        op = {"==": "=", "<>": "!="}.get(op, op)
+        value = match.group("value")
+        number = None
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+            value = value[1:-1]
+        elif op != "contains":
+            number = _as_number(value)
+        conditions.append((column, op, value, number))
+    return conditions
+
+
+def _compile_condition(position: int, op: str, value: str, number):
+    """
+    Returns:
+        callable: A test of a row's raw value at `position`. Empty cells never match, as NULL in SQL.
+    """
+    if op == "contains":
+        needle = value.lower()
+
+        def test(row):
+            cell = row[position]
+            return cell is not None and cell != "" and needle in str(cell).lower()
+        return test
+
+    compare = _OPERATORS[op]
+
+    def test(row):
+        cell = row[position]
+        if cell is None or cell == "":
+            return False
+        if number is not None:
+            cell_number = _as_number(cell)
+            if cell_number is not None:
+                return compare(cell_number, number)
+        try:
+            return compare(str(cell), value)
+        except TypeError:
+            return False
+    return test
+
+
+# Marks the end of the rows while sampling.
+_END = object()
+
+
+def reservoir_sample(rows, size: int, rng: random.Random = None) -> list:
+    """
+    Draw a uniform random sample from rows of unknown count in one pass.
+
+    Uses reservoir sampling with geometric skips (Li's Algorithm L): once the reservoir is full,
+    the number of rows to pass over before the next replacement is drawn directly, so the random
+    number generator is called about `size * log(n / size)` times rather than once per row.
+
+    Args:
+        rows (iterable): The rows to sample.
+        size (int): The sample size.
+        rng (random.Random): The random number generator. A new one if not given.
+
+    Returns:
+        list: The sampled rows, in their source order. Every row if there are no more than `size`.
+    """
+    rng = rng or random.Random()
+    rows = iter(rows)
+    reservoir = list(enumerate(itertools.islice(rows, size)))
+    if len(reservoir) < size or size == 0:
+        return [row for _, row in reservoir]
+
+    def uniform() -> float:
+        # random() can return 0.0, which has no logarithm
+        return rng.random() or 5e-324
+
+    weight = math.exp(math.log(uniform()) / size)
+    index = size - 1
+    while True:
+        skip = math.floor(math.log(uniform()) / math.log1p(-weight)) if weight < 1 else 0
+        row = next(itertools.islice(rows, skip, None), _END)
+        if row is _END:
+            break
+        index += skip + 1
+        reservoir[rng.randrange(size)] = (index, row)
+        weight *= math.exp(math.log(uniform()) / size)
+    reservoir.sort(key=operator.itemgetter(0))
+    return [row for _, row in reservoir]
+
+
+class LoadOptions:
+
+    def __init__(self, columns: list = None, where: str = None, limit: int = None, offset: int = 0, sample: int = None, sampling: str = "head"):
+        """
+        Which part of a source to load: a subset of its columns, the rows matching a condition,
+        a window of those rows, and a sample of the window.
+
+        Every loader honors the same options while it reads, so unneeded data is skipped as
+        early as the source allows. File loaders drop unselected fields before any conversion
+        and stop reading once the limit is reached. Database loads turn the options into the
+        SELECT itself.
+
+        :param columns: Names of the columns to load, in order. All columns if not given.
+        :param where: Row condition, see `parse_conditions`.
+        :param limit: Most rows to load, counted after the condition.
+        :param offset: Matching rows to skip before loading.
+        :param sample: Size of a sample of the rows to load instead of all of them.
+        :param sampling: How the sample is drawn, one of SAMPLING_METHODS.
+
+        Raises:
+            ValueError: If the condition cannot be parsed, the limit, offset or sample size is
+                negative, or the sampling method is unknown.
+        """
+        if (limit is not None and limit < 0) or offset < 0 or (sample is not None and sample < 0):
+            raise ValueError("The row limit, offset and sample size cannot be negative.")
+        if sampling not in SAMPLING_METHODS:
+            raise ValueError(f"Unknown sampling method '{sampling}'. Use one of: {', '.join(SAMPLING_METHODS)}.")
+        self.columns = list(columns or [])
+        self.where = where.strip() if where and where.strip() else None
+        self.conditions = parse_conditions(self.where) if self.where else []
+        self.limit = limit
+        self.offset = offset
+        self.sample = sample
+        self.sampling = sampling
+
+    def is_default(self) -> bool:
+        return not self.columns and not self.conditions and self.limit is None and not self.offset and self.sample is None
+
+    def with_sample(self, sample: int = None, sampling: str = "head") -> "LoadOptions":
+        """
+        Returns:
+            LoadOptions: The same columns, condition and window with another sample, or with no
+                sample at all if `sample` is None.
+        """
+        return LoadOptions(self.columns, self.where, self.limit, self.offset, sample, sampling)
+
+    def cacheable(self) -> bool:
+        """
+        Returns:
+            bool: False for samples, which are quick to read again and, when random, must differ
+                between loads.
+        """
+        return self.sample is None
+
+    def cache_options(self) -> dict:
+        """
+        Returns:
+            dict: The options as import cache key fields, empty when everything is loaded so
+                full loads keep their cache entries.
+        """
+        if self.is_default():
+            return {}
+        return {"columns": tuple(self.columns), "where": self.where, "limit": self.limit, "offset": self.offset}
+
+    def describe(self) -> str:
+        parts = []
+        if self.columns:
+            parts.append(f"columns {', '.join(self.columns)}")
+        if self.where:
+            parts.append(f"rows where {self.where}")
+        if self.offset:
+            parts.append(f"skipping {self.offset:,} rows")
+        if self.limit is not None:
+            parts.append(f"at most {self.limit:,} rows")
+        if self.sample is not None:
+            parts.append(f"a random sample of {self.sample:,} rows" if self.sampling == "random" else f"the first {self.sample:,} rows")
+        return "; ".join(parts) if parts else "all columns and rows"
+
+    def loaded_message(self, source: str) -> str:
+        if self.is_default():
+            return f"{source} loaded successfully."
+        return f"{source} loaded successfully ({self.describe()})."
+
+    def read_columns(self, header: list) -> list:
+        """
+        Resolve the columns that have to be read from a source: the selected columns followed
+        by any other columns the condition needs.
+
+        Args:
+            header (list): The source's column names.
+
+        Returns:
+            list: Positions in the source of the columns to read, or None if every column is
+                loaded.
+
+        Raises:
+            ValueError: If a selected or tested column is not in the header.
+        """
+        names = [str(name) if name is not None else "" for name in header]
+        wanted = self.columns or names
+        missing = [name for name in dict.fromkeys(self.columns + [condition[0] for condition in self.conditions]) if name not in names]
+        if missing:
+            raise ValueError(f"Unknown columns: {', '.join(missing)}")
+        if not self.columns:
+            return None
+        positions = [names.index(name) for name in wanted]
+        for column, _, _, _ in self.conditions:
+            if names.index(column) not in positions:
+                positions.append(names.index(column))
+        return positions
+
+    def select(self, header: list, rows, read_columns: list = None, projected: bool = False, windowed: bool = False) -> tuple:
+        """
+        Apply the options to the rows of a source as they are read.
+
+        Args:
+            header (list): The source's column names.
+            rows (iterable): The source's data rows.
+            read_columns (list): The result of `read_columns(header)`.
+            projected (bool): The rows already hold only the `read_columns`, in that order, as
+                when the reader itself skipped the other columns.
+            windowed (bool): The reader already skipped `offset` rows and stops after `limit`.
+                Only allowed without a condition.
+
+        Returns:
+            tuple: The column names loaded and an iterator of their rows.
+        """
+        names = [str(name) if name is not None else "" for name in header]
+        output_names = self.columns or list(header)
+        width = len(output_names)
+        stop = None if self.limit is None else self.offset + self.limit
+        window = not windowed and (self.offset or stop is not None)
+
+        if not self.conditions:
+            # Rows are cut to the window and sample before projecting, so skipped rows cost nothing
+            if window:
+                rows = itertools.islice(rows, self.offset, stop)
+            rows = self._sample(rows)
+            if read_columns is not None and not projected:
+                rows = self._project(rows, read_columns)
+            return output_names, rows
+
+        if read_columns is None:
+            # Every column is loaded: the condition looks at source positions
+            positions = {name: names.index(name) for name, _, _, _ in self.conditions}
+        else:
+            if not projected:
+                rows = self._project(rows, read_columns)
+            positions = {names[position]: idx for idx, position in enumerate(read_columns)}
+
+        tests = [_compile_condition(positions[column], op, value, number) for column, op, value, number in self.conditions]
+        padded = len(names) if read_columns is None else len(read_columns)
+        rows = (row for row in self._pad(rows, padded) if all(test(row) for test in tests))
+
+        if window:
+            rows = itertools.islice(rows, self.offset, stop)
+        rows = self._sample(rows)
+        if read_columns is not None and len(read_columns) > width:
+            # Drop the columns only read for the condition
+            rows = (row[:width] for row in rows)
+        return output_names, rows
+
+    def _sample(self, rows):
+        """
+        Returns:
+            iterable: The rows, or the sample of them. A head sample stays lazy so reading stops
+                once it is full.
+        """
+        if self.sample is None:
+            return rows
+        if self.sampling == "head":
+            return itertools.islice(rows, self.sample)
+        return iter(reservoir_sample(rows, self.sample))
+
+    @staticmethod
+    def _project(rows, positions: list):
+        """
+        Yields:
+            list: Each row cut down to the cells at `positions`, in order. Short rows give None
+                for the missing cells.
+        """
+        last = max(positions)
+        getter = operator.itemgetter(*positions)
+        single = len(positions) == 1
+        for row in rows:
+            if len(row) > last:
+                values = getter(row)
+                yield [values] if single else list(values)
+            else:
+                width = len(row)
+                yield [row[position] if position < width else None for position in positions]
+
+    @staticmethod
+    def _pad(rows, width: int):
+        for row in rows:
+            yield row if len(row) >= width else list(row) + [None] * (width - len(row))
+
+    def to_sql(self, table_name: str, table_columns: list, rowids: list = None) -> tuple:
+        """
+        Build the SELECT that loads a database table with these options, with the condition,
+        the row window and the sample pushed into SQLite.
+
+        Args:
+            table_name (str): The table to load.
+            table_columns (list): The table's column names.
+            rowids (list): Only load the rows with these rowids, as picked for a random sample
+                by `DatabaseHandler.sample_rowids`. The sample itself is then left out of the query.
+
+        Returns:
+            tuple: The column names selected, the query and its parameters.
+
+        Raises:
+            ValueError: If a selected or tested column is not in the table.
+        """
+        self.read_columns(table_columns)
+        selected = self.columns or list(table_columns)
+        column_list = ", ".join(f'"{name}"' for name in selected)
+        query = f'SELECT {column_list} FROM "{table_name}"'
+        parameters = []
+
+        clauses = []
+        for column, op, value, number in self.conditions:
+            if op == "contains":
+                clauses.append(f'"{column}" LIKE ? ESCAPE \'\\\'')
+                parameters.append(f"%{escape_like(value)}%")
+            elif number is None:
+                clauses.append(f'"{column}" <> \'\' AND "{column}" {op} ?')
+                parameters.append(value)
+            else:
+                clauses.append(f'"{column}" <> \'\' AND ' + _SQL_NUMBER_COMPARISON.format(column=column, op=op))
+                parameters.extend([number, number, number, value])
+        if rowids is not None:
+            clauses.append("rowid IN (SELECT value FROM json_each(?))")
+            parameters.append(json.dumps(rowids))
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        if self.limit is not None or self.offset:
+            query += " LIMIT ? OFFSET ?"
+            parameters.extend([-1 if self.limit is None else self.limit, self.offset])
+        if self.sample is not None and rowids is None:
+            order = " ORDER BY random()" if self.sampling == "random" else ""
+            query = f"SELECT * FROM ({query}){order} LIMIT ?"
+            parameters.append(self.sample)
+        return selected, query, parameters
@@ -0,0 +1,299 @@
+import signal
+import sqlite3
+import time
+from rich.tree import Tree
+
+# Rows fetched and shown per page of a query result.
+SQL_PAGE_SIZE = 20
+
+# Pages kept for going back; older pages are dropped so a huge result never piles up in memory.
+SQL_PAGE_HISTORY = 50
+
+# Rows fetched from SQLite at a time when a result is imported.
+SQL_IMPORT_BATCH_SIZE = 10_000
+
+# SQLite virtual machine steps between two checks for a cancel request.
+PROGRESS_HANDLER_STEPS = 10_000
+
+# Errors a statement can raise. Before Python 3.11, more than one statement at a time raises
+# sqlite3.Warning, which is not an sqlite3.Error.
+_SQL_ERRORS = (sqlite3.Error, sqlite3.Warning)
+
+
+class SQLConsole:
+
+    def __init__(self, table_builder):
+        """
+        Runs SQL statements against the connected database.
+
+        Query results are read with `fetchmany` one page at a time, so only the pages being
+        shown are ever in memory and results of any size can be browsed. A running statement
+        is cancelled with Ctrl+C through SQLite's progress handler, which leaves the connection
+        usable. A result can be imported into the table, and `explain <query>` shows the
+        query plan SQLite picks.
+        """
+        self.table_builder = table_builder
+        self.cancelled = False
+
+    def run(self) -> bool:
+        """
+        Read and run statements until the user exits.
+
+        Returns:
+            bool: True if a query result was imported into the table.
+        """
+        if not self.table_builder.database_handler.ensure_connected_database():
+            return False
+
+        self.table_builder.system_message.create_information_message(
+            "Enter a SQL statement to run it, [bold cyan]explain <query>[/] to see its query plan, or [bold cyan]exit[/] to leave. "
+            "Press [bold cyan]Ctrl+C[/] to cancel a running statement."
+        )
+        while True:
+            statement = self.table_builder.console.input("[bold red]SQL[/] - [bold yellow]Enter a statement[/]: ").strip().rstrip(";").strip()
+            if not statement:
+                continue
+            if statement.lower() in ("exit", "quit"):
+                return False
+            if statement.lower().startswith("explain ") and not statement.lower().startswith("explain query plan"):
+                self.explain(statement[len("explain "):])
+            elif self.execute(statement):
+                return True
+
+    def _progress(self) -> int:
+        # A non-zero return makes SQLite abort the statement with "interrupted"
+        return 1 if self.cancelled else 0
+
+    def _cancel(self, signum, frame) -> None:
+        self.cancelled = True
+
+    def _run_cancellable(self, function, *args):
+        """
+        Call a function that steps SQLite, with Ctrl+C cancelling the statement instead of
+        stopping the app.
+
+        Raises:
+            sqlite3.OperationalError: "interrupted" if the statement was cancelled.
+        """
+        connection = self.table_builder.database.connection
+        self.cancelled = False
+        connection.set_progress_handler(self._progress, PROGRESS_HANDLER_STEPS)
+        try:
+            previous_handler = signal.signal(signal.SIGINT, self._cancel)
+        except ValueError:
+            # Signal handlers can only be installed from the main thread
+            previous_handler = None
+        try:
+            return function(*args)
+        finally:
+            if previous_handler is not None:
+                signal.signal(signal.SIGINT, previous_handler)
+            connection.set_progress_handler(None, 0)
+
+    def _report_error(self, e: Exception) -> None:
+        if self.cancelled:
+            self.table_builder.system_message.create_information_message("Statement cancelled.")
+        else:
+            self.table_builder.system_message.create_error_message(f"SQL error: {e}")
+
+    def execute(self, statement: str) -> bool:
+        """
+        Run one statement. Results are paged; other statements are committed and the number of
+        changed rows is reported.
+
+        Returns:
+            bool: True if the result was imported into the table.
+        """
+        connection = self.table_builder.database.connection
+        cursor = connection.cursor()
+        try:
+            start = time.perf_counter()
+            self._run_cancellable(cursor.execute, statement)
+            if cursor.description is None:
+                connection.commit()
+                changed = f" [bold cyan]{cursor.rowcount:,}[/] rows changed." if cursor.rowcount >= 0 else ""
+                self.table_builder.system_message.create_information_message(
+                    f"Statement ran in [bold cyan]{time.perf_counter() - start:.3f}[/] seconds.{changed}"
+                )
+                return False
+            imported = self._page_results(statement, cursor, start)
+            if connection.in_transaction:
+                # A statement that returns rows can also change them, e.g. INSERT ... RETURNING
+                cursor.close()
+                connection.commit()
+            return imported
+        except _SQL_ERRORS as e:
+            if connection.in_transaction:
+                connection.rollback()
+            self._report_error(e)
+            return False
+        finally:
+            cursor.close()
+
+    def _page_results(self, statement: str, cursor: sqlite3.Cursor, start: float) -> bool:
+        header = self.column_names(cursor.description)
+        pages = {}
+        page = 0
+        finished = False
+
+        while True:
+            if page not in pages:
+                rows = self._run_cancellable(cursor.fetchmany, SQL_PAGE_SIZE)
+                finished = len(rows) < SQL_PAGE_SIZE
+                pages[page] = rows
+                pages.pop(page - SQL_PAGE_HISTORY, None)
+            rows = pages[page]
+            first = page * SQL_PAGE_SIZE
+
+            if page == 0:
+                shown = f"{len(rows):,} rows" if finished else f"first page in {time.perf_counter() - start:.3f} seconds"
+            else:
+                shown = f"rows {first + 1:,}-{first + len(rows):,}"
+            more = "end of result" if finished and page == max(pages) else "more rows follow"
+            caption = f"[bold yellow]{shown}, {more}[/]"
+            self.table_builder.console.print(self.table_builder.table_display.build_page_table(header, rows, first, "Query Result", caption))
+
+            if finished and len(pages) == 1:
+                choice = self.table_builder.input_handler.get_user_input("[bold yellow]Enter 'import' to load the result into the table, or press Enter to continue[/]: ")
+            else:
+                choice = self.table_builder.input_handler.get_user_input(
+                    "[bold yellow]Enter 'n'/'p' for the next/previous page, 'import' to load the whole result into the table, or 'q' to stop[/]: "
+                )
+            choice = (choice or "q").strip().lower()
+            if choice == "n":
+                if finished and page == max(pages):
+                    self.table_builder.system_message.create_information_message("This is the last page.")
+                else:
+                    page += 1
+            elif choice == "p":
+                if page == 0:
+                    self.table_builder.system_message.create_information_message("This is the first page.")
+                elif page - 1 in pages:
+                    page -= 1
+                else:
+                    self.table_builder.system_message.create_information_message("Earlier pages are no longer kept. Run the query again to see them.")
+            elif choice == "import":
+                if self.is_read_only(statement):
+                    return self.import_result(statement)
+                self.table_builder.system_message.create_error_message(
+                    "Only queries that read data can be imported. This statement changes the database, so running it again to import its result would change it again."
+                )
+            elif choice in ("q", ""):
+                return False
+            else:
+                self.table_builder.system_message.create_error_message("Invalid input.")
+
+    @staticmethod
+    def column_names(description) -> list:
+        """
+        Returns:
+            list: The result's column names, with repeated names numbered so each is unique.
+        """
+        names = []
+        seen = set()
+        for column in description:
+            name, suffix = column[0], 2
+            while name in seen:
+                name = f"{column[0]}_{suffix}"
+                suffix += 1
+            seen.add(name)
+            names.append(name)
+        return names
+
+    def is_read_only(self, statement: str) -> bool:
+        """
+        Tell whether a statement only reads the database, as `sqlite3_stmt_readonly` does, from
+        the program SQLite compiles it to: a statement that writes opens a write transaction.
+        The statement is compiled but not run.
+
+        Returns:
+            bool: True if running the statement again changes nothing.
+        """
+        if statement.lower().startswith("explain"):
+            return True
+        try:
+            program = self.table_builder.database.connection.execute(f"EXPLAIN {statement}").fetchall()
+        except _SQL_ERRORS:
+            return False
+        # EXPLAIN rows are (addr, opcode, p1, p2, ...); P2 of Transaction is non-zero for a write
+        return not any(row[1] == "Transaction" and row[3] for row in program)
+
+    def import_result(self, statement: str) -> bool:
+        """
+        Run a read-only query again and load its whole result into the table, replacing the
+        table data. Column types are taken from the values SQLite returns.
+
+        Returns:
+            bool: True if the result was imported.
+        """
+        name = self.table_builder.input_handler.get_user_input("[bold yellow]Enter a name for the table (press Enter for 'query_result')[/]: ")
+        if name is None:
+            return False
+
+        cursor = self.table_builder.database.connection.cursor()
+        try:
+            with self.table_builder.console.status("[bold yellow]Importing query result...[/]") as status:
+                self._run_cancellable(cursor.execute, statement)
+                names = self.column_names(cursor.description)
+                rows = []
+                while batch := self._run_cancellable(cursor.fetchmany, SQL_IMPORT_BATCH_SIZE):
+                    rows.extend(dict(zip(names, values)) for values in batch)
+                    status.update(f"[bold yellow]Imported [bold cyan]{len(rows):,}[/] rows...[/]")
+        except _SQL_ERRORS as e:
+            self._report_error(e)
+            return False
+        finally:
+            cursor.close()
+
+        columns = [{"name": column_name, "type": self.column_type(rows, column_name)} for column_name in names]
+        for column in columns:
+            column_name = column["name"]
+            if column["type"] == "float":
+                for row in rows:
+                    if row[column_name].__class__ is int:
+                        row[column_name] = float(row[column_name])
+            elif column["type"] == "str":
+                for row in rows:
+                    value = row[column_name]
+                    if value is not None and value.__class__ is not str:
+                        row[column_name] = value.hex() if isinstance(value, bytes) else str(value)
+
+        self.table_builder.table_data["columns"] = columns
+        self.table_builder.table_data["rows"] = rows
+        self.table_builder.table_encoding.encode_columns()
+        self.table_builder.notify("table_loaded")
+        self.table_builder.name = name or "query_result"
+        self.table_builder.table_saved = False
+        self.table_builder.system_message.create_information_message(
+            f"Imported [bold cyan]{len(rows):,}[/] rows into table '[bold cyan]{self.table_builder.name}[/]'."
+        )
+        return True
+
+    @staticmethod
+    def column_type(rows: list, column_name: str) -> str:
+        """
+        Returns:
+            str: "int" or "float" if every non-empty value of the column is of that kind, else "str".
+        """
+        kinds = {row[column_name].__class__ for row in rows if row[column_name] is not None}
+        if kinds == {int}:
+            return "int"
+        if kinds and kinds <= {int, float}:
+            return "float"
+        return "str"
+
+    def explain(self, query: str) -> None:
+        """
+        Print the plan SQLite picks for a query as a tree, e.g. to check that an index is used.
+        """
+        try:
+            plan = self.table_builder.database.connection.execute(f"EXPLAIN QUERY PLAN {query}").fetchall()
+        except _SQL_ERRORS as e:
+            self._report_error(e)
+            return
+
+        tree = Tree("[bold red]Query Plan[/]")
+        nodes = {0: tree}
+        for node_id, parent_id, _, detail in plan:
+            nodes[node_id] = nodes.get(parent_id, tree).add(f"[cyan]{detail}[/]")
+        self.table_builder.console.print(tree)
@@ -15,7 +15,8 @@ class TableCommands:
             self.table_builder.table_display.print_table()
 
         while True:
-            builder_command = self.table_builder.console.input("[bold red]Table Builder[/] - [bold yellow]Enter a command[/]: ").lower().strip()
+            raw_command = self.table_builder.console.input("[bold red]Table Builder[/] - [bold yellow]Enter a command[/]: ").strip()
+            builder_command = raw_command.lower()
 
             if builder_command == "print help":
                 self.table_builder.instruction_message.print_table_builder_instructions()
@@ -24,7 +25,7 @@ class TableCommands:
                 self.table_builder.table_operations.add_column()
 
                 if self.table_builder.settings.get_setting("autoprint_table") == "on":
-                    self.table_builder.table_display.print_table()
+                    self.table_builder.table_display.print_changes()
 
                 if self.table_builder.settings.get_setting("auto_update") == "on":
                     self.table_builder.database_handler.save_to_database()
@@ -32,7 +33,7 @@ class TableCommands:
             elif builder_command == "change type":
                 self.table_builder.table_operations.change_column_type()
                 if self.table_builder.settings.get_setting("autoprint_table") == "on":
-                    self.table_builder.table_display.print_table()
+                    self.table_builder.table_display.print_changes()
 
                 if self.table_builder.settings.get_setting("auto_update") == "on":
                     self.table_builder.database_handler.save_to_database()
@@ -41,21 +42,46 @@ class TableCommands:
                 self.table_builder.table_operations.edit_column_name()
 
                 if self.table_builder.settings.get_setting("autoprint_table") == "on":
-                    self.table_builder.table_display.print_table()
+                    self.table_builder.table_display.print_changes()
 
                 if self.table_builder.settings.get_setting("auto_update") == "on":
                     self.table_builder.database_handler.save_to_database()
 
             elif builder_command == "add row":
                 self.table_builder.table_operations.add_row()
+                if self.table_builder.settings.get_setting("autoprint_table") == "on":
+                    self.table_builder.table_display.print_changes()
+
+                if self.table_builder.settings.get_setting("auto_update") == "on":
+                    self.table_builder.database_handler.save_to_database()
+
+            elif builder_command == "find" or builder_command.startswith("find "):
+                self.table_builder.table_search.find(raw_command[len("find"):].strip() or None)
+
+            elif builder_command == "describe" or builder_command.startswith("describe "):
+                self.table_builder.table_stats.describe(raw_command[len("describe"):].strip() or None)
+
+            elif builder_command == "edit cell" or builder_command.startswith("edit cell "):
+                # Keep the address's original case, column names are case sensitive
+                self.table_builder.table_operations.edit_cell(raw_command[len("edit cell"):].strip() or None)
+                if self.table_builder.settings.get_setting("autoprint_table") == "on":
+                    self.table_builder.table_display.print_changes()
+
+                if self.table_builder.settings.get_setting("auto_update") == "on":
+                    self.table_builder.database_handler.save_to_database()
+
+            elif builder_command == "sort" or builder_command.startswith("sort "):
+                # Keep the keys' original case, column names are case sensitive
+                self.table_builder.table_operations.sort_table(raw_command[len("sort"):].strip() or None)
                 if self.table_builder.settings.get_setting("autoprint_table") == "on":
                     self.table_builder.table_display.print_table()
 
                 if self.table_builder.settings.get_setting("auto_update") == "on":
                     self.table_builder.database_handler.save_to_database()
 
-            elif builder_command == "edit cell":
-                self.table_builder.table_operations.edit_cell()
+            elif builder_command == "dedupe" or builder_command.startswith("dedupe "):
+                # Keep the columns' original case, column names are case sensitive
+                self.table_builder.table_operations.dedupe_table(raw_command[len("dedupe"):].strip() or None)
                 if self.table_builder.settings.get_setting("autoprint_table") == "on":
                     self.table_builder.table_display.print_table()
 
@@ -65,7 +91,7 @@ class TableCommands:
             elif builder_command == "remove column":
                 self.table_builder.table_operations.remove_column()
                 if self.table_builder.settings.get_setting("autoprint_table") == "on":
-                    self.table_builder.table_display.print_table()
+                    self.table_builder.table_display.print_changes()
 
                 if self.table_builder.settings.get_setting("auto_update") == "on":
                     self.table_builder.database_handler.save_to_database()
@@ -73,7 +99,7 @@ class TableCommands:
             elif builder_command == "remove row":
                 self.table_builder.table_operations.remove_row()
                 if self.table_builder.settings.get_setting("autoprint_table") == "on":
-                    self.table_builder.table_display.print_table()
+                    self.table_builder.table_display.print_changes()
 
                 if self.table_builder.settings.get_setting("auto_update") == "on":
                     self.table_builder.database_handler.save_to_database()
@@ -93,7 +119,7 @@ class TableCommands:
             elif builder_command == "rename":
                 self.table_builder.name = self.table_builder.table_operations.name_table()
                 if self.table_builder.settings.get_setting("autoprint_table") == "on":
-                    self.table_builder.table_display.print_table()
+                    self.table_builder.table_display.print_changes()
 
                 if self.table_builder.settings.get_setting("auto_update") == "on":
                     self.table_builder.database_handler.save_to_database()
@@ -106,7 +132,33 @@ class TableCommands:
 
             elif builder_command == "delete table":
                 self.table_builder.database_handler.delete_table()
+
+            elif builder_command == "create index":
+                self.table_builder.database_handler.create_index()
+
+            elif builder_command == "drop index":
+                self.table_builder.database_handler.drop_index()
+
+            elif builder_command == "list indexes":
+                self.table_builder.database_handler.list_indexes()
+
+            elif builder_command == "sql":
+                if self.table_builder.sql_console.run() and self.table_builder.settings.get_setting("autoprint_table") == "on":
+                    self.table_builder.table_display.print_table()
                 
+            elif builder_command == "set load options":
+                self.table_builder.table_specs.set_load_options()
+
+            elif builder_command == "diff":
+                self.table_builder.table_diff.diff()
+
+            elif builder_command == "preview":
+                self.table_builder.table_preview.preview()
+
+            elif builder_command == "load full":
+                if self.table_builder.table_preview.load_full() and self.table_builder.settings.get_setting("autoprint_table") == "on":
+                    self.table_builder.table_display.print_table()
+
             elif builder_command == "load csv":
                 self.table_builder.csv_handler.load_csv()
 
@@ -115,10 +167,28 @@ class TableCommands:
 
             elif builder_command == "load ods":
                 self.table_builder.ods_handler.load_ods()
+
+            elif builder_command == "load ods range":
+                self.table_builder.ods_handler.load_ods_range()
                 
+            elif builder_command == "open csv indexed":
+                self.table_builder.csv_handler.open_csv_indexed()
+
             elif builder_command == "load csv batch":
                 self.table_builder.csv_handler.load_batch_csv()
             
+            elif builder_command == "import csv to table":
+                self.table_builder.database_handler.import_csv_to_table()
+
+            elif builder_command == "load workbook":
+                self.table_builder.database_handler.load_workbook()
+
+            elif builder_command == "cache info":
+                self.table_builder.import_cache.print_cache_info()
+
+            elif builder_command == "purge cache":
+                self.table_builder.import_cache.purge_cache()
+
             elif builder_command == "list tables":
                 self.table_builder.table_display.list_tables()
 
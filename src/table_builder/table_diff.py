@@ -0,0 +1,414 @@
+import contextlib
+import datetime
+import hashlib
+import itertools
+import marshal
+import os
+import sqlite3
+import time
+from rich.table import Table
+from .io.row_reader import is_readable, open_rows
+from .table_display import RenderCache
+
+# Rows listed per kind of change; the counts always cover every row.
+DIFF_SHOW_ROWS = 20
+
+# Booleans are tagged, so they neither equal nor hash like the integers 1 and 0.
+_TRUE = ("bool", True)
+_FALSE = ("bool", False)
+_BOOLEANS = {"true": _TRUE, "false": _FALSE}
+
+# Dates and times are tagged with their kind and compared by their ISO text, the form they take
+# in SQLite tables and CSV files.
+_TEMPORAL_TAGS = {datetime.datetime: "datetime", datetime.date: "date", datetime.time: "time"}
+
+# Marks the keys of the first version that the second version also has.
+_MATCHED = object()
+
+
+def _temporal(text: str):
+    """
+    Returns:
+        The tagged form of an ISO date, date and time, or time, such as "2024-05-01 09:30:00",
+        or None if the text is not one.
+    """
+    if text[4:5] == "-":
+        kind = datetime.date if len(text) == 10 else datetime.datetime
+    elif text[2:3] == ":":
+        kind = datetime.time
+    else:
+        return None
+    try:
+        return _TEMPORAL_TAGS[kind], kind.fromisoformat(text).isoformat()
+    except ValueError:
+        return None
+
+
+def canonical(value):
+    """
+    Returns:
+        The value as compared by a diff: numbers, booleans and dates as numbers, booleans and
+        dates whether they are values or text, so a CSV file, a spreadsheet and a SQLite table
+        holding the same data are equal. Whole floats are integers, booleans and dates are
+        tagged so they stay distinct from numbers and text, and missing and empty cells are None.
+    """
+    if value.__class__ is bool:
+        return _TRUE if value else _FALSE
+    if value.__class__ is float:
+        return int(value) if value.is_integer() else value
+    if value.__class__ is not str:
+        tag = _TEMPORAL_TAGS.get(value.__class__)
+        return (tag, value.isoformat()) if tag is not None else value
+    text = value.strip()
+    if not text:
+        return None
+    if text[0] in "0123456789+-.":
+        try:
+            return int(text)
+        except ValueError:
+            try:
+                return canonical(float(text))
+            except ValueError:
+                return _temporal(text) or text
+    return _BOOLEANS.get(text.lower(), text)
+
+
+def row_hash(cells) -> int:
+    """
+    Returns:
+        int: A 64-bit BLAKE2b digest of the canonical cells, encoded with `marshal`, which tags
+            every value with its type. Version 0 of the format writes every value in full, so
+            equal cells always encode the same way.
+    """
+    data = marshal.dumps(tuple(map(canonical, cells)), 0)
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+
+class DiffResult:
+
+    def __init__(self, key_columns: list, shared_columns: list, only_old: list, only_new: list):
+        """
+        The rows added, removed and changed between two versions of a table. Counts cover every
+        row; rows and cell changes are kept for the first DIFF_SHOW_ROWS of each kind.
+        """
+        self.key_columns = key_columns
+        self.shared_columns = shared_columns
+        self.only_old = only_old
+        self.only_new = only_new
+        self.unchanged = 0
+        self.added = 0
+        self.removed = 0
+        self.changed = 0
+        # Shown rows, in the order they were found
+        self.added_rows = []
+        self.removed_keys = []
+        self.removed_rows = {}
+        self.changed_rows = {}
+        self.old_rows = {}
+
+    def is_identical(self) -> bool:
+        return not (self.added or self.removed or self.changed or self.only_old or self.only_new)
+
+    def cell_changes(self) -> list:
+        """
+        Returns:
+            list: (key, column, old value, new value) of every changed cell of the shown rows.
+        """
+        changes = []
+        for key, new_row in self.changed_rows.items():
+            old_row = self.old_rows.get(key)
+            if old_row is None:
+                continue
+            for column, old_value, new_value in zip(self.shared_columns, old_row, new_row):
+                if canonical(old_value) != canonical(new_value):
+                    changes.append((key, column, old_value, new_value))
+        return changes
+
+
+class TableDiff:
+
+    def __init__(self, table_builder):
+        """
+        Compares two versions of a table, each a file, a table of the connected database or the
+        working table, and reports the rows added, removed and changed between them.
+
+        Rows are matched on key columns and compared by a hash of their other cells, read as a
+        stream. The first version is read into a map of key to row hash; the second is checked
+        against it, marking every key it meets, so the unmarked keys were removed. Only the keys
+        and hashes are held, not the rows, so memory grows with the number of keys. The cell
+        changes of the shown rows come from a last read of the first version that stops once
+        they are found.
+        """
+        self.table_builder = table_builder
+
+    def describe_source(self, source: tuple) -> str:
+        kind, name = source
+        if kind == "file":
+            return f"file '{name}'"
+        if kind == "database":
+            return f"table '{name}'"
+        return f"working table '{self.table_builder.name}'"
+
+    def resolve_source(self, text: str) -> tuple:
+        """
+        Returns:
+            tuple: ("file", path), ("database", table name) or ("current", None) for what the
+                user entered.
+
+        Raises:
+            ValueError: If it is none of these.
+        """
+        text = text.strip()
+        if text.lower() == "current":
+            return ("current", None)
+        if os.path.isfile(text):
+            if not is_readable(text):
+                raise ValueError(f"Cannot read '{text}'. Use a CSV, XLSX, ODS or PDF file.")
+            return ("file", text)
+        if self.table_builder.database.is_connected() and text in self.table_builder.database.list_tables():
+            return ("database", text)
+        raise ValueError(f"'{text}' is not a file, a table of the connected database or 'current'.")
+
+    @contextlib.contextmanager
+    def open_source(self, source: tuple):
+        """
+        Yields:
+            tuple: The header and an iterator of the rows of a source.
+        """
+        kind, name = source
+        if kind == "file":
+            with open_rows(name) as (header, rows):
+                yield header, rows
+        elif kind == "database":
+            connection = self.table_builder.database.connection
+            # BOOLEAN columns are stored as 1/0; read them as booleans like the Table Builder does
+            bool_names = {column[1] for column in connection.execute(f'PRAGMA table_info("{name}")') if column[2].upper() == "BOOLEAN"}
+            cursor = connection.cursor()
+            try:
+                cursor.execute(f'SELECT * FROM "{name}"')
+                header = [column[0] for column in cursor.description]
+                bool_columns = [idx for idx, column_name in enumerate(header) if column_name in bool_names]
+                yield header, (self._convert_booleans(row, bool_columns) for row in cursor) if bool_columns else cursor
+            finally:
+                cursor.close()
+        else:
+            header = [column["name"] for column in self.table_builder.table_data["columns"]]
+            yield header, self.table_builder.table_specs.iter_row_values()
+
+    @staticmethod
+    def _convert_booleans(row: tuple, bool_columns: list) -> list:
+        row = list(row)
+        for idx in bool_columns:
+            if row[idx] in (0, 1):
+                row[idx] = bool(row[idx])
+        return row
+
+    def read_header(self, source: tuple) -> list:
+        with self.open_source(source) as (header, _):
+            return header
+
+    @staticmethod
+    def _positions(header: list, names: list, source: str) -> list:
+        missing = [name for name in names if name not in header]
+        if missing:
+            raise ValueError(f"The {source} has no column {', '.join(missing)}.")
+        return [header.index(name) for name in names]
+
+    @staticmethod
+    def _cells(row, positions: list) -> list:
+        width = len(row)
+        return [row[position] if position < width else None for position in positions]
+
+    def _key_function(self, positions: list):
+        """
+        Returns:
+            callable: The key of a row: the canonical value of a single key column, which takes
+                less memory than a tuple, or a tuple of several.
+        """
+        if len(positions) == 1:
+            position = positions[0]
+            return lambda row: canonical(row[position]) if position < len(row) else None
+        return lambda row: tuple(map(canonical, self._cells(row, positions)))
+
+    def compare(self, old_source: tuple, new_source: tuple, key_columns: list) -> DiffResult:
+        """
+        Diff two sources on key columns. Values are compared with `canonical`.
+
+        Returns:
+            DiffResult: The differences.
+
+        Raises:
+            ValueError: If a key column is missing from a source or a key is repeated.
+        """
+        new_header = self.read_header(new_source)
+        with self.open_source(old_source) as (old_header, old_rows):
+            shared = [name for name in old_header if name in new_header and name not in key_columns]
+            result = DiffResult(
+                key_columns, shared,
+                [name for name in old_header if name not in new_header],
+                [name for name in new_header if name not in old_header],
+            )
+            old_key = self._key_function(self._positions(old_header, key_columns, "first version"))
+            old_positions = [old_header.index(name) for name in shared]
+
+            hashes = {}
+            for row in old_rows:
+                key = old_key(row)
+                if key in hashes:
+                    raise ValueError(f"Key {self._format_key(key, len(key_columns))} is repeated in the first version. Choose key columns that identify each row.")
+                hashes[key] = row_hash(self._cells(row, old_positions))
+
+        with self.open_source(new_source) as (new_header, new_rows):
+            new_key = self._key_function(self._positions(new_header, key_columns, "second version"))
+            new_positions = [new_header.index(name) for name in shared]
+            # Matched keys are marked rather than kept in a set of their own
+            added_keys = set()
+            for row in new_rows:
+                key = new_key(row)
+                old_hash = hashes.get(key)
+                if old_hash is _MATCHED or key in added_keys:
+                    raise ValueError(f"Key {self._format_key(key, len(key_columns))} is repeated in the second version. Choose key columns that identify each row.")
+                if old_hash is None:
+                    added_keys.add(key)
+                    result.added += 1
+                    if len(result.added_rows) < DIFF_SHOW_ROWS:
+                        result.added_rows.append(list(row))
+                    continue
+                hashes[key] = _MATCHED
+                cells = self._cells(row, new_positions)
+                if row_hash(cells) == old_hash:
+                    result.unchanged += 1
+                    continue
+                result.changed += 1
+                if len(result.changed_rows) < DIFF_SHOW_ROWS:
+                    result.changed_rows[key] = cells
+            del added_keys
+
+        # Every key the second version did not match was removed
+        removed_keys = (key for key, value in hashes.items() if value is not _MATCHED)
+        result.removed_keys = list(itertools.islice(removed_keys, DIFF_SHOW_ROWS))
+        result.removed = len(result.removed_keys) + sum(1 for _ in removed_keys)
+        del hashes
+        self._fetch_old_rows(old_source, old_key, old_positions, result)
+        return result
+
+    def _fetch_old_rows(self, old_source: tuple, old_key, positions: list, result: DiffResult) -> None:
+        """
+        Read the first version again for the old cells of the shown changed and removed rows.
+        """
+        wanted = set(result.changed_rows) | set(result.removed_keys)
+        if not wanted:
+            return
+        with self.open_source(old_source) as (_, old_rows):
+            for row in old_rows:
+                key = old_key(row)
+                if key in wanted:
+                    wanted.discard(key)
+                    if key in result.changed_rows:
+                        result.old_rows[key] = self._cells(row, positions)
+                    else:
+                        result.removed_rows[key] = list(row)
+                    if not wanted:
+                        break
+
+    @staticmethod
+    def _format_key(key, width: int) -> str:
+        """
+        Args:
+            key: A key made by `_key_function`.
+            width (int): The number of key columns.
+        """
+        if width == 1:
+            key = (key,)
+        # Tagged booleans and dates are shown as their value
+        return ", ".join(RenderCache.format_value(value[1] if value.__class__ is tuple else value) for value in key)
+
+    def print_report(self, result: DiffResult, old_header: list, new_header: list) -> None:
+        system_message = self.table_builder.system_message
+        if result.only_old or result.only_new:
+            parts = []
+            if result.only_new:
+                parts.append(f"Columns added: [bold cyan]{', '.join(result.only_new)}[/].")
+            if result.only_old:
+                parts.append(f"Columns removed: [bold cyan]{', '.join(result.only_old)}[/].")
+            system_message.create_information_message(" ".join(parts) + " Only the columns in both versions are compared.")
+
+        if result.added_rows:
+            caption = self._caption(len(result.added_rows), result.added)
+            self.table_builder.console.print(self.table_builder.table_display.build_page_table(new_header, result.added_rows, 0, "Added Rows", caption))
+        if result.removed_rows:
+            rows = [result.removed_rows[key] for key in result.removed_keys if key in result.removed_rows]
+            caption = self._caption(len(rows), result.removed)
+            self.table_builder.console.print(self.table_builder.table_display.build_page_table(old_header, rows, 0, "Removed Rows", caption))
+        changes = result.cell_changes()
+        if changes:
+            table = Table(
+                title=f"[{self.table_builder.table_display.table_title_style}]Changed Cells[/]",
+                caption=self._caption(len(result.changed_rows), result.changed),
+                border_style=self.table_builder.table_display.table_border_style, show_lines=True,
+            )
+            table.add_column(", ".join(result.key_columns), style="bold yellow")
+            table.add_column("Column", style="cyan")
+            table.add_column("Old", style="red")
+            table.add_column("New", style="green")
+            for key, column, old_value, new_value in changes:
+                table.add_row(self._format_key(key, len(result.key_columns)), column, RenderCache.format_value(old_value), RenderCache.format_value(new_value))
+            self.table_builder.console.print(table)
+
+    @staticmethod
+    def _caption(shown: int, total: int) -> str:
+        if shown < total:
+            return f"[bold yellow]First {shown:,} of {total:,} rows[/]"
+        return f"[bold yellow]{total:,} rows[/]"
+
+    def diff(self) -> None:
+        """
+        Prompt for two versions of a table and key columns, and report what changed from the
+        first to the second.
+        """
+        get_user_input = self.table_builder.input_handler.get_user_input
+        sources = []
+        for which in ("first (old)", "second (new)"):
+            text = get_user_input(f"[bold yellow]Enter the {which} version: a CSV, XLSX, ODS or PDF file, a table of the connected database, or 'current' for the working table[/]: ")
+            if text is None:
+                return
+            try:
+                sources.append(self.resolve_source(text))
+            except ValueError as e:
+                self.table_builder.system_message.create_error_message(str(e))
+                return
+
+        try:
+            old_header, new_header = (self.read_header(source) for source in sources)
+        except (ValueError, OSError, sqlite3.Error) as e:
+            self.table_builder.system_message.create_error_message(f"Failed to read the table: {e}")
+            return
+
+        keys = get_user_input(f"[bold yellow]Enter the key columns that identify a row, separated by commas (columns of both: {', '.join(name for name in old_header if name in new_header)})[/]: ")
+        if keys is None:
+            return
+        key_columns = [name.strip() for name in keys.split(",") if name.strip()]
+        if not key_columns:
+            self.table_builder.system_message.create_error_message("Enter at least one key column.")
+            return
+
+        try:
+            start = time.perf_counter()
+            with self.table_builder.console.status("[bold yellow]Comparing tables...[/]"):
+                result = self.compare(sources[0], sources[1], key_columns)
+            elapsed = time.perf_counter() - start
+        except (ValueError, OSError, sqlite3.Error) as e:
+            self.table_builder.system_message.create_error_message(f"Failed to compare the tables: {e}")
+            return
+
+        old_name, new_name = (self.describe_source(source) for source in sources)
+        if result.is_identical():
+            self.table_builder.system_message.create_information_message(
+                f"The {old_name} and the {new_name} hold the same [bold cyan]{result.unchanged:,}[/] rows. Compared in [bold cyan]{elapsed:.1f}[/] seconds."
+            )
+            return
+        self.print_report(result, old_header, new_header)
+        self.table_builder.system_message.create_information_message(
+            f"From the {old_name} to the {new_name}: [bold green]{result.added:,}[/] rows added, [bold red]{result.removed:,}[/] removed, "
+            f"[bold yellow]{result.changed:,}[/] changed and [bold cyan]{result.unchanged:,}[/] unchanged. Compared in [bold cyan]{elapsed:.1f}[/] seconds."
+        )
@@ -1,7 +1,137 @@
 from rich.table import Table
 from rich.panel import Panel
+from rich.text import Text
+from rich.cells import cell_len
 from settings.styles.styles import StylesSetting
 
+# Tables up to this many rows are redrawn in full after an edit; larger ones only show what changed.
+FULL_REDRAW_ROWS = 200
+
+# Most rows shown when redrawing only the changed part of a large table.
+MAX_CHANGED_ROWS = 20
+
+
+class RenderCache:
+
+    def __init__(self, table_builder):
+        """
+        Formatted cell strings, column headers and column widths for the current table.
+
+        The cache is built the first time the table is printed and then patched by the table
+        change notifications, so a redraw only formats and measures the cells that changed.
+        It also remembers which rows changed since the last redraw.
+        """
+        self.table_builder = table_builder
+        self.cells = None
+        self.column_names = []
+        self.headers = []
+        self.header_widths = []
+        self.widths = []
+        self.stale_widths = set()
+        self.changed_rows = set()
+        self.columns_changed = False
+
+    @staticmethod
+    def format_value(value) -> str:
+        return "" if value is None else str(value)
+
+    def build(self) -> None:
+        columns = self.table_builder.table_data["columns"]
+        self.cells = [list(map(str, values)) for values in self.table_builder.table_specs.iter_row_values(null_value="")]
+        self.widths = [max((cell_len(row[idx]) for row in self.cells), default=0) for idx in range(len(columns))]
+        self.stale_widths = set()
+        self._build_headers()
+
+    def _build_headers(self) -> None:
+        self.column_names = [column["name"] for column in self.table_builder.table_data["columns"]]
+        self.headers = [f"{column['name']} ([bold red]{column['type']}[/])" for column in self.table_builder.table_data["columns"]]
+        self.header_widths = [Text.from_markup(header).cell_len for header in self.headers]
+
+    def column_widths(self) -> list:
+        """
+        Returns:
+            list: The display width of every column, re-measuring only columns whose widest cell changed.
+        """
+        for idx in self.stale_widths:
+            self.widths[idx] = max((cell_len(row[idx]) for row in self.cells), default=0)
+        self.stale_widths = set()
+        return [max(width, header_width) for width, header_width in zip(self.widths, self.header_widths)]
+
+    def ensure_built(self) -> None:
+        if self.cells is None:
+            self.build()
+
+    def mark_drawn(self) -> None:
+        self.changed_rows = set()
+        self.columns_changed = False
+
+    def _set_cell(self, row_index: int, column_index: int, text: str) -> None:
+        old_width = cell_len(self.cells[row_index][column_index])
+        self.cells[row_index][column_index] = text
+        new_width = cell_len(text)
+        if new_width >= self.widths[column_index]:
+            self.widths[column_index] = new_width
+        elif old_width == self.widths[column_index]:
+            self.stale_widths.add(column_index)
+
+    def table_loaded(self) -> None:
+        self.cells = None
+        self.changed_rows = set()
+        self.columns_changed = True
+
+    def row_added(self, row_index: int, row: dict) -> None:
+        self.changed_rows.add(row_index)
+        if self.cells is None:
+            return
+        texts = [self.format_value(row.get(column["name"])) for column in self.table_builder.table_data["columns"]]
+        self.cells.insert(row_index, texts)
+        self.widths = [max(width, cell_len(text)) for width, text in zip(self.widths, texts)]
+
+    def row_removed(self, row_index: int, row: dict) -> None:
+        self.changed_rows = {idx - 1 if idx > row_index else idx for idx in self.changed_rows if idx != row_index}
+        if row_index < len(self.table_builder.table_data["rows"]):
+            self.changed_rows.add(row_index)
+        if self.cells is None:
+            return
+        removed = self.cells.pop(row_index)
+        for idx, text in enumerate(removed):
+            if cell_len(text) == self.widths[idx]:
+                self.stale_widths.add(idx)
+
+    def cell_changed(self, row_index: int, column_name: str, old_value, new_value) -> None:
+        self.changed_rows.add(row_index)
+        if self.cells is not None:
+            self._set_cell(row_index, self.column_names.index(column_name), self.format_value(new_value))
+
+    def column_added(self, column_name: str) -> None:
+        self.columns_changed = True
+        if self.cells is not None:
+            for row in self.cells:
+                row.append("")
+            self.widths.append(0)
+            self._build_headers()
+
+    def column_removed(self, column_name: str) -> None:
+        self.columns_changed = True
+        if self.cells is not None:
+            idx = self.column_names.index(column_name)
+            for row in self.cells:
+                del row[idx]
+            del self.widths[idx]
+            self.stale_widths = {i - 1 if i > idx else i for i in self.stale_widths if i != idx}
+            self._build_headers()
+
+    def column_renamed(self, old_name: str, new_name: str) -> None:
+        self.columns_changed = True
+        if self.cells is not None:
+            self._build_headers()
+
+    def column_type_changed(self, column_name: str) -> None:
+        self.columns_changed = True
+        if self.cells is not None:
+            self._build_headers()
+
+
 class TableDisplay:
 
     def __init__(self, table_builder):
@@ -10,8 +140,19 @@ class TableDisplay:
         self.table_border_style = self.user_styles.get_table_border_style()
         self.table_title_style = self.user_styles.get_table_title_style()
         self.table_row_style = self.user_styles.get_table_row_style()
-        
+        self.render_cache = RenderCache(table_builder)
 
+    def _new_table(self, row_numbers: bool = False, caption: str = None) -> Table:
+        """
+        Create an empty Rich table with the cached headers and fixed column widths, so Rich
+        does not measure every cell again.
+        """
+        table = Table(title=f"[{self.table_title_style}]{self.table_builder.name}[/]", caption=caption, border_style=self.table_border_style, show_lines=True)
+        if row_numbers:
+            table.add_column("#", style="bold yellow", justify="right")
+        for header, width in zip(self.render_cache.headers, self.render_cache.column_widths()):
+            table.add_column(header, style="cyan", width=width)
+        return table
 
     def build_table(self) -> Table:
         """
@@ -24,28 +165,83 @@ class TableDisplay:
             self.table_builder.system_message.create_error_message("No columns defined. Add columns before building the table.")
             return Table(border_style="yellow", show_lines=True)
 
-        # Create a Rich Table instance
-        table = Table(title=f"[{self.table_title_style}]{self.table_builder.name}[/]", border_style=self.table_border_style, show_lines=True)
+        self.render_cache.ensure_built()
+        table = self._new_table()
+
+        # Add rows from the cached cell strings
+        for cells in self.render_cache.cells:
+            table.add_row(*cells, style=self.table_row_style)
+
+        return table
+
+    def build_rows_table(self, row_indices: list, caption: str = None) -> Table:
+        """
+        Build a table holding only some rows, numbered by their position in the full table.
+
+        Args:
+            row_indices (list): 0-based indices of the rows to show.
+            caption (str): Optional caption shown under the table.
 
-        # Add columns with type information
-        for column in self.table_builder.table_data["columns"]:
-            column_name = column["name"]
-            column_type = column["type"]
-            table.add_column(f"{column_name} ([bold red]{column_type}[/])", style="cyan")
+        Returns:
+            Table: The rendered table.
+        """
+        self.render_cache.ensure_built()
+        table = self._new_table(row_numbers=True, caption=caption)
+        for row_index in row_indices:
+            table.add_row(str(row_index + 1), *self.render_cache.cells[row_index], style=self.table_row_style)
+        return table
 
-        # Add rows
-        for row in self.table_builder.table_data["rows"]:
-            row_values = [str(row.get(column["name"], "")) for column in self.table_builder.table_data["columns"]]
-            table.add_row(*row_values, style=self.table_row_style)
+    def build_page_table(self, header: list, rows: list, first_row: int, title: str, caption: str = None) -> Table:
+        """
+        Build a table for rows that are not part of the table data, such as a page read from a file.
 
+        Args:
+            header (list): The column names.
+            rows (list): The rows as lists of cell values.
+            first_row (int): 0-based position of the first row, used to number the rows.
+            title (str): The table title.
+            caption (str): Optional caption shown under the table.
+
+        Returns:
+            Table: The rendered table.
+        """
+        table = Table(title=f"[{self.table_title_style}]{title}[/]", caption=caption, border_style=self.table_border_style, show_lines=True)
+        table.add_column("#", style="bold yellow", justify="right")
+        for name in header:
+            table.add_column(str(name), style="cyan")
+        for number, row in enumerate(rows, start=first_row + 1):
+            table.add_row(str(number), *(RenderCache.format_value(value) for value in row), style=self.table_row_style)
         return table
-    
+
     def print_table(self) -> None:
         """
         Prints the built table to the screen.
         """
         table = self.table_builder.table_display.build_table()
         self.table_builder.console.print(table)
+        self.render_cache.mark_drawn()
+
+    def print_changes(self) -> None:
+        """
+        Redraw the table after an edit. Small tables are printed in full; for large tables only
+        the rows changed since the last redraw are printed (or the first rows, when a column
+        changed), using the cached cells and widths of the full table.
+        """
+        rows = self.table_builder.table_data["rows"]
+        if not self.table_builder.table_data["columns"] or len(rows) <= FULL_REDRAW_ROWS:
+            self.print_table()
+            return
+
+        cache = self.render_cache
+        changed_rows = sorted(idx for idx in cache.changed_rows if idx < len(rows))
+        if changed_rows and not cache.columns_changed:
+            shown_rows = changed_rows[:MAX_CHANGED_ROWS]
+            caption = f"[bold yellow]Showing {len(shown_rows):,} changed of {len(rows):,} rows. Use 'print table' for the full table.[/]"
+        else:
+            shown_rows = list(range(MAX_CHANGED_ROWS))
+            caption = f"[bold yellow]Showing the first {len(shown_rows):,} of {len(rows):,} rows. Use 'print table' for the full table.[/]"
+        self.table_builder.console.print(self.build_rows_table(shown_rows, caption=caption))
+        cache.mark_drawn()
 
     def print_table_data(self) -> Panel:
         """
@@ -62,8 +258,7 @@ class TableDisplay:
             return
 
         try:
-            self.table_builder.database.cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            tables = [row[0] for row in self.table_builder.database.cursor.fetchall()]
+            tables = self.table_builder.database.list_tables()
 
             if tables:
                 self.table_builder.console.print("[bold green]Available Tables:[/]")
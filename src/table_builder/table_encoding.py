@@ -0,0 +1,243 @@
+from collections import Counter
+
+# Columns with more distinct values than this are left as plain per-cell values.
+MAX_DICTIONARY_SIZE = 256
+
+# How many rows are interned between checks for columns that outgrew the dictionary limit.
+CARDINALITY_CHECK_INTERVAL = 1024
+
+# Lookup left on high-cardinality columns: they are no longer interned, but empty text still reads as missing.
+_MISSING_CELLS = {"": None}
+
+
+class ColumnDictionary:
+
+    def __init__(self, values=()):
+        """
+        Distinct values of a low-cardinality column, numbered in first-seen order.
+
+        Rows hold the dictionary's own value objects, so every distinct string exists once in
+        memory no matter how many cells contain it, and cell comparisons against a dictionary
+        value short-circuit on identity.
+
+        :param values: Initial values, assigned codes in order.
+        """
+        self.values = []
+        self.codes = {}
+        for value in values:
+            self.add(value)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __contains__(self, value) -> bool:
+        return value in self.codes
+
+    def add(self, value):
+        """
+        Add a string to the dictionary if it is new. Other values are not encoded, which keeps
+        values like `1` and `True` from being merged by their equal hashes.
+
+        Args:
+            value: The cell value.
+
+        Returns:
+            The dictionary's canonical object for the value.
+        """
+        if value.__class__ is not str:
+            return value
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.codes[value] = code
+            self.values.append(value)
+        return self.values[code]
+
+    def code(self, value) -> int:
+        """
+        Returns:
+            int: The code for the value, or None if it is not in the dictionary.
+        """
+        return self.codes.get(value)
+
+    def decode(self, code: int):
+        return self.values[code]
+
+
+class RowInterner:
+
+    def __init__(self, width: int):
+        """
+        Interns cell values column by column while rows stream in from a loader.
+
+        Each column keeps a map of its string values until it holds more than MAX_DICTIONARY_SIZE
+        of them, after which the column is treated as high-cardinality and left alone. Empty text
+        cells come out as `None`, the table's single missing-value representation.
+
+        :param width: Number of columns in the rows.
+        """
+        self.lookups = [dict(_MISSING_CELLS) for _ in range(width)]
+        self.methods = [lookup.setdefault for lookup in self.lookups]
+        self.rows_seen = 0
+
+    def intern(self, row: list) -> list:
+        """
+        Args:
+            row (list): Cell values in column order.
+
+        Returns:
+            list: The row with repeated values replaced by a shared object.
+        """
+        self.rows_seen += 1
+        if self.rows_seen % CARDINALITY_CHECK_INTERVAL == 0:
+            self._drop_high_cardinality()
+        return [method(value, value) if value.__class__ is str else value
+                for method, value in zip(self.methods, row)]
+
+    def _drop_high_cardinality(self) -> None:
+        for idx, lookup in enumerate(self.lookups):
+            if lookup is not None and len(lookup) > MAX_DICTIONARY_SIZE + len(_MISSING_CELLS):
+                self.lookups[idx] = None
+                self.methods[idx] = _MISSING_CELLS.get
+
+    def dictionaries(self) -> list:
+        """
+        Returns:
+            list: A ColumnDictionary per column, or None where the column is high-cardinality.
+        """
+        self._drop_high_cardinality()
+        return [ColumnDictionary(lookup.values()) if lookup is not None else None for lookup in self.lookups]
+
+
+class TableEncoding:
+
+    def __init__(self, table_builder):
+        self.table_builder = table_builder
+        self.dictionaries = {}
+
+    def new_interner(self, width: int) -> RowInterner:
+        return RowInterner(width)
+
+    def use_interner(self, interner: RowInterner) -> None:
+        """
+        Keep the dictionaries an interner found for the table's low-cardinality string columns.
+
+        Args:
+            interner (RowInterner): The interner the loaded rows were passed through.
+        """
+        self.dictionaries = {
+            column["name"]: dictionary
+            for column, dictionary in zip(self.table_builder.table_data["columns"], interner.dictionaries())
+            if dictionary is not None and column["type"] == "str"
+        }
+
+    def use_dictionaries(self, values_by_column: dict) -> None:
+        """
+        Restore dictionaries saved earlier for the current rows, without scanning the rows.
+
+        Args:
+            values_by_column (dict): Column name mapped to its dictionary values in code order.
+        """
+        self.dictionaries = {name: ColumnDictionary(values) for name, values in values_by_column.items()}
+
+    def encode_columns(self) -> None:
+        """
+        Detect low-cardinality string columns in the current rows and intern their values.
+        """
+        self.dictionaries = {}
+        for column in self.table_builder.table_data["columns"]:
+            if column["type"] == "str":
+                self.encode_column(column["name"])
+
+    def encode_column(self, column_name: str) -> None:
+        rows = self.table_builder.table_data["rows"]
+        dictionary = ColumnDictionary()
+        for row in rows:
+            dictionary.add(row.get(column_name))
+            if len(dictionary) > MAX_DICTIONARY_SIZE:
+                return
+
+        for row in rows:
+            row[column_name] = dictionary.add(row.get(column_name))
+        self.dictionaries[column_name] = dictionary
+
+    def get_dictionary(self, column_name: str) -> ColumnDictionary:
+        return self.dictionaries.get(column_name)
+
+    def intern(self, column_name: str, value):
+        """
+        Map a new cell value onto its dictionary entry, dropping the dictionary if the column
+        stops being low-cardinality.
+
+        Returns:
+            The value to store in the cell.
+        """
+        dictionary = self.dictionaries.get(column_name)
+        if dictionary is None:
+            return value
+        value = dictionary.add(value)
+        if len(dictionary) > MAX_DICTIONARY_SIZE:
+            del self.dictionaries[column_name]
+        return value
+
+    def table_loaded(self) -> None:
+        string_columns = {column["name"] for column in self.table_builder.table_data["columns"] if column["type"] == "str"}
+        self.dictionaries = {name: dictionary for name, dictionary in self.dictionaries.items() if name in string_columns}
+
+    def row_added(self, row_index: int, row: dict) -> None:
+        pass
+
+    def row_removed(self, row_index: int, row: dict) -> None:
+        pass
+
+    def cell_changed(self, row_index: int, column_name: str, old_value, new_value) -> None:
+        pass
+
+    def column_added(self, column_name: str) -> None:
+        pass
+
+    def column_removed(self, column_name: str) -> None:
+        self.dictionaries.pop(column_name, None)
+
+    def column_renamed(self, old_name: str, new_name: str) -> None:
+        if old_name in self.dictionaries:
+            self.dictionaries[new_name] = self.dictionaries.pop(old_name)
+
+    def column_type_changed(self, column_name: str) -> None:
+        column = next(column for column in self.table_builder.table_data["columns"] if column["name"] == column_name)
+        if column["type"] == "str":
+            self.encode_column(column_name)
+        else:
+            self.dictionaries.pop(column_name, None)
+
+    def matching_rows(self, column_name: str, value) -> list:
+        """
+        Find the rows whose cell equals a value.
+
+        For dictionary columns a value that was never seen is rejected without a scan, and each
+        comparison is against the shared dictionary object.
+
+        Returns:
+            list: 0-based indices of the matching rows.
+        """
+        rows = self.table_builder.table_data["rows"]
+        dictionary = self.dictionaries.get(column_name)
+        if dictionary is not None and value.__class__ is str:
+            code = dictionary.code(value)
+            if code is None:
+                return []
+            value = dictionary.decode(code)
+        return [idx for idx, row in enumerate(rows) if row.get(column_name) == value]
+
+    def value_counts(self, column_name: str) -> Counter:
+        """
+        Count how many rows hold each value of a column.
+
+        The cells are counted with a Counter, which runs in C. Cells of a dictionary column are
+        the dictionary's own objects, so they are matched on identity with the hash every string
+        caches; numbering them by code first would only add a Python-level step per row.
+
+        Returns:
+            Counter: Value mapped to its row count, with missing cells counted under None.
+        """
+        return Counter([row.get(column_name) for row in self.table_builder.table_data["rows"]])
@@ -0,0 +1,137 @@
+_FLAG_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+
+
+class ValidityBitmap:
+
+    __slots__ = ("bits", "length", "null_count")
+
+    def __init__(self):
+        """
+        Packed validity bits for one column. Bit `i` is set when row `i` holds a value and
+        clear when the cell is missing (`None`).
+        """
+        self.bits = bytearray()
+        self.length = 0
+        self.null_count = 0
+
+    @classmethod
+    def from_values(cls, values) -> "ValidityBitmap":
+        """
+        Build a bitmap from a column's values in a single pass.
+
+        Args:
+            values (iterable): The column's cells in row order.
+
+        Returns:
+            ValidityBitmap: The bitmap for the column.
+        """
+        flags = bytes(value is not None for value in values)
+        bitmap = cls()
+        bitmap.length = len(flags)
+        bitmap.null_count = flags.count(0)
+        if flags:
+            packed = int(flags[::-1].translate(_FLAG_DIGITS), 2)
+            bitmap.bits = bytearray(packed.to_bytes((bitmap.length + 7) // 8, "little"))
+        return bitmap
+
+    @classmethod
+    def all_null(cls, length: int) -> "ValidityBitmap":
+        bitmap = cls()
+        bitmap.bits = bytearray((length + 7) // 8)
+        bitmap.length = length
+        bitmap.null_count = length
+        return bitmap
+
+    def is_valid(self, index: int) -> bool:
+        return bool(self.bits[index >> 3] & (1 << (index & 7)))
+
+    def append(self, valid: bool) -> None:
+        if self.length & 7 == 0:
+            self.bits.append(0)
+        self.length += 1
+        self.null_count += 1
+        self.set(self.length - 1, valid)
+
+    def set(self, index: int, valid: bool) -> None:
+        mask = 1 << (index & 7)
+        was_valid = bool(self.bits[index >> 3] & mask)
+        if valid and not was_valid:
+            self.bits[index >> 3] |= mask
+            self.null_count -= 1
+        elif was_valid and not valid:
+            self.bits[index >> 3] &= ~mask
+            self.null_count += 1
+
+    def remove(self, index: int) -> None:
+        """
+        Drop the bit for a removed row, shifting the bits of the rows after it down by one.
+        """
+        if not self.is_valid(index):
+            self.null_count -= 1
+        packed = int.from_bytes(self.bits, "little")
+        packed = (packed & ((1 << index) - 1)) | ((packed >> (index + 1)) << index)
+        self.length -= 1
+        self.bits = bytearray(packed.to_bytes((self.length + 7) // 8, "little"))
+
+
+class TableNulls:
+
+    def __init__(self, table_builder):
+        """
+        Tracks missing cells per column with validity bitmaps.
+
+        A column's bitmap is built on first use and then kept current by the table change
+        notifications, so null counts are O(1) afterwards.
+        """
+        self.table_builder = table_builder
+        self.bitmaps = {}
+
+    def bitmap(self, column_name: str) -> ValidityBitmap:
+        bitmap = self.bitmaps.get(column_name)
+        if bitmap is None:
+            rows = self.table_builder.table_data["rows"]
+            bitmap = ValidityBitmap.from_values(row.get(column_name) for row in rows)
+            self.bitmaps[column_name] = bitmap
+        return bitmap
+
+    def null_count(self, column_name: str) -> int:
+        """
+        Returns:
+            int: The number of missing cells in the column.
+        """
+        return self.bitmap(column_name).null_count
+
+    def has_nulls(self, column_name: str) -> bool:
+        return self.bitmap(column_name).null_count > 0
+
+    def is_null(self, row_index: int, column_name: str) -> bool:
+        return not self.bitmap(column_name).is_valid(row_index)
+
+    def table_loaded(self) -> None:
+        self.bitmaps = {}
+
+    def row_added(self, row_index: int, row: dict) -> None:
+        for column_name, bitmap in self.bitmaps.items():
+            bitmap.append(row.get(column_name) is not None)
+
+    def row_removed(self, row_index: int, row: dict) -> None:
+        for bitmap in self.bitmaps.values():
+            bitmap.remove(row_index)
+
+    def cell_changed(self, row_index: int, column_name: str, old_value, new_value) -> None:
+        bitmap = self.bitmaps.get(column_name)
+        if bitmap is not None:
+            bitmap.set(row_index, new_value is not None)
+
+    def column_added(self, column_name: str) -> None:
+        self.bitmaps[column_name] = ValidityBitmap.all_null(len(self.table_builder.table_data["rows"]))
+
+    def column_removed(self, column_name: str) -> None:
+        self.bitmaps.pop(column_name, None)
+
+    def column_renamed(self, old_name: str, new_name: str) -> None:
+        if old_name in self.bitmaps:
+            self.bitmaps[new_name] = self.bitmaps.pop(old_name)
+
+    def column_type_changed(self, column_name: str) -> None:
+        pass
@@ -1,3 +1,11 @@
+from .deduplication import RowDeduplicator, parse_dedupe_options
+from .external_sort import parse_sort_keys, sort_key
+from .table_stats import union_type
+
+# Rows shown per page by the cell picker.
+PICKER_PAGE_SIZE = 20
+
+
 class TableOperations:
 
     def __init__(self, table_builder):
@@ -38,7 +46,8 @@ class TableOperations:
 
         self.table_builder.table_data["columns"].append({"name": column_name, "type": selected_type})
         for row in self.table_builder.table_data["rows"]:
-            row[column_name] = ""
+            row[column_name] = None
+        self.table_builder.notify("column_added", column_name)
         self.table_builder.table_saved = False
         self.table_builder.system_message.create_information_message(f"Column '[bold cyan]{column_name}[/]' added with type '[bold red]{selected_type}[/]'.")
 
@@ -65,11 +74,15 @@ class TableOperations:
             self.table_builder.system_message.create_error_message("Invalid input. Please enter a number.")
             return
 
+        with self.table_builder.console.status("[bold yellow]Checking column values...[/]"):
+            fitting_type = self.table_builder.table_stats.fitting_type(selected_column["name"])
+
         # Display available types for selection
         types = ["int", "float", "str", "bool"]
         self.table_builder.console.print("[bold green]Available Types[/]:")
         for idx, t in enumerate(types, start=1):
-            self.table_builder.console.print(f"{idx}. {t}")
+            fits = " [bold green](narrowest type that fits every value)[/]" if t == fitting_type else ""
+            self.table_builder.console.print(f"{idx}. {t}{fits}")
 
         try:
             type_number = int(self.table_builder.input_handler.get_user_input("[bold yellow]Enter the number of the new type[/]: ")) - 1
@@ -81,6 +94,12 @@ class TableOperations:
             self.table_builder.system_message.create_error_message("Invalid input. Please enter a number.")
             return
 
+        if union_type(fitting_type, new_type) != new_type:
+            self.table_builder.system_message.create_information_message(
+                f"[bold yellow]Some values of column '[bold cyan]{selected_column['name']}[/]' are not a valid {new_type}. "
+                f"The narrowest type that fits every value is '[bold red]{fitting_type}[/]'.[/]"
+            )
+
         # Confirm the change
         confirm = self.table_builder.input_handler.get_user_input(
             f"[bold red]Are you sure you want to change column '{selected_column['name']}' "
@@ -90,6 +109,7 @@ class TableOperations:
         if confirm == "y":
             # Apply the type change
             selected_column["type"] = new_type
+            self.table_builder.notify("column_type_changed", selected_column["name"])
             self.table_builder.system_message.create_information_message(
                 f"Column '[bold cyan]{selected_column['name']}[/]' type changed to '[bold red]{new_type}[/]'."
             )
@@ -134,7 +154,8 @@ class TableOperations:
 
         # Update all row data to reflect the name change
         for row in self.table_builder.table_data["rows"]:
-            row[new_name] = row.pop(old_name, "")
+            row[new_name] = row.pop(old_name, None)
+        self.table_builder.notify("column_renamed", old_name, new_name)
 
         self.table_builder.table_saved = False
         self.table_builder.system_message.create_information_message(f"Column '[bold cyan]{old_name}[/]' renamed to '[bold green]{new_name}[/]' successfully.")
@@ -156,6 +177,9 @@ class TableOperations:
                 cell_data = self.table_builder.input_handler.get_user_input(f"[bold yellow]Enter data for column '[bold cyan]{column_name}[/]' ([bold red]{data_type}[/]): ")
                 if cell_data is None:
                     return
+                if cell_data == "":
+                    row_data[column_name] = None  # Leave the cell empty
+                    break
                 if data_type == "int" and cell_data.isdigit():
                     row_data[column_name] = int(cell_data)
                     break
@@ -169,44 +193,38 @@ class TableOperations:
                     row_data[column_name] = cell_data.lower() == "true"
                     break
                 elif data_type == "str":
-                    row_data[column_name] = cell_data
+                    row_data[column_name] = self.table_builder.table_encoding.intern(column_name, cell_data)
                     break
                 else:
                     self.table_builder.system_message.create_error_message("Invalid input. Please enter a valid value.")
 
         self.table_builder.table_data["rows"].append(row_data)
+        self.table_builder.notify("row_added", len(self.table_builder.table_data["rows"]) - 1, row_data)
         self.table_builder.table_saved = False
         self.table_builder.system_message.create_information_message("Row added with validated data.")
 
-    def edit_cell(self) -> None:
+    def edit_cell(self, address: str = None) -> None:
         """
-        Edits the cell content using direct indexing.
+        Edits the content of one cell.
+
+        The cell can be given directly, either as 'row,column' or as 'key=value column' to pick
+        the row whose key column holds the value. Without an address, a paged picker shows one
+        window of rows at a time and can filter them by a search term, so the output stays the
+        same size whatever the size of the table.
+
+        Args:
+            address (str): Optional cell address, e.g. '5123,4' or 'id=991 price'.
         """
         if not self.table_builder.table_data["columns"] or not self.table_builder.table_data["rows"]:
             self.table_builder.system_message.create_error_message("No table data to edit. Add rows and columns first.")
             return
 
-        # Display table cells with their indices
-        self.table_builder.console.print("[bold green]Table Cells[/]:")
-        for row_idx, row in enumerate(self.table_builder.table_data["rows"], start=1):
-            row_display = [
-                f"({row_idx},{col_idx + 1}) {row[col['name']]}" for col_idx, col in enumerate(self.table_builder.table_data["columns"])
-            ]
-            self.table_builder.console.print(f"Row {row_idx}: " + " | ".join(row_display))
+        cell = self.resolve_cell_address(address) if address else self.pick_cell()
+        if cell is None:
+            return
+        row_idx, col_idx = cell
 
         try:
-            # Prompt for cell index
-            cell_position = self.table_builder.input_handler.get_user_input("[bold yellow]Enter cell position as 'row,column' (e.g., 1,2)[/]: ").strip()
-            if cell_position is None:
-                return
-            row_idx, col_idx = map(int, cell_position.split(","))
-            row_idx -= 1  # Convert to 0-based index
-            col_idx -= 1  # Convert to 0-based index
-
-            if not (0 <= row_idx < len(self.table_builder.table_data["rows"]) and 0 <= col_idx < len(self.table_builder.table_data["columns"])):
-                self.table_builder.system_message.create_error_message("Invalid cell position.")
-                return
-
             # Fetch column and its type
             column = self.table_builder.table_data["columns"][col_idx]
             column_name = column["name"]
@@ -214,7 +232,12 @@ class TableOperations:
 
             # Prompt for new value with type validation
             while True:
-                new_data = self.table_builder.input_handler.get_user_input(f"[bold yellow]Enter new data for cell ([bold cyan]{row_idx + 1},{col_idx + 1}[/]) ([bold red]{column_name}[/]: [bold blue]{column_type})[/]): ").strip()
+                new_data = self.table_builder.input_handler.get_user_input(f"[bold yellow]Enter new data for cell ([bold cyan]{row_idx + 1},{col_idx + 1}[/]) ([bold red]{column_name}[/]: [bold blue]{column_type})[/]): ")
+                if new_data is None:
+                    return
+                if new_data == "":
+                    new_value = None  # Clear the cell
+                    break
                 if column_type == "int" and new_data.isdigit():
                     new_value = int(new_data)
                     break
@@ -231,21 +254,149 @@ class TableOperations:
                     else:
                         self.table_builder.system_message.create_error_message("Invalid data. Expected 'true' or 'false'.")
                 elif column_type == "str":
-                    new_value = new_data
+                    new_value = self.table_builder.table_encoding.intern(column_name, new_data)
                     break
                 else:
                     self.table_builder.system_message.create_error_message(f"Unsupported data type: [bold cyan]{column_type}[/]")
 
             # Update the cell
-            self.table_builder.table_data["rows"][row_idx][column_name] = new_value
+            row = self.table_builder.table_data["rows"][row_idx]
+            old_value = row.get(column_name)
+            row[column_name] = new_value
+            self.table_builder.notify("cell_changed", row_idx, column_name, old_value, new_value)
             self.table_builder.table_saved = False
             self.table_builder.system_message.create_information_message("Cell updated successfully.")
 
-        except ValueError:
-            self.table_builder.system_message.create_error_message("Invalid input format. Use 'row,column'.")
         except Exception as e:
             self.table_builder.system_message.create_error_message(f"Failed to edit cell: {e}")
 
+    def resolve_cell_address(self, address: str) -> tuple:
+        """
+        Turn a cell address into row and column indices.
+
+        Args:
+            address (str): 'row,column' with 1-based numbers, or 'key=value column' where the
+                row is the one whose key column holds the value. Columns can be given by number
+                or by name.
+
+        Returns:
+            tuple: The 0-based (row, column) indices, or None if the address is invalid.
+        """
+        address = address.strip()
+        if "=" in address:
+            key, _, rest = address.partition("=")
+            separator = "," if "," in rest else None
+            value, _, column = rest.strip().rpartition(separator) if separator else rest.strip().rpartition(" ")
+            row_idx = self._find_row_by_key(key.strip(), value.strip())
+        else:
+            row, _, column = address.partition(",")
+            row_idx = int(row) - 1 if row.strip().isdigit() else None
+            if row_idx is None or not 0 <= row_idx < len(self.table_builder.table_data["rows"]):
+                self.table_builder.system_message.create_error_message("Invalid cell position. Use 'row,column' or 'key=value column'.")
+                return None
+
+        if row_idx is None:
+            return None
+        if not column.strip():
+            self.table_builder.system_message.create_error_message("No column given. Use 'row,column' or 'key=value column'.")
+            return None
+
+        col_idx = self._find_column(column.strip())
+        if col_idx is None:
+            self.table_builder.system_message.create_error_message(f"Column [bold cyan]{column.strip()}[/] does not exist.")
+            return None
+        return row_idx, col_idx
+
+    def _find_column(self, column: str) -> int:
+        columns = self.table_builder.table_data["columns"]
+        if column.isdigit():
+            return int(column) - 1 if 0 < int(column) <= len(columns) else None
+        return next((idx for idx, col in enumerate(columns) if col["name"] == column), None)
+
+    def _find_row_by_key(self, key: str, value: str) -> int:
+        """
+        Returns:
+            int: The 0-based index of the only row whose key column holds the value, or None.
+        """
+        col_idx = self._find_column(key)
+        if col_idx is None:
+            self.table_builder.system_message.create_error_message(f"Column [bold cyan]{key}[/] does not exist.")
+            return None
+
+        column = self.table_builder.table_data["columns"][col_idx]
+        try:
+            value = self.table_builder.input_handler.convert_value(value, column["type"]) if value else None
+        except ValueError:
+            self.table_builder.system_message.create_error_message(f"[bold cyan]{value}[/] is not a valid {column['type']} for column [bold cyan]{key}[/].")
+            return None
+
+        matches = self.table_builder.table_encoding.matching_rows(column["name"], value)
+        if not matches:
+            self.table_builder.system_message.create_error_message(f"No row has [bold cyan]{key}[/] = [bold cyan]{value}[/].")
+            return None
+        if len(matches) > 1:
+            shown = matches[:PICKER_PAGE_SIZE]
+            caption = f"[bold yellow]Showing {len(shown):,} of {len(matches):,} matching rows.[/]"
+            self.table_builder.console.print(self.table_builder.table_display.build_rows_table(shown, caption=caption))
+            self.table_builder.system_message.create_error_message(f"{len(matches):,} rows have [bold cyan]{key}[/] = [bold cyan]{value}[/]. Use 'row,column' to pick one.")
+            return None
+        return matches[0]
+
+    def pick_cell(self) -> tuple:
+        """
+        Page through the table, optionally filtered by a search term, until a cell is chosen.
+
+        Returns:
+            tuple: The 0-based (row, column) indices, or None if the picker was cancelled.
+        """
+        display = self.table_builder.table_display
+        row_count = len(self.table_builder.table_data["rows"])
+        matches = range(row_count)
+        search = None
+        page = 0
+
+        columns = " | ".join(f"[bold cyan]{idx}[/] {col['name']}" for idx, col in enumerate(self.table_builder.table_data["columns"], start=1))
+        self.table_builder.console.print(f"[bold green]Columns[/]: {columns}")
+
+        while True:
+            page_count = max(1, -(-len(matches) // PICKER_PAGE_SIZE))
+            page = min(page, page_count - 1)
+            shown = matches[page * PICKER_PAGE_SIZE:(page + 1) * PICKER_PAGE_SIZE]
+            found = f" matching [bold cyan]{search}[/]" if search else ""
+            caption = f"[bold yellow]Page {page + 1:,} of {page_count:,} ({len(matches):,} rows{found})[/]"
+            self.table_builder.console.print(display.build_rows_table(shown, caption=caption))
+
+            choice = self.table_builder.input_handler.get_user_input(
+                "[bold yellow]Enter cell as 'row,column' or 'key=value column', '/text' to search, "
+                "'n'/'p' for the next/previous page, or 'q' to cancel[/]: "
+            )
+            if choice is None or choice.lower() == "q":
+                return None
+            if choice.lower() == "n":
+                page += 1
+            elif choice.lower() == "p":
+                page = max(0, page - 1)
+            elif choice.startswith("/"):
+                search = choice[1:].strip() or None
+                matches = self._search_rows(search) if search else range(row_count)
+                page = 0
+            elif choice:
+                cell = self.resolve_cell_address(choice)
+                if cell is not None:
+                    return cell
+
+    def _search_rows(self, text: str) -> list:
+        """
+        Returns:
+            list: 0-based indices of the rows with a string cell containing the text, ignoring case.
+        """
+        table_search = self.table_builder.table_search
+        building = table_search.postings is None and len(text) >= 3
+        with self.table_builder.console.status("[bold yellow]Indexing table...[/]" if building else "[bold yellow]Searching...[/]"):
+            hits = table_search.search(text)
+        # Hits are in row order, one per matching cell
+        return list(dict.fromkeys(row_index for row_index, _ in hits))
+
     def remove_column(self) -> None:
         """
         Removes a column based on the column name provided by the user.
@@ -266,6 +417,7 @@ class TableOperations:
             ]
             for row in self.table_builder.table_data["rows"]:
                 row.pop(column_name, None)
+            self.table_builder.notify("column_removed", column_name)
 
             self.table_builder.table_saved = False
             self.table_builder.system_message.create_information_message(f"Column '[bold cyan]{column_name}[/]' removed successfully.")
@@ -279,15 +431,95 @@ class TableOperations:
         """
         row_number = int(self.table_builder.input_handler.get_user_input("[bold yellow]Enter row number to remove (1-based index)[/]: ")) - 1
         if 0 <= row_number < len(self.table_builder.table_data["rows"]):
-            self.table_builder.table_data["rows"].pop(row_number)
+            removed_row = self.table_builder.table_data["rows"].pop(row_number)
+            self.table_builder.notify("row_removed", row_number, removed_row)
             self.table_builder.table_saved = False
             self.table_builder.system_message.create_information_message("Row removed.")
         else:
             self.table_builder.system_message.create_error_message("Invalid row number.")
 
+    def sort_table(self, keys: str = None) -> None:
+        """
+        Sort the rows of the table on one or more columns, e.g. `region, price desc`. Values are
+        compared as their column's type, missing values first, and rows with equal keys keep
+        their order.
+
+        Args:
+            keys (str): The columns to sort by. If not provided, prompts the user.
+        """
+        columns = self.table_builder.table_data["columns"]
+        if not columns:
+            self.table_builder.system_message.create_error_message("The table has no columns to sort by.")
+            return
+
+        keys = keys or self.table_builder.input_handler.get_user_input("[bold yellow]Enter the columns to sort by, e.g. region, price desc[/]: ")
+        if keys is None:
+            return
+        column_names = [column["name"] for column in columns]
+        try:
+            parsed = parse_sort_keys(keys, column_names)
+        except ValueError as e:
+            self.table_builder.system_message.create_error_message(str(e))
+            return
+
+        # The rows are in memory already, so they are sorted in place
+        key = sort_key([(column_names[position], descending) for position, descending in parsed], [columns[position]["type"] for position, _ in parsed])
+        self.table_builder.table_data["rows"].sort(key=key)
+        self.table_builder.notify("table_loaded")
+        self.table_builder.table_saved = False
+        self.table_builder.system_message.create_information_message(f"Table sorted by [bold cyan]{keys}[/].")
+
+    def dedupe_table(self, options: str = None) -> None:
+        """
+        Remove duplicate rows from the table, comparing whole rows or some columns, e.g.
+        `region, name keep last`. Rows are compared by a 64-bit digest of their values held in a
+        compact digest set, in one pass over the rows.
+
+        Args:
+            options (str): The columns that must match and which row to keep, see
+                `parse_dedupe_options`. If not provided, prompts the user.
+        """
+        columns = self.table_builder.table_data["columns"]
+        if not columns:
+            self.table_builder.system_message.create_error_message("The table has no columns to compare.")
+            return
+
+        if options is None:
+            options = self.table_builder.input_handler.get_user_input(
+                "[bold yellow]Enter the columns that must match, separated by commas, and 'keep last' to keep the last of every group (press Enter to compare whole rows and keep the first)[/]: "
+            )
+            if options is None:
+                return
+        column_names = [column["name"] for column in columns]
+        try:
+            positions, keep = parse_dedupe_options(options, column_names)
+        except ValueError as e:
+            self.table_builder.system_message.create_error_message(str(e))
+            return
+
+        rows = self.table_builder.table_data["rows"]
+        deduplicator = RowDeduplicator([column_names[position] for position in positions], keep, expected=len(rows))
+        try:
+            kept = list(deduplicator.filter(rows))
+        except ValueError as e:
+            self.table_builder.system_message.create_error_message(f"Failed to remove duplicate rows: {e}")
+            return
+        compared = "whole rows" if len(positions) == len(column_names) else ", ".join(column_names[position] for position in positions)
+        if not deduplicator.removed:
+            self.table_builder.system_message.create_information_message(f"No duplicate rows found comparing [bold cyan]{compared}[/].")
+            return
+        self.table_builder.table_data["rows"] = kept
+        self.table_builder.notify("table_loaded")
+        self.table_builder.table_saved = False
+        self.table_builder.system_message.create_information_message(
+            f"Removed [bold cyan]{deduplicator.removed:,}[/] duplicate rows comparing [bold cyan]{compared}[/], keeping the {keep} of every group. "
+            f"[bold cyan]{deduplicator.kept:,}[/] rows left."
+        )
+
     def clear_table(self) -> None:
         """
         Clears the table data.
         """
         self.table_builder.table_data = {"columns": [], "rows": []}
+        self.table_builder.notify("table_loaded")
         self.table_builder.system_message.create_information_message("Table cleared.")
\ No newline at end of file
@@ -0,0 +1,156 @@
+import os
+import time
+from .io import compression
+from .load_options import SAMPLING_METHODS, PREVIEW_ROWS
+
+
+class TablePreview:
+
+    def __init__(self, table_builder):
+        """
+        Loads a sample of a file or database table to see what it holds before committing to a
+        full load, and promotes the last sample to a full load of the same source.
+
+        The sample is read through the normal loaders with the current load options, so type
+        inference and display run on the sample alone. A head sample stops reading after its
+        rows, a random sample reads the source once with reservoir sampling, and a random sample
+        of a database table only reads the rows whose rowids were drawn.
+        """
+        self.table_builder = table_builder
+        # ("file", path) or ("table", name) of the last sampled load, promoted by 'load full'
+        self.source = None
+
+    def _file_loader(self, path: str):
+        """
+        Returns:
+            callable: The loader for a file, chosen by its extension, or None if it has none.
+        """
+        if compression.has_extension(path, ".csv"):
+            return self.table_builder.csv_handler.load_csv
+        extension = os.path.splitext(path)[1].lower()
+        if extension in (".xlsx", ".xlsm"):
+            return self.table_builder.excel_handler.load_excel
+        if extension == ".ods":
+            return self.table_builder.ods_handler.load_ods
+        if extension == ".pdf":
+            return self.table_builder.pdf_handler.load_pdf
+        return None
+
+    def _load(self, source: tuple, options) -> tuple:
+        """
+        Load a source with some load options.
+
+        Returns:
+            tuple: The source loaded, with the table name filled in if it was chosen from a
+                list, or None if nothing was loaded.
+        """
+        kind, name = source
+        if kind == "table":
+            table_name = self.table_builder.database_handler.load_from_database(options, table_name=name)
+            return None if table_name is None else ("table", table_name)
+
+        loader = self._file_loader(name)
+        if loader is None:
+            self.table_builder.system_message.create_error_message("Previews support CSV, Excel (.xlsx), ODS and PDF files.")
+            return None
+        # The loaders report errors themselves; a successful load always replaces the rows
+        rows_before = self.table_builder.table_data["rows"]
+        loader(name, options=options)
+        return source if self.table_builder.table_data["rows"] is not rows_before else None
+
+    def load_sample(self, source: tuple, size: int = PREVIEW_ROWS, sampling: str = "head") -> bool:
+        """
+        Load a sample of a source, honoring the current columns, condition and row window.
+
+        Args:
+            source (tuple): ("file", path) or ("table", table name). The table name may be None
+                to choose the table from a list.
+            size (int): The number of rows in the sample.
+            sampling (str): One of SAMPLING_METHODS.
+
+        Returns:
+            bool: True if the sample was loaded.
+        """
+        options = self.table_builder.load_options.with_sample(size, sampling)
+        start = time.perf_counter()
+        source = self._load(source, options)
+        if source is None:
+            return False
+
+        self.source = source
+        # A sample must never be saved over the full table
+        self.table_builder.table_saved = False
+        if source[0] == "table":
+            self.table_builder.name = f"{source[1]}_sample"
+        self.table_builder.system_message.create_information_message(
+            f"Sampled [bold cyan]{len(self.table_builder.table_data['rows']):,}[/] rows in [bold cyan]{time.perf_counter() - start:.3f}[/] seconds. "
+            "Enter [bold cyan]load full[/] to load all of it."
+        )
+        return True
+
+    def load_full(self) -> bool:
+        """
+        Load the whole source of the last sample, with the current load options.
+
+        Returns:
+            bool: True if the source was loaded.
+        """
+        if self.source is None:
+            self.table_builder.system_message.create_error_message("No sample loaded. Use 'preview' first.")
+            return False
+        start = time.perf_counter()
+        if self._load(self.source, self.table_builder.load_options) is None:
+            return False
+        self.source = None
+        self.table_builder.system_message.create_information_message(
+            f"Loaded [bold cyan]{len(self.table_builder.table_data['rows']):,}[/] rows in [bold cyan]{time.perf_counter() - start:.3f}[/] seconds."
+        )
+        return True
+
+    def preview(self) -> bool:
+        """
+        Prompt for a source and a sample size, load and print the sample, and offer to load
+        the whole source.
+
+        Returns:
+            bool: True if the table was loaded, either the sample or the full source.
+        """
+        get_user_input = self.table_builder.input_handler.get_user_input
+        path = get_user_input("[bold yellow]Enter the path of a CSV, Excel, ODS or PDF file, or 'table' to preview a database table[/]: ")
+        if path is None or not path.strip():
+            return False
+        path = path.strip()
+        if path.lower() == "table":
+            source = ("table", None)
+        elif not os.path.isfile(path):
+            self.table_builder.system_message.create_error_message("Invalid path or file does not exist.")
+            return False
+        else:
+            source = ("file", path)
+
+        size = get_user_input(f"[bold yellow]Enter the number of rows to sample (press Enter for {PREVIEW_ROWS})[/]: ")
+        if size is None:
+            return False
+        sampling = get_user_input("[bold yellow]Enter 'head' for the first rows or 'random' for a random sample (press Enter for head)[/]: ")
+        if sampling is None:
+            return False
+        sampling = sampling.strip().lower() or "head"
+        try:
+            size = int(size.replace(",", "")) if size.strip() else PREVIEW_ROWS
+            if size <= 0:
+                raise ValueError
+        except ValueError:
+            self.table_builder.system_message.create_error_message("The number of rows must be a positive whole number.")
+            return False
+        if sampling not in SAMPLING_METHODS:
+            self.table_builder.system_message.create_error_message(f"Unknown sampling method '{sampling}'. Use one of: {', '.join(SAMPLING_METHODS)}.")
+            return False
+
+        if not self.load_sample(source, size, sampling):
+            return False
+        self.table_builder.table_display.print_table()
+
+        choice = get_user_input("[bold yellow]Enter 'full' to load all of it, or press Enter to keep the sample[/]: ")
+        if choice is not None and choice.strip().lower() == "full":
+            self.load_full()
+        return True
@@ -0,0 +1,203 @@
+import bisect
+from array import array
+from collections import defaultdict
+from functools import partial
+
+# Hits shown per page by the find command.
+FIND_PAGE_SIZE = 20
+
+# Removed rows are remembered to map row ids to positions; past this many the index is rebuilt instead.
+MAX_REMOVED_ROWS = 4096
+
+
+class TableSearch:
+
+    def __init__(self, table_builder):
+        """
+        Case-insensitive substring search over the string cells of the table, backed by a
+        trigram inverted index.
+
+        Every row gets an id when it is indexed, and each trigram of a lowercased cell maps to
+        the ids of the rows containing it. A search only checks the rows listed under the
+        query's rarest trigram, so it costs time in proportion to the hits rather than to the
+        table. The index is built on the first search and then kept current by the table change
+        notifications: added rows are indexed, an edited cell moves its row between the postings
+        of the trigrams it gained and lost, and removed rows are skipped.
+        """
+        self.table_builder = table_builder
+        self.postings = None
+        self.next_id = 0
+        self.removed = []
+
+    def build(self) -> None:
+        # Row ids are kept as packed unsigned ints, 4 bytes per entry
+        self.postings = defaultdict(partial(array, "I"))
+        string_columns = self.string_columns()
+        for row_id, row in enumerate(self.table_builder.table_data["rows"]):
+            self._add_row_id(row_id, row, string_columns)
+        self.next_id = len(self.table_builder.table_data["rows"])
+        self.removed = []
+
+    def ensure_built(self) -> None:
+        if self.postings is None:
+            self.build()
+
+    def invalidate(self) -> None:
+        self.postings = None
+
+    def string_columns(self) -> list:
+        return [column["name"] for column in self.table_builder.table_data["columns"] if column["type"] == "str"]
+
+    @staticmethod
+    def trigrams(row: dict, column_names: list) -> set:
+        """
+        Returns:
+            set: The distinct trigrams of the lowercased string cells of a row.
+        """
+        grams = set()
+        for value in map(row.get, column_names):
+            if value.__class__ is str:
+                text = value.lower()
+                grams.update([text[idx:idx + 3] for idx in range(len(text) - 2)])
+        return grams
+
+    def _add_row_id(self, row_id: int, row: dict, column_names: list) -> None:
+        postings = self.postings
+        for trigram in self.trigrams(row, column_names):
+            postings[trigram].append(row_id)
+
+    def _position(self, row_id: int) -> int:
+        return row_id - bisect.bisect_left(self.removed, row_id)
+
+    def _row_id(self, position: int) -> int:
+        row_id = position
+        for removed_id in self.removed:
+            if removed_id > row_id:
+                break
+            row_id += 1
+        return row_id
+
+    def search(self, text: str) -> list:
+        """
+        Find the string cells containing some text, ignoring case.
+
+        Args:
+            text (str): The text to look for.
+
+        Returns:
+            list: (row index, column name) of every matching cell, in row order.
+        """
+        text = text.lower()
+        rows = self.table_builder.table_data["rows"]
+        string_columns = self.string_columns()
+
+        if len(text) < 3:
+            # Shorter than a trigram: nothing to look up, check every row
+            candidates = range(len(rows))
+        else:
+            self.ensure_built()
+            lists = []
+            for idx in range(len(text) - 2):
+                ids = self.postings.get(text[idx:idx + 3])
+                if ids is None:
+                    return []
+                lists.append(ids)
+            rarest = min(lists, key=len)
+            removed = set(self.removed)
+            candidates = sorted({self._position(row_id) for row_id in rarest if row_id not in removed})
+
+        hits = []
+        for row_index in candidates:
+            row = rows[row_index]
+            for column_name in string_columns:
+                value = row.get(column_name)
+                if value.__class__ is str and text in value.lower():
+                    hits.append((row_index, column_name))
+        return hits
+
+    def find(self, text: str = None) -> None:
+        """
+        Search the table and page through the matching cells.
+
+        Args:
+            text (str): The text to look for. If not provided, prompts the user.
+        """
+        get_user_input = self.table_builder.input_handler.get_user_input
+        text = text or get_user_input("[bold yellow]Enter the text to find[/]: ")
+        if not text or not text.strip():
+            return
+        text = text.strip()
+
+        building = self.postings is None and len(text) >= 3
+        with self.table_builder.console.status("[bold yellow]Indexing table...[/]" if building else "[bold yellow]Searching...[/]"):
+            hits = self.search(text)
+
+        if not hits:
+            self.table_builder.system_message.create_information_message(f"No cells contain '[bold cyan]{text}[/]'.")
+            return
+
+        rows = self.table_builder.table_data["rows"]
+        page = 0
+        page_count = -(-len(hits) // FIND_PAGE_SIZE)
+        while True:
+            first = page * FIND_PAGE_SIZE
+            shown = [(str(row_index + 1), column_name, rows[row_index][column_name]) for row_index, column_name in hits[first:first + FIND_PAGE_SIZE]]
+            caption = f"[bold yellow]Page {page + 1:,} of {page_count:,} ({len(hits):,} cells contain '{text}')[/]"
+            self.table_builder.console.print(self.table_builder.table_display.build_page_table(["Row", "Column", "Value"], shown, first, f"Find: {text}", caption))
+
+            if page_count == 1:
+                return
+            choice = get_user_input("[bold yellow]Enter 'n'/'p' for the next/previous page, or 'q' to stop[/]: ")
+            if choice is None or choice.strip().lower() in ("q", ""):
+                return
+            if choice.strip().lower() == "n":
+                page = min(page + 1, page_count - 1)
+            elif choice.strip().lower() == "p":
+                page = max(page - 1, 0)
+
+    def table_loaded(self) -> None:
+        self.invalidate()
+
+    def row_added(self, row_index: int, row: dict) -> None:
+        if self.postings is not None:
+            self._add_row_id(self.next_id, row, self.string_columns())
+            self.next_id += 1
+
+    def row_removed(self, row_index: int, row: dict) -> None:
+        if self.postings is None:
+            return
+        if len(self.removed) >= MAX_REMOVED_ROWS:
+            self.invalidate()
+            return
+        bisect.insort(self.removed, self._row_id(row_index))
+
+    def cell_changed(self, row_index: int, column_name: str, old_value, new_value) -> None:
+        if self.postings is None:
+            return
+        string_columns = self.string_columns()
+        if column_name not in string_columns:
+            return
+        row = self.table_builder.table_data["rows"][row_index]
+        new_grams = self.trigrams(row, string_columns)
+        old_grams = self.trigrams({**row, column_name: old_value}, string_columns)
+        row_id = self._row_id(row_index)
+        postings = self.postings
+        for trigram in old_grams - new_grams:
+            ids = postings[trigram]
+            ids.remove(row_id)
+            if not ids:
+                del postings[trigram]
+        for trigram in new_grams - old_grams:
+            postings[trigram].append(row_id)
+
+    def column_added(self, column_name: str) -> None:
+        pass
+
+    def column_removed(self, column_name: str) -> None:
+        pass
+
+    def column_renamed(self, old_name: str, new_name: str) -> None:
+        pass
+
+    def column_type_changed(self, column_name: str) -> None:
+        self.invalidate()
@@ -0,0 +1,461 @@
+import heapq
+import itertools
+import math
+import operator
+import time
+from collections import Counter
+from operator import itemgetter
+from rich.markup import escape
+from rich.table import Table
+from .table_display import RenderCache
+
+# Precision of the distinct estimates: 2**14 registers, a standard error of about 0.8%.
+HLL_PRECISION = 14
+
+# Columns with at most this many distinct values keep the count of every value, so their
+# distinct count, top values and extremes stay exact through any edit.
+EXACT_COUNT_LIMIT = 10_000
+
+# Most frequent values shown per column.
+TOP_VALUES = 3
+
+# Most frequent values whose counts high-cardinality columns keep, so the shown ones stay
+# known through additions of other values.
+TOP_TRACKED = 32
+
+_MASK = 2**64 - 1
+
+# 2**-rank for every register value, summed by the HyperLogLog estimate.
+_INVERSE_POWERS = [2.0 ** -rank for rank in range(65)]
+
+# Column type of cell values that are not text.
+_CLASS_TYPES = {bool: "bool", int: "int", float: "float"}
+
+# Narrowest type that holds values of both types.
+_TYPE_UNIONS = {frozenset(("int", "float")): "float"}
+
+
+def _value_type(value) -> str:
+    """
+    Returns:
+        str: The narrowest column type the value converts to.
+    """
+    if value.__class__ is str:
+        text = value.strip()
+        if text.lower() in ("true", "false"):
+            return "bool"
+        try:
+            int(text)
+            return "int"
+        except ValueError:
+            pass
+        try:
+            float(text)
+            return "float" if text.lower() not in ("nan", "inf", "-inf", "infinity", "-infinity") else "str"
+        except ValueError:
+            return "str"
+    return _CLASS_TYPES.get(value.__class__, "str")
+
+
+def union_type(first: str, second: str) -> str:
+    """
+    Returns:
+        str: The narrowest column type holding values of both types. A first type of None, as
+            for a column without values, gives the second.
+    """
+    if first is None or first == second:
+        return second
+    return _TYPE_UNIONS.get(frozenset((first, second)), "str")
+
+
+class HyperLogLog:
+
+    __slots__ = ("precision", "registers")
+
+    def __init__(self, precision: int = HLL_PRECISION):
+        """
+        Estimates the number of distinct values added to it in a fixed 2**precision bytes.
+
+        Every value is hashed to 64 bits; the first `precision` bits pick a register and the
+        register keeps the longest run of leading zeros seen in the rest. Adding a value twice
+        changes nothing, so a sketch can be built from distinct values or from every cell
+        alike. Values cannot be taken out again.
+        """
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def add(self, value) -> None:
+        self.update((value,))
+
+    def update(self, values) -> None:
+        registers = self.registers
+        rest_bits = 64 - self.precision
+        rest_mask = (1 << rest_bits) - 1
+        # Python hashes numbers to themselves or close to it; the SipHash of their text spreads
+        # the bits, and runs in C
+        for x in map(hash, map(repr, values)):
+            x &= _MASK
+            rank = rest_bits - (x & rest_mask).bit_length() + 1
+            if rank > registers[x >> rest_bits]:
+                registers[x >> rest_bits] = rank
+
+    def estimate(self) -> int:
+        """
+        Returns:
+            int: The estimated number of distinct values, with linear counting for small sets.
+        """
+        registers = self.registers
+        size = len(registers)
+        estimate = 0.7213 / (1 + 1.079 / size) * size * size / sum(map(_INVERSE_POWERS.__getitem__, registers))
+        zeros = registers.count(0)
+        if estimate <= 2.5 * size and zeros:
+            estimate = size * math.log(size / zeros)
+        return round(estimate)
+
+
+class ColumnSummary:
+
+    __slots__ = (
+        "count", "nulls", "counts", "sketch", "top", "outside_count", "untracked_adds",
+        "minimum", "maximum", "min_length", "max_length", "numbers", "mean", "m2", "fitting_type",
+    )
+
+    def __init__(self):
+        """
+        Statistics of one column: counts, distinct values, extremes, mean and standard
+        deviation of numbers, text lengths, most frequent values, and the narrowest type every
+        value converts to.
+
+        Build one with `from_counts`, then keep it current with `add` and `remove`. Columns of
+        up to EXACT_COUNT_LIMIT distinct values keep a Counter of every value and absorb any
+        change. Larger columns keep a HyperLogLog sketch and their top values instead, which
+        take additions but not removals of a distinct value or an extreme; `add` and `remove`
+        return False when the summary can no longer be kept exact and must be rebuilt.
+        """
+        self.count = 0
+        self.nulls = 0
+        self.counts = None
+        self.sketch = None
+        self.top = {}
+        # Highest count of a value outside `top`, and additions of such values since it was taken
+        self.outside_count = 0
+        self.untracked_adds = 0
+        self.minimum = None
+        self.maximum = None
+        self.min_length = None
+        self.max_length = None
+        # Welford's running mean and sum of squared deviations of the numeric values
+        self.numbers = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.fitting_type = None
+
+    @classmethod
+    def from_counts(cls, counts: Counter) -> "ColumnSummary":
+        """
+        Summarise a column from the row count of each of its values. Everything is derived from
+        the distinct values and their counts, so repeated values cost nothing further.
+
+        Args:
+            counts (Counter): Value mapped to its row count, with missing cells under None. It
+                is kept by the summary.
+
+        Returns:
+            ColumnSummary: The summary of the column.
+        """
+        summary = cls()
+        summary.nulls = counts.pop(None, 0)
+        summary.count = sum(counts.values())
+        summary._derive(counts)
+        if len(counts) <= EXACT_COUNT_LIMIT:
+            summary.counts = counts
+        else:
+            summary._track_top(counts)
+        return summary
+
+    def _derive(self, counts: dict) -> None:
+        """
+        Compute the extremes, lengths, numeric moments and fitting type from distinct values.
+        Columns of one type, the usual case, are handled with `map` over the values.
+        """
+        classes = set(map(type, counts))
+        try:
+            self.minimum = min(counts, default=None)
+            self.maximum = max(counts, default=None)
+        except TypeError:
+            self.minimum = self.maximum = None
+
+        if str not in classes:
+            texts = ()
+        else:
+            texts = counts if len(classes) == 1 else [value for value in counts if value.__class__ is str]
+        self.min_length = min(map(len, texts), default=None)
+        self.max_length = max(map(len, texts), default=None)
+
+        if classes <= {int, float}:
+            numbers, weights = list(counts), list(counts.values())
+        else:
+            numbers = [value for value in counts if value.__class__ is int or value.__class__ is float]
+            weights = list(map(counts.__getitem__, numbers))
+        self.numbers = sum(weights)
+        if self.numbers:
+            self.mean = math.fsum(map(operator.mul, numbers, weights)) / self.numbers
+            deviations = map(operator.sub, numbers, itertools.repeat(self.mean))
+            self.m2 = math.fsum(map(operator.mul, weights, map(pow, deviations, itertools.repeat(2))))
+        else:
+            self.mean = self.m2 = 0.0
+
+        fitting_type = None
+        for value_class in classes - {str}:
+            fitting_type = union_type(fitting_type, _CLASS_TYPES.get(value_class, "str"))
+        if str in classes:
+            for value in texts:
+                if fitting_type == "str":
+                    break
+                fitting_type = union_type(fitting_type, _value_type(value))
+        self.fitting_type = fitting_type
+
+    def _track_top(self, counts: dict) -> None:
+        """
+        Switch to the sketch and top values of a high-cardinality column.
+        """
+        self.sketch = HyperLogLog()
+        self.sketch.update(counts)
+        leaders = heapq.nlargest(TOP_TRACKED + 1, counts.items(), key=itemgetter(1))
+        self.top = dict(leaders[:TOP_TRACKED])
+        self.outside_count = leaders[TOP_TRACKED][1] if len(leaders) > TOP_TRACKED else 0
+        self.untracked_adds = 0
+        self.counts = None
+
+    @property
+    def distinct(self) -> int:
+        return len(self.counts) if self.counts is not None else self.sketch.estimate()
+
+    @property
+    def distinct_is_exact(self) -> bool:
+        return self.counts is not None
+
+    @property
+    def stddev(self) -> float:
+        """
+        Returns:
+            float: The sample standard deviation of the numeric values, or None for fewer than two.
+        """
+        return math.sqrt(max(self.m2, 0.0) / (self.numbers - 1)) if self.numbers > 1 else None
+
+    def top_values(self) -> list:
+        """
+        Returns:
+            list: (value, count) of the most frequent values, most frequent first.
+        """
+        source = self.counts if self.counts is not None else self.top
+        return heapq.nlargest(TOP_VALUES, source.items(), key=itemgetter(1))
+
+    def add(self, value) -> bool:
+        """
+        Account for a cell that now holds a value.
+
+        Returns:
+            bool: False if the summary can no longer be kept exact and must be rebuilt.
+        """
+        if value is None:
+            self.nulls += 1
+            return True
+        self.count += 1
+        try:
+            if self.minimum is None or value < self.minimum:
+                self.minimum = value
+            if self.maximum is None or value > self.maximum:
+                self.maximum = value
+        except TypeError:
+            return False
+        if value.__class__ is str:
+            length = len(value)
+            self.min_length = length if self.min_length is None else min(self.min_length, length)
+            self.max_length = length if self.max_length is None else max(self.max_length, length)
+        elif value.__class__ is int or value.__class__ is float:
+            self.numbers += 1
+            delta = value - self.mean
+            self.mean += delta / self.numbers
+            self.m2 += delta * (value - self.mean)
+        self.fitting_type = union_type(self.fitting_type, _value_type(value))
+
+        if self.counts is not None:
+            self.counts[value] += 1
+            if len(self.counts) > EXACT_COUNT_LIMIT:
+                self._track_top(self.counts)
+            return True
+        self.sketch.add(value)
+        if value in self.top:
+            self.top[value] += 1
+            return True
+        # A value outside the tracked ones has at most outside_count + untracked_adds cells, so
+        # the shown values stay right until that could pass the least of them
+        self.untracked_adds += 1
+        return self.outside_count + self.untracked_adds <= self.top_values()[-1][1]
+
+    def remove(self, value) -> bool:
+        """
+        Account for a cell that no longer holds a value. The fitting type may stay wider than
+        needed, but every remaining value still converts to it.
+
+        Returns:
+            bool: False if the summary can no longer be kept exact and must be rebuilt.
+        """
+        if value is None:
+            self.nulls -= 1
+            return True
+        if self.counts is None:
+            # A sketch cannot forget a value
+            return False
+        self.count -= 1
+        remaining = self.counts[value] - 1
+        if remaining:
+            self.counts[value] = remaining
+        else:
+            del self.counts[value]
+            # The extremes may have gone; they are found again among the distinct values
+            if value == self.minimum or value == self.maximum or (
+                value.__class__ is str and len(value) in (self.min_length, self.max_length)
+            ):
+                numbers, mean, m2 = self.numbers, self.mean, self.m2
+                self._derive(self.counts)
+                self.numbers, self.mean, self.m2 = numbers, mean, m2
+        if value.__class__ is int or value.__class__ is float:
+            self.numbers -= 1
+            if not self.numbers:
+                self.mean = self.m2 = 0.0
+            else:
+                delta = value - self.mean
+                self.mean -= delta / self.numbers
+                self.m2 -= delta * (value - self.mean)
+        return True
+
+
+class TableStats:
+
+    def __init__(self, table_builder):
+        """
+        Column statistics for the describe command, computed per column on first use and
+        cached.
+
+        The cache is kept current by the table change notifications: added rows, edited cells
+        and removed rows update the summaries they touch, and a summary that cannot take a
+        change is dropped and rebuilt the next time it is asked for. Loading, sorting or
+        deduplicating the table drops them all.
+        """
+        self.table_builder = table_builder
+        self.summaries = {}
+
+    def summary(self, column_name: str) -> ColumnSummary:
+        summary = self.summaries.get(column_name)
+        if summary is None:
+            summary = ColumnSummary.from_counts(self.table_builder.table_encoding.value_counts(column_name))
+            self.summaries[column_name] = summary
+        return summary
+
+    def fitting_type(self, column_name: str) -> str:
+        """
+        Returns:
+            str: The narrowest type every value of the column converts to, or None if it is empty.
+        """
+        return self.summary(column_name).fitting_type
+
+    def describe(self, column_names: str = None) -> None:
+        """
+        Print the statistics of the table's columns.
+
+        Args:
+            column_names (str): Comma-separated columns to describe. All columns if not given.
+        """
+        columns = self.table_builder.table_data["columns"]
+        if not columns:
+            self.table_builder.system_message.create_error_message("The table has no columns to describe.")
+            return
+        if column_names:
+            wanted = [name.strip() for name in column_names.split(",") if name.strip()]
+            known = {column["name"] for column in columns}
+            unknown = [name for name in wanted if name not in known]
+            if unknown:
+                self.table_builder.system_message.create_error_message(f"Unknown column '{unknown[0]}'.")
+                return
+            columns = [column for column in columns if column["name"] in wanted]
+
+        cached = sum(column["name"] in self.summaries for column in columns)
+        start = time.perf_counter()
+        with self.table_builder.console.status("[bold yellow]Computing column statistics...[/]"):
+            summaries = [self.summary(column["name"]) for column in columns]
+        elapsed = time.perf_counter() - start
+
+        display = self.table_builder.table_display
+        table = Table(
+            title=f"[{display.table_title_style}]Statistics of {escape(self.table_builder.name or '')}[/]",
+            border_style=display.table_border_style, show_lines=True,
+        )
+        for header in ("Column", "Type", "Count", "Nulls", "Distinct", "Min", "Max", "Mean", "Std Dev", "Length", "Top Values"):
+            table.add_column(header, style="bold yellow" if header == "Column" else None)
+        for column, summary in zip(columns, summaries):
+            table.add_row(*self._describe_row(column, summary))
+        self.table_builder.console.print(table)
+        self.table_builder.system_message.create_information_message(
+            f"Described [bold cyan]{len(columns)}[/] columns of [bold cyan]{len(self.table_builder.table_data['rows']):,}[/] rows "
+            f"in [bold cyan]{elapsed:.3f}[/] seconds, [bold cyan]{cached}[/] from the cache."
+        )
+
+    @staticmethod
+    def _describe_row(column: dict, summary: ColumnSummary) -> list:
+        def text(value) -> str:
+            return escape(RenderCache.format_value(value))
+
+        def number(value: float) -> str:
+            if value == 0 or 1e-4 <= abs(value) < 1e15:
+                return f"{value:,.4f}".rstrip("0").rstrip(".")
+            return f"{value:.4g}"
+
+        column_type = column["type"]
+        if summary.fitting_type and summary.fitting_type != column_type:
+            column_type += f" (fits {summary.fitting_type})"
+        distinct = f"{summary.distinct:,}" if summary.distinct_is_exact else f"≈{summary.distinct:,}"
+        numeric = summary.numbers > 0
+        lengths = "" if summary.min_length is None else f"{summary.min_length}–{summary.max_length}"
+        top = ", ".join(f"{text(value)} ({count:,})" for value, count in summary.top_values() if count > 1)
+        return [
+            escape(column["name"]), column_type, f"{summary.count:,}", f"{summary.nulls:,}", distinct,
+            text(summary.minimum), text(summary.maximum),
+            number(summary.mean) if numeric else "", number(summary.stddev) if numeric and summary.stddev is not None else "",
+            lengths, top,
+        ]
+
+    def _update(self, column_name: str, old_value, new_value) -> None:
+        summary = self.summaries.get(column_name)
+        if summary is not None and not (summary.remove(old_value) and summary.add(new_value)):
+            del self.summaries[column_name]
+
+    def table_loaded(self) -> None:
+        self.summaries = {}
+
+    def row_added(self, row_index: int, row: dict) -> None:
+        for column_name, summary in list(self.summaries.items()):
+            if not summary.add(row.get(column_name)):
+                del self.summaries[column_name]
+
+    def row_removed(self, row_index: int, row: dict) -> None:
+        for column_name, summary in list(self.summaries.items()):
+            if not summary.remove(row.get(column_name)):
+                del self.summaries[column_name]
+
+    def cell_changed(self, row_index: int, column_name: str, old_value, new_value) -> None:
+        self._update(column_name, old_value, new_value)
+
+    def column_added(self, column_name: str) -> None:
+        pass
+
+    def column_removed(self, column_name: str) -> None:
+        self.summaries.pop(column_name, None)
+
+    def column_renamed(self, old_name: str, new_name: str) -> None:
+        if old_name in self.summaries:
+            self.summaries[new_name] = self.summaries.pop(old_name)
+
+    def column_type_changed(self, column_name: str) -> None:
+        self.summaries.pop(column_name, None)
@@ -1,4 +1,9 @@
 import re
+from operator import itemgetter
+from .load_options import LoadOptions
+
+# Types tried, in order, when converting a column's cells to its inferred type.
+TYPE_FALLBACKS = {"int": ["int", "float"], "float": ["float"], "bool": ["bool"]}
 
 class InputHandler:
 
@@ -21,6 +26,38 @@ class InputHandler:
                 return None
             return user_input
 
+    @staticmethod
+    def convert_value(value, data_type: str):
+        """
+        Convert a cell value to a column data type. Missing values (None) are left as they are.
+
+        Args:
+            value: The cell value.
+            data_type (str): One of "int", "float", "str" or "bool".
+
+        Returns:
+            The converted value.
+
+        Raises:
+            ValueError: If the value cannot be represented as the data type.
+        """
+        if value is None or data_type == "str":
+            return value
+        if data_type == "int":
+            if isinstance(value, float) and not value.is_integer():
+                raise ValueError(f"{value} is not an integer")
+            return int(value.strip()) if isinstance(value, str) else int(value)
+        if data_type == "float":
+            return float(value)
+        if data_type == "bool":
+            if isinstance(value, bool):
+                return value
+            text = str(value).strip().lower()
+            if text not in ("true", "false"):
+                raise ValueError(f"{value} is not a boolean")
+            return text == "true"
+        raise ValueError(f"Unsupported data type: {data_type}")
+
     @staticmethod
     def infer_data_type( value: str) -> str:
         """
@@ -32,7 +69,7 @@ class InputHandler:
         Returns:
             str: The inferred type.
         """
-        value = value.strip()
+        value = str(value).strip()
 
         # Check for boolean values
         if value.lower() in {"true", "false"}:
@@ -83,6 +120,127 @@ class TableSpecs:
         existing_tables = self.table_builder.database_handler.get_tables()
         return len(existing_tables) + 1
     
+    def set_load_options(self) -> None:
+        """
+        Prompt for the columns and rows that CSV, Excel, ODS, PDF and database loads read.
+        Leaving every prompt empty loads everything again.
+        """
+        get_user_input = self.table_builder.input_handler.get_user_input
+        self.table_builder.system_message.create_information_message(f"Current load options: [bold cyan]{self.table_builder.load_options.describe()}[/]")
+
+        columns = get_user_input("[bold yellow]Enter the columns to load, separated by commas (leave empty for all)[/]: ")
+        if columns is None:
+            return
+        where = get_user_input("[bold yellow]Enter a condition for the rows to load, e.g. region = North and price >= 10 (leave empty for all rows)[/]: ")
+        if where is None:
+            return
+        offset = get_user_input("[bold yellow]Enter the number of matching rows to skip (leave empty for 0)[/]: ")
+        if offset is None:
+            return
+        limit = get_user_input("[bold yellow]Enter the most rows to load (leave empty for all)[/]: ")
+        if limit is None:
+            return
+
+        try:
+            offset = int(offset.replace(",", "")) if offset.strip() else 0
+            limit = int(limit.replace(",", "")) if limit.strip() else None
+        except ValueError:
+            self.table_builder.system_message.create_error_message("The number of rows to skip and load must be whole numbers.")
+            return
+        try:
+            options = LoadOptions([name.strip() for name in columns.split(",") if name.strip()], where, limit, offset)
+        except ValueError as e:
+            self.table_builder.system_message.create_error_message(str(e))
+            return
+
+        self.table_builder.load_options = options
+        self.table_builder.system_message.create_information_message(f"Loads will read [bold cyan]{options.describe()}[/].")
+
+    def load_table(self, header: list, rows) -> None:
+        """
+        Replace the table data with rows parsed from an external source.
+
+        Rows are consumed as they are read, empty and absent cells become None, repeated
+        string values are interned, and column types are inferred if enabled in the settings.
+
+        Args:
+            header (list): The column names, taken from the first row of the source.
+            rows (iterable): The remaining rows as sequences of cell values.
+        """
+        names = list(header)
+        width = len(names)
+        padding = [None] * width
+        interner = self.table_builder.table_encoding.new_interner(width)
+
+        self.table_builder.table_data["columns"] = [{"name": name, "type": "str"} for name in names]
+        self.table_builder.table_data["rows"] = [
+            dict(zip(names, interner.intern(row if len(row) >= width else list(row) + padding[len(row):])))
+            for row in rows
+        ]
+
+        if self.table_builder.settings.get_setting("infer_data_types") == "on":
+            self.infer_column_types()
+            self.coerce_column_types()
+        self.table_builder.table_encoding.use_interner(interner)
+        self.table_builder.notify("table_loaded")
+
+    def coerce_column_types(self) -> None:
+        """
+        Convert the cells of typed columns to the column's type so the column holds only values
+        of that type and None. An "int" column that turns out to hold decimals becomes "float";
+        any other column with a value that does not convert falls back to "str" unchanged.
+        """
+        rows = self.table_builder.table_data["rows"]
+        convert_value = self.table_builder.input_handler.convert_value
+
+        for column in self.table_builder.table_data["columns"]:
+            if column["type"] == "str":
+                continue
+            column_name = column["name"]
+            for data_type in TYPE_FALLBACKS.get(column["type"], []):
+                try:
+                    values = [convert_value(row[column_name], data_type) for row in rows]
+                except (ValueError, TypeError):
+                    continue
+                for row, value in zip(rows, values):
+                    row[column_name] = value
+                column["type"] = data_type
+                break
+            else:
+                column["type"] = "str"
+
+    def iter_row_values(self, null_value=None):
+        """
+        Yield each row's cells in column order.
+
+        Args:
+            null_value: What missing cells are written as. Only columns whose validity bitmap
+                reports nulls are checked, so complete columns are copied without a per-cell test.
+        """
+        column_names = [column["name"] for column in self.table_builder.table_data["columns"]]
+        rows = self.table_builder.table_data["rows"]
+        if not column_names:
+            return
+
+        if len(column_names) == 1:
+            get_values = lambda row: (row[column_names[0]],)
+        else:
+            get_values = itemgetter(*column_names)
+
+        nullable = []
+        if null_value is not None:
+            nullable = [idx for idx, name in enumerate(column_names) if self.table_builder.table_nulls.has_nulls(name)]
+        if not nullable:
+            yield from map(get_values, rows)
+            return
+
+        for row in rows:
+            values = list(get_values(row))
+            for idx in nullable:
+                if values[idx] is None:
+                    values[idx] = null_value
+            yield values
+
     def infer_column_types(self) -> None:
         """
         Infers data types for each column in the table based on the first non-empty row.
@@ -2,6 +2,7 @@
 
 from rich.console import Console
 import click
+import itertools
 import sys
 import os
 
@@ -10,20 +11,22 @@ console = Console()
 def reconstruct_path_from_args(raw_args):
     """Attempts to reconstruct a file path if Click mistakenly splits it due to spaces."""
     fixed_args = []
-    skip_next = False
+    skip_parts = 0
 
     for i, arg in enumerate(raw_args):
-        if skip_next:
-            skip_next = False
+        if skip_parts:
+            skip_parts -= 1
             continue
 
-        if arg in ("-c", "--csv", "-xl", "--xlsx", "-o", "--ods", "-p", "--pdf", "-d", "--database"):
-            if i + 1 < len(raw_args) and not raw_args[i + 1].startswith("-"):
-                reconstructed_path = " ".join(raw_args[i + 1:])  # Join everything after the flag
+        if arg in ("-ic", "--import-csv", "-c", "--csv", "-xl", "--xlsx", "-o", "--ods", "-p", "--pdf", "-d", "--database"):
+            path_parts = list(itertools.takewhile(lambda part: not part.startswith("-"), raw_args[i + 1:]))
+            if path_parts:
+                reconstructed_path = " ".join(path_parts)  # Join everything up to the next flag
                 if os.path.exists(reconstructed_path):  # Validate reconstructed path
                     fixed_args.append(arg)
                     fixed_args.append(reconstructed_path)
-                    return fixed_args  # Return immediately since we fixed the path
+                    skip_parts = len(path_parts)
+                    continue
                 else:
                     console.print(f"[bold red]Error:[/] Unable to automatically fix path: {reconstructed_path}")
                     console.print("[bold yellow]Ensure you wrap paths in quotes or escape spaces with `\\`[/]")
@@ -42,11 +45,32 @@ sys.argv = reconstruct_path_from_args(sys.argv)
 @click.option("--xlsx", "-xl", type=click.Path(file_okay=True, dir_okay=False, resolve_path=True), help="Load an XLSX file and jump to the Table Builder.")
 @click.option("--ods", "-o", type=click.Path(file_okay=True, dir_okay=False, resolve_path=True), help="Load an ODS file and jump to the Table Builder.")
 @click.option("--pdf", "-p", type=click.Path(file_okay=True, dir_okay=False, resolve_path=True), help="Load a PDF file and jump to the Table Builder.")
+@click.option("--sample", type=click.IntRange(min=1), help="Load only a sample of N rows of the --csv, --xlsx, --ods or --pdf file. Enter 'load full' to load the rest.")
+@click.option("--sample-method", type=click.Choice(["head", "random"]), default="head", show_default=True, help="Sample the first rows, or a random sample drawn in one pass over the file.")
+@click.option("--import-csv", "-ic", type=click.Path(exists=True, file_okay=True, dir_okay=False, resolve_path=True), help="Stream a CSV file into a table of the database given with --database, then exit.")
 @click.option("--tablebuilder", "-tb", is_flag=True, help="Bypass the Main Menu and jump straight to the Table Builder.")
 @click.option("--settings", "-s", is_flag=True, help="Bypass the Main Menu and jump straight to the Settings.")
 
-def main(database, csv, xlsx, ods, pdf, tablebuilder, settings):
+def main(database, csv, xlsx, ods, pdf, sample, sample_method, import_csv, tablebuilder, settings):
     """ Terminal Table Builder CLI"""
+    if sample is not None and not (csv or xlsx or ods or pdf):
+        raise click.UsageError("--sample needs a file to sample. Pass it with --csv, --xlsx, --ods or --pdf.")
+    if import_csv:
+        if not database:
+            raise click.UsageError("--import-csv needs a database to import into. Pass it with --database.")
+        from settings.settings import Settings
+        from database.database import Database
+        from table_builder.io import compression
+        console = Console()
+        app_settings = Settings(console)
+        database_manager = Database(console, app_settings)
+        database_manager.connect(db_path=database)
+        if not database_manager.is_connected():
+            sys.exit(1)
+        database_manager.import_csv_to_table(csv_path=import_csv, table_name=compression.strip_extensions(import_csv))
+        database_manager.close()
+        return
+
     if database:
         from table_builder.builder import TableBuilder
         from settings.settings import Settings
@@ -68,7 +92,9 @@ def main(database, csv, xlsx, ods, pdf, tablebuilder, settings):
         database_manager = Database(console, app_settings)
         table_builder = TableBuilder(console, app_settings, database_manager, name_on_start=True)
 
-        if csv:
+        if sample is not None:
+            table_builder.table_preview.load_sample(("file", csv or xlsx or ods or pdf), sample, sample_method)
+        elif csv:
             table_builder.csv_handler.load_csv(path=csv)
         elif xlsx:
             table_builder.excel_handler.load_excel(path=xlsx)
@@ -0,0 +1,15 @@
+import os
+
+from table_builder.io.csv_index import CSVIndex
+
+
+def test_unwritable_sidecar_keeps_index_in_memory(tmp_path):
+    csv_path = tmp_path / "rows.csv"
+    csv_path.write_text("id,name\n" + "".join(f"{idx},row {idx}\n" for idx in range(100)))
+    # A directory in the sidecar's place makes writing it fail
+    os.mkdir(str(csv_path) + ".idx")
+
+    with CSVIndex(str(csv_path), stride=8) as index:
+        assert not index.index_saved
+        assert index.row_count == 100
+        assert index.read_rows(97, 5) == [["97", "row 97"], ["98", "row 98"], ["99", "row 99"]]
@@ -0,0 +1,35 @@
+from datetime import date, datetime
+
+from table_builder.deduplication import RowDeduplicator, row_digest
+
+
+def test_numbers_with_equal_builtin_hashes_are_not_duplicates():
+    # hash(-1) == hash(-2) and hash(1) == hash(2**61)
+    rows = [{"id": -1, "x": "a"}, {"id": -2, "x": "a"}, {"id": 1, "x": "a"}, {"id": 2**61, "x": "a"}]
+    deduplicator = RowDeduplicator(["id", "x"])
+    assert list(deduplicator.filter(rows)) == rows
+    assert deduplicator.removed == 0
+
+
+def test_values_of_different_types_are_not_duplicates():
+    digest = row_digest([0])
+    assert len({digest([1]), digest([1.0]), digest([True]), digest(["1"])}) == 4
+
+
+def test_keep_last_keeps_the_last_row_of_every_group():
+    rows = [["a", "1"], ["b", "2"], ["a", "3"], ["c", "4"], ["b", "5"]]
+    assert list(RowDeduplicator([0], "last").filter(iter(rows))) == [["a", "3"], ["c", "4"], ["b", "5"]]
+    assert list(RowDeduplicator([0], "last").filter(rows)) == [["a", "3"], ["c", "4"], ["b", "5"]]
+
+
+def test_date_cells_are_compared():
+    # load_excel keeps date cells as datetime objects, which marshal cannot encode
+    rows = [
+        {"day": datetime(2024, 5, 1, 9, 30), "x": "a"},
+        {"day": datetime(2024, 5, 1, 9, 30), "x": "a"},
+        {"day": datetime(2024, 5, 2), "x": "a"},
+        {"day": date(2024, 5, 2), "x": "a"},
+    ]
+    deduplicator = RowDeduplicator(["day", "x"])
+    assert list(deduplicator.filter(rows)) == [rows[0], rows[2], rows[3]]
+    assert deduplicator.removed == 1
@@ -0,0 +1,13 @@
+from types import SimpleNamespace
+
+from table_builder.io.json_handler import JSONHandler
+
+
+def test_cancelling_the_first_prompt_saves_nothing(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    builder = SimpleNamespace(name="t", table_data={"columns": [], "rows": []}, table_saved=False)
+    builder.input_handler = SimpleNamespace(get_user_input=lambda prompt: None)
+
+    JSONHandler(builder).save_json()
+    assert not builder.table_saved
+    assert list(tmp_path.iterdir()) == []
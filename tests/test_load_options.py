@@ -0,0 +1,49 @@
+import sqlite3
+
+import pytest
+
+from table_builder.load_options import LoadOptions
+
+HEADER = ["name", "price"]
+ROWS = [["acme", "12"], ["bolt", "9"], ["", "100"], ["cog", ""], ["dent", "10.5"]]
+
+# Text and numeric cells side by side in both columns
+MIXED_ROWS = [
+    ["acme", "N/A"], ["5", "9"], ["Zed", " 7 "], ["true", "1e3"], ["50", "free"],
+    ["", "-2"], ["10.5", ""], [" ", "FALSE"], ["-1", "10"], ["b", "x10"],
+]
+
+
+def file_rows(where, rows=ROWS):
+    _, rows = LoadOptions(where=where).select(HEADER, iter(rows))
+    return [list(row) for row in rows]
+
+
+def database_rows(where, rows=ROWS):
+    connection = sqlite3.connect(":memory:")
+    connection.execute('CREATE TABLE "items" ("name" TEXT, "price" TEXT)')
+    connection.executemany('INSERT INTO "items" VALUES (?, ?)', rows)
+    _, query, parameters = LoadOptions(where=where).to_sql("items", HEADER)
+    return [list(row) for row in connection.execute(query, parameters)]
+
+
+def test_text_numbers_compare_as_numbers_in_sql():
+    assert database_rows("price > 10") == file_rows("price > 10") == [["acme", "12"], ["", "100"], ["dent", "10.5"]]
+
+
+def test_empty_cells_never_match_in_sql():
+    assert database_rows("name != acme") == file_rows("name != acme") == [["bolt", "9"], ["cog", ""], ["dent", "10.5"]]
+    assert database_rows("price < 10") == file_rows("price < 10") == [["bolt", "9"]]
+
+
+@pytest.mark.parametrize("where", [
+    "name < 5", "name >= 5", "name = 10.5", "name != 50", "name > 0", "name = 1",
+    "price < 10", "price >= 10", "price = 7", "price != 0", "price > -5", "price < x",
+])
+def test_mixed_cells_match_the_same_rows_in_sql_and_files(where):
+    assert database_rows(where, MIXED_ROWS) == file_rows(where, MIXED_ROWS)
+
+
+def test_non_numeric_text_does_not_match_numeric_conditions_in_sql():
+    assert database_rows("price < 10", MIXED_ROWS) == [["5", "9"], ["Zed", " 7 "], ["", "-2"], [" ", "FALSE"]]
+    assert database_rows("name < 5", MIXED_ROWS) == [["true", "1e3"], [" ", "FALSE"], ["-1", "10"]]
@@ -0,0 +1,59 @@
+import sqlite3
+from types import SimpleNamespace
+
+from table_builder.sql_console import SQLConsole
+
+
+class Messages:
+
+    def __init__(self):
+        self.errors = []
+
+    def create_error_message(self, message):
+        self.errors.append(message)
+
+    def create_information_message(self, message):
+        pass
+
+
+def test_warning_of_several_statements_is_reported(monkeypatch):
+    # Python 3.9 and 3.10 raise sqlite3.Warning for more than one statement at a time
+    builder = SimpleNamespace(database=SimpleNamespace(connection=sqlite3.connect(":memory:")), system_message=Messages())
+    console = SQLConsole(builder)
+
+    def several_statements(function, *args):
+        raise sqlite3.Warning("You can only execute one statement at a time.")
+    monkeypatch.setattr(console, "_run_cancellable", several_statements)
+
+    assert console.execute("select 1; select 2") is False
+    assert builder.system_message.errors == ["SQL error: You can only execute one statement at a time."]
+
+
+def test_statement_returning_rows_is_written_once_and_committed(tmp_path):
+    path = str(tmp_path / "items.db")
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE items (name TEXT)")
+    answers = iter(["import", "q"])
+    builder = SimpleNamespace(
+        database=SimpleNamespace(connection=connection),
+        system_message=Messages(),
+        console=SimpleNamespace(print=lambda *objects, **kwargs: None),
+        table_display=SimpleNamespace(build_page_table=lambda *args: None),
+        input_handler=SimpleNamespace(get_user_input=lambda prompt: next(answers)),
+    )
+    console = SQLConsole(builder)
+
+    assert console.execute("INSERT INTO items VALUES ('a') RETURNING name") is False
+    assert builder.system_message.errors[0].startswith("Only queries that read data can be imported.")
+    # Another connection sees the row, so it was committed, and sees it once
+    assert sqlite3.connect(path).execute("SELECT count(*) FROM items").fetchone() == (1,)
+
+
+def test_read_only_statements():
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE items (name TEXT)")
+    console = SQLConsole(SimpleNamespace(database=SimpleNamespace(connection=connection)))
+    assert console.is_read_only("SELECT * FROM items")
+    assert console.is_read_only("WITH names AS (SELECT name FROM items) SELECT * FROM names")
+    assert not console.is_read_only("INSERT INTO items VALUES ('a') RETURNING name")
+    assert not console.is_read_only("WITH new AS (SELECT 'a') INSERT INTO items SELECT * FROM new RETURNING name")
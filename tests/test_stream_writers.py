@@ -0,0 +1,22 @@
+import os
+
+import pytest
+
+from table_builder.io import stream_writers
+from table_builder.io.stream_writers import StreamWriter, XLSXStreamWriter
+
+
+def test_stream_writer_is_abstract():
+    with pytest.raises(TypeError):
+        StreamWriter("table.csv")
+
+
+def test_xlsx_rows_past_the_sheet_limit_are_refused(tmp_path, monkeypatch):
+    monkeypatch.setattr(stream_writers, "XLSX_MAX_ROWS", 4)
+    path = str(tmp_path / "table.xlsx")
+    with pytest.raises(ValueError, match="at most 4 rows"):
+        with XLSXStreamWriter(path) as writer:
+            writer.write_header(["id"])
+            writer.write_rows([[1], [2], [3]])
+            writer.write_rows([[4]])
+    assert not os.path.exists(path)
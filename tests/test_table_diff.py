@@ -0,0 +1,47 @@
+from datetime import date, datetime, time
+
+from openpyxl import Workbook
+
+from table_builder.table_diff import TableDiff, canonical
+
+
+def write_csv(path, text):
+    path.write_text(text)
+    return ("file", str(path))
+
+
+def test_numbers_with_equal_builtin_hashes_are_changes(tmp_path):
+    old = write_csv(tmp_path / "old.csv", "id,v\n1,-1\n2,1\n")
+    new = write_csv(tmp_path / "new.csv", "id,v\n1,-2\n2,2305843009213693952\n")
+    result = TableDiff(None).compare(old, new, ["id"])
+    assert not result.is_identical()
+    assert result.changed == 2
+
+
+def test_boolean_is_not_the_number_one(tmp_path):
+    old = write_csv(tmp_path / "old.csv", "id,v\n1,1\n")
+    new = write_csv(tmp_path / "new.csv", "id,v\n1,true\n")
+    result = TableDiff(None).compare(old, new, ["id"])
+    assert result.changed == 1
+    assert [change[2:] for change in result.cell_changes()] == [("1", "true")]
+
+
+def test_same_values_written_differently_are_equal(tmp_path):
+    old = write_csv(tmp_path / "old.csv", "id,n,b,e\n1,7,TRUE,\n")
+    new = write_csv(tmp_path / "new.csv", "id,n,b,e\n1,7.0,true, \n")
+    assert TableDiff(None).compare(old, new, ["id"]).is_identical()
+    assert canonical(7.0) == canonical("7") and canonical(True) != canonical(1)
+
+
+def test_date_cells_compare_with_their_iso_text(tmp_path):
+    workbook = Workbook()
+    workbook.active.append(["id", "day", "at"])
+    workbook.active.append([1, datetime(2024, 5, 1, 9, 30), time(9, 30)])
+    workbook.save(tmp_path / "dates.xlsx")
+    spreadsheet = ("file", str(tmp_path / "dates.xlsx"))
+    # SQLite tables hold dates as ISO text, and CSV files as the text str() gives
+    text = write_csv(tmp_path / "dates.csv", "id,day,at\n1,2024-05-01 09:30:00,09:30:00\n")
+
+    assert TableDiff(None).compare(spreadsheet, spreadsheet, ["id"]).is_identical()
+    assert TableDiff(None).compare(spreadsheet, text, ["id"]).is_identical()
+    assert canonical(date(2024, 5, 1)) == canonical("2024-05-01") != canonical(datetime(2024, 5, 1))
@@ -0,0 +1,22 @@
+from types import SimpleNamespace
+
+from table_builder.table_search import TableSearch
+
+
+def test_edits_do_not_grow_postings():
+    rows = [{"name": f"alpha {idx}", "note": "acme"} for idx in range(50)]
+    builder = SimpleNamespace(table_data={"columns": [{"name": "name", "type": "str"}, {"name": "note", "type": "str"}], "rows": rows})
+    search = TableSearch(builder)
+    search.build()
+
+    for step in range(500):
+        row_index = step % len(rows)
+        old_value = rows[row_index]["name"]
+        rows[row_index]["name"] = f"beta {step}" if step % 2 else "acme"
+        search.cell_changed(row_index, "name", old_value, rows[row_index]["name"])
+
+    edited = {trigram: sorted(ids) for trigram, ids in search.postings.items()}
+    search.build()
+    assert edited == {trigram: sorted(ids) for trigram, ids in search.postings.items()}
+    assert search.search("alpha") == []
+    assert len(search.search("acme")) == 75
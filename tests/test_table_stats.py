@@ -0,0 +1,20 @@
+from types import SimpleNamespace
+
+from table_builder.table_encoding import TableEncoding
+from table_builder.table_stats import TableStats
+
+
+def make_builder(rows):
+    builder = SimpleNamespace(table_data={"columns": [{"name": "region", "type": "str"}], "rows": rows})
+    builder.table_encoding = TableEncoding(builder)
+    builder.table_encoding.encode_columns()
+    return builder
+
+
+def test_summary_counts_dictionary_column():
+    builder = make_builder([{"region": "north"}, {"region": "south"}, {"region": "north"}, {"region": None}])
+    assert builder.table_encoding.value_counts("region") == {"north": 2, "south": 1, None: 1}
+
+    summary = TableStats(builder).summary("region")
+    assert (summary.count, summary.nulls, summary.distinct) == (3, 1, 2)
+    assert summary.top_values()[0] == ("north", 2)